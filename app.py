@@ -3,8 +3,10 @@ Streamlit Main App - 원본 코드와 동일한 단순한 차트 화면 (탭 없
 """
 import streamlit.components.v1 as components
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import sys
 import os
+import time
 import logging
 from typing import Dict, Any, Optional
 
@@ -25,10 +27,17 @@ st.set_page_config(
     }
 )
 
-# 컴포넌트 import
+# 컴포넌트 import - 1단계에 필요한 모듈만 즉시 로드
+# (차트/비교/백테스트/통계 모듈은 pandas·plotly를 쓰므로 단계별 함수에서 import)
+_import_start = time.perf_counter()
 from components.stock_selector import render_simple_stock_selector
 from utils.json_client import InvestSmartJSONClient
-from components.chart import render_stock_chart
+from components.data_access import get_json_client as get_session_json_client
+from utils.startup import get_startup_report, record_timing, start_warm_up
+from utils.session_budget import enforce_session_budget, session_footprint
+from utils.memory_profiler import record_session, start_memory_sampler
+from utils.disk_cache import get_disk_cache
+record_timing("app imports", (time.perf_counter() - _import_start) * 1000)
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -82,14 +91,14 @@ def render_disclaimer():
         show_disclaimer_dialog()
 
 def get_json_client() -> InvestSmartJSONClient:
-    """JSON 클라이언트 인스턴스 반환"""
-    if 'json_client' not in st.session_state:
-        # data 폴더 경로 설정 (프론트엔드 기준)
-        # investsmart_web/frontend -> data
-        data_dir = os.path.join(current_dir, "data")
-        data_dir = os.path.abspath(data_dir)
-        st.session_state.json_client = InvestSmartJSONClient(data_dir)
-    return st.session_state.json_client
+    """JSON 클라이언트 인스턴스 반환 (컴포넌트와 같은 프로세스 공용 클라이언트)"""
+    return get_session_json_client()
+
+
+def get_session_id() -> str:
+    """현재 Streamlit 세션 ID (스크립트 실행 컨텍스트가 없으면 'local')"""
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "local"
 
 
 def test_json_connection() -> bool:
@@ -118,8 +127,10 @@ def show_cache_stats():
     try:
         client = get_json_client()
         stats = client.get_cache_stats()
+        disk_cache = get_disk_cache()
         
-        if stats['total_requests'] > 0:
+        # 디스크 캐시에서 차트를 바로 가져오면 클라이언트 요청이 없을 수 있음
+        if stats['total_requests'] > 0 or (disk_cache is not None and disk_cache.stats['hits'] > 0):
             with st.expander("📊 성능 통계 (개발자 모드)", expanded=False):
                 col1, col2, col3, col4 = st.columns(4)
                 
@@ -132,7 +143,27 @@ def show_cache_stats():
                 with col4:
                     st.metric("히트율", f"{stats['hit_rate']}%")
                 
-                st.caption(f"캐시된 종목: {stats['cached_symbols']}개 | 처리된 캐시: {stats['processed_cache_size']}개")
+                st.caption(f"캐시된 종목: {stats['cached_symbols']}개 | 처리된 캐시: {stats['processed_cache_size']}개 (전체 세션 공용)")
+                
+                # 영구 디스크 캐시 (재시작 후에도 유지되는 컬럼/리샘플링/Figure)
+                if disk_cache is not None:
+                    st.caption(f"디스크 캐시: 히트 {disk_cache.stats['hits']} | 미스 {disk_cache.stats['misses']} | "
+                               f"저장 {disk_cache.stats['writes']} | 정리 {disk_cache.stats['evicted']} ({disk_cache.root})")
+                
+                # 이 세션의 상태 크기 (데이터는 공용 저장소에 있고 세션에는 키만 저장)
+                footprint = session_footprint(st.session_state)
+                st.caption(f"세션 상태: {footprint['keys']}개 키, {footprint['bytes']:,} bytes | 최대: "
+                           + ", ".join(f"{key} {size:,}B" for key, size in footprint['largest'][:3]))
+                
+                # 시작 단계 소요 시간 (import/미리 로드)
+                startup = get_startup_report()
+                if startup['timings']:
+                    st.caption("시작 시간: " + " | ".join(f"{name} {ms}ms" for name, ms in startup['timings'].items()))
+                
+                # 메모리 계측 (켰을 때만 캐시 크기 측정)
+                if st.checkbox("🧠 메모리 보고서", key="memory_panel"):
+                    from components.memory_panel import render_memory_panel
+                    render_memory_panel(client)
                 
                 col_btn1, col_btn2 = st.columns(2)
                 with col_btn1:
@@ -144,7 +175,7 @@ def show_cache_stats():
                     if st.button("📦 JSON 압축", type="primary"):
                         with st.spinner("JSON 파일 압축 중..."):
                             compression_result = client.compress_json_files()
-                            st.success(f"압축 완료: {compression_result['compressed_files']}개 파일, {compression_result['total_savings_mb']}MB 절약")
+                            st.success(f"압축 완료: {compression_result['compressed_files']}개 파일, {compression_result['total_savings_mb']}MB ({compression_result['average_savings_percent']}%) 절약")
                         st.rerun()
     except Exception as e:
         logger.error(f"캐시 통계 표시 실패: {e}")
@@ -174,6 +205,9 @@ def main():
         render_step2_indicator_selection()
     elif st.session_state.step == 3:
         render_step3_chart_display()
+    elif st.session_state.step == "compare":
+        from components.comparison import render_comparison_view
+        render_comparison_view()
     
     # 하단 면책 문구 (항상 표시)
     st.markdown("---")
@@ -186,6 +220,14 @@ def main():
     
     # 캐시 통계 표시 (개발자 모드)
     show_cache_stats()
+    
+    # 세션에는 작은 값만 남김 (데이터/객체/큰 값 제거) 및 메모리 계측용 세션 크기 기록
+    enforce_session_budget(st.session_state)
+    record_session(get_session_id(), session_footprint(st.session_state))
+    start_memory_sampler(get_json_client())
+    
+    # 첫 화면을 그린 뒤 차트/데이터 라이브러리를 백그라운드로 미리 로드
+    start_warm_up()
 
 
 def render_step1_symbol_selection():
@@ -196,6 +238,11 @@ def render_step1_symbol_selection():
     # 종목 선택
     symbol = render_simple_stock_selector()
 
+    # 여러 종목 비교 모드
+    if st.button("📊 Compare multiple stocks", use_container_width=True):
+        st.session_state.step = "compare"
+        st.rerun()
+
 
 
 
@@ -211,25 +258,39 @@ def render_step2_indicator_selection():
     
     st.info(f"Selected Stock: **{st.session_state.selected_symbol}**")
     
+    from components.chart import prefetch_chart_views
+    from utils.signal_stats import get_symbol_stats, get_universe_stats
+    
+    # 3단계 차트(일/주/월봉)를 백그라운드로 미리 생성 - 그룹을 고르는 동안 준비
+    prefetch_chart_views(st.session_state.selected_symbol, "3y")
+    
     # 지표 그룹 선택
     indicator_groups = {
         "Long-term Analysis (Monthly)": {
             "description": "Long-term investment indicators",
             "signals": ["long_signal", "combined_signal_v1"],
-            "color": "#4169E1"
+            "color": "#4169E1",
+            "horizon": 60  # 성과 통계 기간 (일봉 수)
         },
         "Mid-term Analysis (Weekly)": {
             "description": "Mid-term investment indicators", 
             "signals": ["short_signal_v1", "momentum_color_signal"],
-            "color": "#32CD32"
+            "color": "#32CD32",
+            "horizon": 20
         },
         "Short-term Analysis (Daily)": {
             "description": "Short-term trading indicators",
             "signals": ["short_signal_v2", "macd_signal"],
-            "color": "#00FFFF"
+            "color": "#00FFFF",
+            "horizon": 5
         }
     }
     
+    # 과거 시그널 성과 통계 (데이터 버전별 캐시 - 요청마다 재계산하지 않음)
+    with st.spinner("Loading signal statistics..."):
+        symbol_stats = get_symbol_stats(get_json_client(), st.session_state.selected_symbol)
+        universe_stats = get_universe_stats(get_json_client().data_dir)
+    
     # 지표 그룹 선택 버튼들
     cols = st.columns(3)
     for i, (group_name, group_info) in enumerate(indicator_groups.items()):
@@ -262,7 +323,7 @@ def render_step2_indicator_selection():
                     if group_name == "Long-term Analysis (Monthly)":
                         st.markdown("### 🔴 Long-term")
                         st.markdown("**Investment Period:** ██████ (few years)")
-                        st.markdown("**Success Rate:** █████░")
+                        render_signal_stats(group_info, symbol_stats, universe_stats)
                         st.markdown("""
                         **Analysis:** macro trends  
                         **Purpose:** Value investing and portfolio strategy development  
@@ -271,7 +332,7 @@ def render_step2_indicator_selection():
                     elif group_name == "Mid-term Analysis (Weekly)":
                         st.markdown("### 🟡 Mid-term")
                         st.markdown("**Investment Period:** ████░░ (few months)")
-                        st.markdown("**Success Rate:** █████░")
+                        render_signal_stats(group_info, symbol_stats, universe_stats)
                         st.markdown("""
                         **Analysis:** Trend Analysis  
                         **Purpose:** Trend confirmation and mid-term investment direction  
@@ -280,7 +341,7 @@ def render_step2_indicator_selection():
                     elif group_name == "Short-term Analysis (Daily)":
                         st.markdown("### 🔵 Short-term")
                         st.markdown("**Investment Period:** ██░░░░ (few weeks)")
-                        st.markdown("**Success Rate:** ████░░")
+                        render_signal_stats(group_info, symbol_stats, universe_stats)
                         st.markdown("""
                         **Analysis:** precise timing  
                         **Purpose:** Quick volatility capture and short-term trading timing  
@@ -288,25 +349,109 @@ def render_step2_indicator_selection():
                         """)
 
 
+def _pooled_hit_rate(stats: Optional[Dict[str, Any]], signals: list, horizon: int):
+    """그룹 시그널들의 적중률을 발생 횟수 가중 평균으로 합산 - (적중률, 횟수)"""
+    if not stats:
+        return None, 0
+    hits = 0.0
+    count = 0
+    for signal_name in signals:
+        row = stats.get(signal_name, {}).get(horizon)
+        if row and row['count']:
+            hits += row['hit_rate'] * row['count']
+            count += row['count']
+    return (hits / count if count else None), count
+
+
+def render_signal_stats(group_info: Dict[str, Any], symbol_stats: Optional[Dict[str, Any]],
+                        universe_stats: Optional[Dict[str, Any]]):
+    """그룹 카드의 성공률 막대 및 시그널별 과거 성과 표"""
+    horizon = group_info['horizon']
+    hit_rate, count = _pooled_hit_rate(symbol_stats, group_info['signals'], horizon)
+    if hit_rate is None or count < 5:
+        # 종목 자체 시그널이 5회 미만이면 전체 종목 통계로 대체
+        hit_rate, count = _pooled_hit_rate(universe_stats and universe_stats['stats'], group_info['signals'], horizon)
+        source = "all stocks"
+    else:
+        source = "this stock"
+    
+    if hit_rate is None:
+        st.markdown("**Success Rate:** ░░░░░░ (no signals yet)")
+        return
+    
+    filled = int(round(hit_rate * 6))
+    st.markdown(f"**Success Rate:** {'█' * filled}{'░' * (6 - filled)} "
+                f"{hit_rate:.0%} ({horizon}-day, {count} signals, {source})")
+    
+    rows = []
+    for signal_name in group_info['signals']:
+        for label, stats in (("This stock", symbol_stats), ("All stocks", universe_stats and universe_stats['stats'])):
+            row = (stats or {}).get(signal_name, {}).get(horizon)
+            if not row or not row['count']:
+                continue
+            rows.append({
+                "Signal": signal_name,
+                "Scope": label,
+                "Signals": row['count'],
+                "Hit rate": f"{row['hit_rate']:.0%}",
+                "Mean": f"{row['mean_return']:+.1%}",
+                "Median": f"{row['median_return']:+.1%}",
+                "Avg. max drawdown": f"{row['mae_mean']:.1%}"
+            })
+    if rows:
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+        st.caption(f"Return {horizon} trading days after each buy signal. Past performance does not guarantee future returns.")
+
+
 def render_step3_chart_display():
     """3단계: 차트만 표시"""
+    from components.chart import render_stock_chart
+    from components.backtest_panel import render_backtest_panel
+    
     # 이전 단계로 돌아가기 버튼만 표시
     if st.button("← Previous Step"):
         st.session_state.step = 2
         st.rerun()
 
+    # 기술적 지표 선택 (OHLCV에서 즉석 계산하여 차트에 겹쳐 표시)
+    from utils.indicators import INDICATOR_PRESETS
+    selected_indicators = st.multiselect(
+        "📐 Technical Indicators",
+        options=list(INDICATOR_PRESETS),
+        format_func=lambda preset: INDICATOR_PRESETS[preset]['label'],
+        key="selected_indicators",
+        placeholder="SMA, EMA, Bollinger, RSI, MACD, ATR"
+    )
+
+    # 이전 데이터 스냅샷과 비교 (data/<스냅샷> 대비 생기거나 사라진 시그널 표시)
+    from utils.snapshot_diff import list_snapshots
+    snapshots = list_snapshots(get_json_client().data_dir)
+    compare_snapshot = None
+    if snapshots:
+        compare_snapshot = st.selectbox(
+            "🗂 Compare with snapshot",
+            options=[None] + snapshots,
+            format_func=lambda snapshot: "Off" if snapshot is None else snapshot,
+            key="compare_snapshot"
+        )
+
     # 차트 표시 설정
     settings = {
         'selected_signals': st.session_state.selected_signals,
         'show_buy_signals': True,
         'show_sell_signals': True,
         'show_trendlines': True,
-        'selected_indicators': [],
+        'selected_indicators': list(selected_indicators),
         'selected_indicator_group': st.session_state.selected_indicator_group
     }
+    if compare_snapshot:
+        settings['compare_snapshot'] = compare_snapshot
 
     # 차트 렌더링 (3년 기본 기간) - 로딩 중에만 가이드 표시
     render_stock_chart(st.session_state.selected_symbol, "3y", settings)
 
+    # 시그널 규칙 백테스트 (자산 곡선)
+    render_backtest_panel(st.session_state.selected_symbol, st.session_state.selected_signals)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,309 @@
+"""
+데이터/차트 핫패스 벤치마크 - Streamlit 서버 없이 data/ 파일로 실행
+
+로드 케이스는 캐시 상태별로 나눠 측정합니다. 실행 중에는 디스크 캐시를 임시 폴더로 돌리므로
+이전 실행이나 앱이 남긴 캐시는 결과에 영향을 주지 않습니다 (OS 페이지 캐시는 제외 불가).
+
+    columns_cold     원본 파일 파싱 (청크·디스크 캐시 없음 - 원본 파일만 연결한 임시 폴더 사용)
+    columns_chunked  연도별 청크 로드 (utils.chunk_store로 청크를 만든 종목만)
+    columns_warm     메모리 캐시 히트
+
+세 케이스 모두 client.get_columns(전체 기간 컬럼)를 측정합니다. 이전 기준선의 load_cold/
+load_warm은 행 JSON 로드(_load_symbol_data)를 측정했으므로 이름을 바꿔 서로 비교하지 않습니다.
+
+사용법:
+    python benchmarks/bench_hot_paths.py                  # 전체 종목 측정 + 기준선 비교
+    python benchmarks/bench_hot_paths.py --symbols AAPL ^KS11 --repeat 5
+    python benchmarks/bench_hot_paths.py --update-baseline  # 현재 결과를 기준선으로 저장
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import pandas as pd
+import plotly
+
+from utils.chunk_store import read_chunk_index
+from utils.disk_cache import CACHE_DIR_ENV, get_disk_cache, reset_disk_cache
+from utils.json_client import InvestSmartJSONClient, wait_disk_fills
+from utils.chart_core import (
+    DEFAULT_DISPLAY_FLAGS,
+    DEFAULT_PERIOD,
+    build_candlestick_figure,
+    compute_signal_markers,
+    default_chart_settings,
+    resample_data_to_timeframe,
+)
+
+DEFAULT_DATA_DIR = os.path.join(parent_dir, "data")
+DEFAULT_OUTPUT = os.path.join(current_dir, "results", "latest.json")
+DEFAULT_BASELINE = os.path.join(current_dir, "baseline.json")
+
+logger = logging.getLogger(__name__)
+
+
+def _time_call(func: Callable[[], Any], repeat: int, setup: Optional[Callable[[], None]] = None) -> float:
+    """func를 repeat회 실행하여 중앙값(ms) 반환 - setup은 매 실행 전 호출 (측정 제외)"""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _chart_inputs(signals_data: Dict[str, Any]):
+    """build_candlestick_figure와 동일한 방식으로 마커 계산 입력 준비"""
+    dates = pd.to_datetime(signals_data["dates"])
+    stock_data = signals_data["data"]
+    min_length = min(len(dates), len(stock_data["open"]), len(stock_data["high"]),
+                     len(stock_data["low"]), len(stock_data["close"]))
+    return dates[:min_length], stock_data["low"][:min_length], min_length
+
+
+def _clear_all_caches(client: InvestSmartJSONClient):
+    """클라이언트 메모리 캐시와 (임시) 디스크 캐시 비우기"""
+    client.clear_cache()
+    cache = get_disk_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def _source_only_dir(data_dir: str, target_dir: str) -> str:
+    """원본 데이터 파일만 링크한 폴더 (청크 폴더 제외 - 콜드 로드 측정용)"""
+    os.makedirs(target_dir, exist_ok=True)
+    for name in os.listdir(data_dir):
+        path = os.path.join(data_dir, name)
+        if name.startswith("signals_") and os.path.isfile(path):
+            os.symlink(os.path.abspath(path), os.path.join(target_dir, name))
+    return target_dir
+
+
+def bench_symbol(client: InvestSmartJSONClient, source_client: InvestSmartJSONClient, symbol: str,
+                 repeat: int) -> Dict[str, float]:
+    """한 종목에 대한 모든 핫패스 측정 결과 (케이스명 → 중앙값 ms)"""
+    results = {}
+
+    # 1) 데이터 로드 (콜드: 원본 파싱 / 청크: 연도별 청크 / 웜: 메모리 캐시 히트)
+    results["columns_cold"] = _time_call(lambda: source_client.get_columns(symbol), repeat,
+                                      setup=lambda: _clear_all_caches(source_client))
+    source_client.clear_cache()
+    if read_chunk_index(client.data_dir, symbol, client.get_data_version(symbol)) is not None:
+        results["columns_chunked"] = _time_call(lambda: client.get_columns(symbol), repeat,
+                                             setup=lambda: _clear_all_caches(client))
+    results["columns_warm"] = _time_call(lambda: client.get_columns(symbol), repeat)
+
+    # 2) 신호 데이터 구조화 (원본 캐시는 웜, 처리된 캐시는 비움)
+    results["signals_data"] = _time_call(
+        lambda: client.get_signals_data(symbol, DEFAULT_PERIOD), repeat,
+        setup=client._processed_cache.clear
+    )
+    daily = client.get_signals_data(symbol, DEFAULT_PERIOD)
+    if daily.get("error") or not daily.get("dates"):
+        raise ValueError(daily.get("error", "빈 데이터"))
+
+    # 3) 시간축 리샘플링
+    views = {"daily": daily}
+    for timeframe in ("weekly", "monthly"):
+        results[f"resample_{timeframe}"] = _time_call(lambda: resample_data_to_timeframe(daily, timeframe), repeat)
+        views[timeframe] = resample_data_to_timeframe(daily, timeframe)
+
+    # 4) 마커 계산 및 Figure 생성 (앱 기본 설정)
+    for timeframe, view in views.items():
+        settings = default_chart_settings(timeframe)
+        dates, low_prices, min_length = _chart_inputs(view)
+        results[f"markers_{timeframe}"] = _time_call(
+            lambda: compute_signal_markers(view, settings, dates, low_prices, min_length, DEFAULT_DISPLAY_FLAGS), repeat
+        )
+        results[f"figure_{timeframe}"] = _time_call(
+            lambda: build_candlestick_figure(view, settings, DEFAULT_DISPLAY_FLAGS), repeat
+        )
+
+    return results
+
+
+def run_benchmarks(data_dir: str, symbols: Optional[List[str]], repeat: int) -> Dict[str, Any]:
+    """전체 벤치마크 실행 후 결과 딕셔너리 반환"""
+    previous_cache_dir = os.environ.get(CACHE_DIR_ENV)
+    with tempfile.TemporaryDirectory(prefix="investsmart-bench-") as work_dir:
+        # 실행 중에만 디스크 캐시를 빈 임시 폴더로 돌리고, 끝나면 환경 변수와 공용 캐시를 원래대로
+        os.environ[CACHE_DIR_ENV] = os.path.join(work_dir, "cache")
+        reset_disk_cache()
+        try:
+            client = InvestSmartJSONClient(data_dir)
+            source_client = InvestSmartJSONClient(_source_only_dir(data_dir, os.path.join(work_dir, "source")))
+            return _run_symbols(client, source_client, symbols, repeat)
+        finally:
+            wait_disk_fills()  # 임시 폴더 삭제 전에 백그라운드 캐시 쓰기 완료
+            if previous_cache_dir is None:
+                os.environ.pop(CACHE_DIR_ENV, None)
+            else:
+                os.environ[CACHE_DIR_ENV] = previous_cache_dir
+            reset_disk_cache()
+
+
+def _run_symbols(client: InvestSmartJSONClient, source_client: InvestSmartJSONClient,
+                 symbols: Optional[List[str]], repeat: int) -> Dict[str, Any]:
+    if not symbols:
+        # .json과 .json.gz가 함께 있는 종목은 중복으로 나열되므로 제거
+        symbols = sorted(set(client.get_available_symbols()))
+
+    cases: Dict[str, Dict[str, Any]] = {}
+    failed = {}
+    total_start = time.perf_counter()
+    for idx, symbol in enumerate(symbols, 1):
+        try:
+            symbol_results = bench_symbol(client, source_client, symbol, repeat)
+        except Exception as e:
+            failed[symbol] = str(e)
+            logger.error(f"벤치마크 실패: {symbol}, {e}")
+            continue
+        for case, value in symbol_results.items():
+            cases.setdefault(case, {"symbols": {}})["symbols"][symbol] = round(value, 3)
+        print(f"[{idx}/{len(symbols)}] {symbol}", file=sys.stderr)
+
+    for case_result in cases.values():
+        values = list(case_result["symbols"].values())
+        case_result["total_ms"] = round(sum(values), 3)
+        case_result["median_ms"] = round(statistics.median(values), 3)
+        case_result["max_ms"] = round(max(values), 3)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "plotly": plotly.__version__,
+            "repeat": repeat,
+            "period": DEFAULT_PERIOD,
+            "symbol_count": len(symbols) - len(failed),
+            "wall_time_s": round(time.perf_counter() - total_start, 2),
+        },
+        "cases": cases,
+        "failed": failed,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """현재 git 커밋 해시 (git이 없으면 None)"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=parent_dir, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def compare_with_baseline(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    케이스별 총 소요시간을 기준선과 비교
+    
+    Args:
+        results: 현재 측정 결과
+        baseline: 저장된 기준선 결과
+        tolerance: 허용 오차 비율 (0.2 = 20% 느려지면 회귀)
+    
+    Returns:
+        케이스별 비교 결과 리스트
+    """
+    comparison = []
+    for case, case_result in results["cases"].items():
+        base_case = baseline.get("cases", {}).get(case)
+        if not base_case:
+            comparison.append({"case": case, "current_ms": case_result["total_ms"], "baseline_ms": None,
+                               "ratio": None, "status": "new"})
+            continue
+
+        # 두 결과에 공통으로 존재하는 종목만 비교 (종목 추가/삭제 영향 제거)
+        common = set(case_result["symbols"]) & set(base_case["symbols"])
+        current_ms = sum(case_result["symbols"][s] for s in common)
+        baseline_ms = sum(base_case["symbols"][s] for s in common)
+        ratio = current_ms / baseline_ms if baseline_ms > 0 else None
+
+        if ratio is None:
+            status = "n/a"
+        elif ratio > 1 + tolerance:
+            status = "regression"
+        elif ratio < 1 - tolerance:
+            status = "improved"
+        else:
+            status = "ok"
+        comparison.append({"case": case, "current_ms": round(current_ms, 3), "baseline_ms": round(baseline_ms, 3),
+                           "ratio": round(ratio, 3) if ratio else None, "status": status})
+    return comparison
+
+
+def _print_comparison(comparison: List[Dict[str, Any]]):
+    """비교 결과를 표 형태로 출력"""
+    print(f"{'case':<20} {'current_ms':>12} {'baseline_ms':>12} {'ratio':>8}  status")
+    for row in comparison:
+        baseline_ms = f"{row['baseline_ms']:.1f}" if row["baseline_ms"] is not None else "-"
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        print(f"{row['case']:<20} {row['current_ms']:>12.1f} {baseline_ms:>12} {ratio:>8}  {row['status']}")
+
+
+def _write_json(path: str, payload: Dict[str, Any]):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 데이터/차트 핫패스 벤치마크")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="신호 데이터 폴더")
+    parser.add_argument("--symbols", nargs="*", help="측정할 종목 (기본: 전체)")
+    parser.add_argument("--repeat", type=int, default=3, help="케이스별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준선 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀 판정 허용 오차 비율")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 결과를 기준선으로 저장")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀 발견 시 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.data_dir, args.symbols, max(1, args.repeat))
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        results["comparison"] = compare_with_baseline(results, baseline, args.tolerance)
+
+    _write_json(args.output, results)
+    print(f"결과 저장: {args.output} ({results['meta']['symbol_count']}개 종목, {results['meta']['wall_time_s']}s)")
+
+    if args.update_baseline:
+        _write_json(args.baseline, results)
+        print(f"기준선 갱신: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print("기준선 없음 - --update-baseline으로 생성하세요.")
+        return 0
+
+    _print_comparison(results["comparison"])
+    regressions = [row for row in results["comparison"] if row["status"] == "regression"]
+    if regressions and args.fail_on_regression:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
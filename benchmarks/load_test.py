@@ -0,0 +1,527 @@
+"""
+부하 테스트 - 동시 사용자가 단계별 화면(종목 선택 → 그룹 선택 → 차트 → 시그널 토글)을
+반복할 때의 처리량, 지연 시간 백분위, 세션당 메모리 측정
+
+두 가지 모드:
+- core: Streamlit 없이 각 단계에서 앱이 호출하는 함수(카탈로그, 차트 미리 생성, 통계,
+  차트 작업, Figure 직렬화)를 스레드별 가상 사용자로 실행 - 코드 변경 전후 비교용
+- server: 로컬 Streamlit 서버를 띄우고(또는 --url로 실행 중인 서버에 연결) 브라우저와
+  같은 웹소켓 프로토콜로 버튼 클릭을 보내 스크립트 실행 완료까지의 시간을 측정 - 용량 계획용
+
+종목 인기도는 카탈로그 순서를 순위로 하는 Zipf 분포(기본 s=1.1) 또는 균등 분포입니다.
+
+server 모드는 websockets>=14가 필요합니다 (pip install -r requirements-dev.txt).
+
+사용법:
+    python benchmarks/load_test.py --mode core --users 16 --iterations 5
+    python benchmarks/load_test.py --mode server --users 8 --iterations 3
+    python benchmarks/load_test.py --mode server --url ws://localhost:8501 --server-pid 1234 --users 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from components.stock_data import STOCK_CATEGORIES
+from utils.catalog import get_catalog
+
+DEFAULT_DATA_DIR = os.path.join(parent_dir, "data")
+DEFAULT_OUTPUT = os.path.join(current_dir, "results", "load_test.json")
+APP_PATH = os.path.join(parent_dir, "app.py")
+
+# 2단계 그룹 버튼 키 (app.py render_step2_indicator_selection)
+GROUP_NAMES = ("Long-term Analysis (Monthly)", "Mid-term Analysis (Weekly)", "Short-term Analysis (Daily)")
+STEPS = ("select", "chart", "toggle", "back")
+DEFAULT_PERIOD = "3y"  # app.py 3단계 기본 기간
+
+
+def symbol_sampler(symbols: List[str], popularity: str, zipf_s: float, seed: int) -> Callable[[], str]:
+    """인기도 분포에 따라 종목을 뽑는 함수 (앞 순위일수록 자주 선택)"""
+    rng = random.Random(seed)
+    if popularity == "uniform":
+        return lambda: rng.choice(symbols)
+    weights = [1.0 / (rank ** zipf_s) for rank in range(1, len(symbols) + 1)]
+    return lambda: rng.choices(symbols, weights=weights)[0]
+
+
+def percentile(values: List[float], q: float) -> float:
+    """nearest-rank 백분위"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def rss_bytes(pid: int) -> Optional[int]:
+    """프로세스 RSS (Linux /proc)"""
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class RssMonitor:
+    """측정 중 RSS 최댓값 기록 (0.2초 간격)"""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.baseline = rss_bytes(pid)
+        self.peak = self.baseline
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-monitor", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(0.2):
+            value = rss_bytes(self.pid)
+            if value is not None and (self.peak is None or value > self.peak):
+                self.peak = value
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.end = rss_bytes(self.pid)
+
+
+# ---------------------------------------------------------------------------
+# core 모드 - 앱의 단계별 호출을 Streamlit 없이 실행
+# ---------------------------------------------------------------------------
+
+def _core_flow(client, symbol: str, group_name: str, toggle_off: bool) -> Dict[str, float]:
+    """가상 사용자 한 번의 흐름 (단계명 → ms)"""
+    import plotly.io as pio
+    from utils.chart_core import DEFAULT_DISPLAY_FLAGS, TIMEFRAME_GROUPS, default_chart_settings, resolve_timeframe
+    from utils.chart_jobs import submit_chart
+    from utils.prerender import get_prerendered_chart
+    from utils.signal_stats import get_symbol_stats, get_universe_stats
+
+    timings = {}
+
+    # 1 → 2단계: 카탈로그 + 3단계 차트 미리 생성 + 시그널 통계
+    start = time.perf_counter()
+    get_catalog(client.data_dir, STOCK_CATEGORIES)
+    for timeframe in TIMEFRAME_GROUPS:
+        settings = default_chart_settings(timeframe)
+        if not get_prerendered_chart(client, symbol, timeframe, DEFAULT_PERIOD):
+            submit_chart(client, symbol, DEFAULT_PERIOD, settings, DEFAULT_DISPLAY_FLAGS)
+    get_symbol_stats(client, symbol)
+    get_universe_stats(client.data_dir)
+    timings["select"] = (time.perf_counter() - start) * 1000
+
+    # 2 → 3단계: 기본 차트 (사전 렌더링이 있으면 파일, 없으면 차트 작업) + 전송용 직렬화
+    settings = default_chart_settings(resolve_timeframe({'selected_indicator_group': group_name}))
+    timeframe = resolve_timeframe(settings)
+    start = time.perf_counter()
+    prerendered = get_prerendered_chart(client, symbol, timeframe, DEFAULT_PERIOD)
+    if prerendered and 'json' in prerendered:
+        with open(prerendered['json'], 'r', encoding='utf-8') as f:
+            fig = pio.from_json(f.read())
+    else:
+        fig = submit_chart(client, symbol, DEFAULT_PERIOD, settings, DEFAULT_DISPLAY_FLAGS).result()['figure']
+    if fig is not None:
+        pio.to_json(fig, validate=False)
+    timings["chart"] = (time.perf_counter() - start) * 1000
+
+    # 시그널 토글: Local Dip 표시를 바꾼 차트 (사전 렌더링 없음)
+    display_flags = dict(DEFAULT_DISPLAY_FLAGS, show_local_dip=not toggle_off)
+    start = time.perf_counter()
+    fig = submit_chart(client, symbol, DEFAULT_PERIOD, settings, display_flags).result()['figure']
+    if fig is not None:
+        pio.to_json(fig, validate=False)
+    timings["toggle"] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def run_core(data_dir: str, users: int, iterations: int, duration: Optional[float], popularity: str,
+             zipf_s: float, think_ms: float, seed: int) -> Dict[str, Any]:
+    """스레드별 가상 사용자로 core 흐름 실행"""
+    from utils.json_client import get_shared_client
+
+    client = get_shared_client(data_dir)
+    symbols = _catalog_symbols(data_dir)
+
+    # 모듈 import/첫 Figure 비용은 측정에서 제외
+    _core_flow(client, symbols[0], GROUP_NAMES[0], True)
+
+    samples: Dict[str, List[float]] = {step: [] for step in STEPS}
+    errors: List[str] = []
+    flows = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration if duration else None
+
+    def user(index: int):
+        pick = symbol_sampler(symbols, popularity, zipf_s, seed + index)
+        rng = random.Random(seed * 1000 + index)
+        for iteration in range(iterations):
+            if deadline and time.perf_counter() > deadline:
+                break
+            try:
+                timings = _core_flow(client, pick(), rng.choice(GROUP_NAMES), iteration % 2 == 0)
+            except Exception as e:
+                with lock:
+                    errors.append(f"user {index}: {e}")
+                continue
+            with lock:
+                for step, value in timings.items():
+                    samples[step].append(value)
+                flows[0] += 1
+            if think_ms:
+                time.sleep(think_ms / 1000)
+
+    with RssMonitor(os.getpid()) as monitor:
+        start = time.perf_counter()
+        threads = [threading.Thread(target=user, args=(i,), name=f"user-{i}") for i in range(users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+    return _summarize("core", users, samples, flows[0], elapsed, errors, monitor)
+
+
+# ---------------------------------------------------------------------------
+# server 모드 - Streamlit 웹소켓 프로토콜로 실제 서버 구동
+# ---------------------------------------------------------------------------
+
+# server 모드 웹소켓 클라이언트 최소 버전 (connect의 additional_headers 인자)
+WEBSOCKETS_MIN_VERSION = 14
+
+
+def _require_websockets():
+    """websockets(>=14) 모듈 - 없거나 오래되었으면 설치 안내와 함께 RuntimeError"""
+    try:
+        import websockets
+    except ImportError:
+        raise RuntimeError(f"server 모드에는 websockets>={WEBSOCKETS_MIN_VERSION}가 필요합니다: "
+                           f"pip install -r requirements-dev.txt")
+    major = int(websockets.__version__.split('.')[0])
+    if major < WEBSOCKETS_MIN_VERSION:
+        raise RuntimeError(f"websockets {websockets.__version__}는 지원하지 않습니다 "
+                           f"(>={WEBSOCKETS_MIN_VERSION} 필요): pip install -r requirements-dev.txt")
+    return websockets
+
+
+class StreamlitSession:
+    """브라우저 탭 하나를 흉내 내는 웹소켓 세션 (버튼 클릭 → 스크립트 실행 완료 대기)"""
+
+    def __init__(self, url: str, client_id: Optional[str] = None):
+        self.url = url.rstrip('/') + "/_stcore/stream"
+        self.client_id = client_id  # 멀티 프로세스 로드밸런서가 사용자별로 워커를 고정하도록 전달
+        self.ws = None
+        self.buttons: Dict[str, str] = {}   # 위젯 ID → 라벨
+        self.widgets: Dict[str, str] = {}   # 현재 화면의 위젯 ID → 요소 종류
+        self.rx_bytes = 0
+
+    async def connect(self):
+        websockets = _require_websockets()
+        headers = {'X-Forwarded-For': self.client_id} if self.client_id else None
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None,
+                                          additional_headers=headers)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self, widget_states: Optional[List[Dict[str, Any]]] = None, timeout: float = 120) -> float:
+        """
+        스크립트 재실행 요청 후 실행 완료(st.rerun으로 이어지는 실행 포함)까지 대기
+
+        Returns:
+            소요 시간 (ms)
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.page_script_hash = ""
+        for state in widget_states or []:
+            widget = message.rerun_script.widget_states.widgets.add()
+            widget.id = state['id']
+            if 'trigger' in state:
+                widget.trigger_value = True
+            if 'bool' in state:
+                widget.bool_value = state['bool']
+            if 'string' in state:
+                widget.string_value = state['string']
+
+        self.buttons, self.widgets = {}, {}
+        start = time.perf_counter()
+        await self.ws.send(message.SerializeToString())
+        while True:
+            raw = await asyncio.wait_for(self.ws.recv(), timeout)
+            self.rx_bytes += len(raw)
+            forward = ForwardMsg()
+            forward.ParseFromString(raw)
+            kind = forward.WhichOneof("type")
+            if kind == "new_session":
+                # st.rerun으로 새 실행이 시작되면 이전 실행의 위젯은 무효
+                self.buttons, self.widgets = {}, {}
+            elif kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                widget = getattr(element, element_type, None)
+                widget_id = getattr(widget, "id", "")
+                if widget_id:
+                    self.widgets[widget_id] = element_type
+                    if element_type == "button":
+                        self.buttons[widget_id] = widget.label
+            elif kind == "script_finished":
+                if forward.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                if forward.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+                    raise RuntimeError(f"script finished with status {forward.script_finished}")
+                return (time.perf_counter() - start) * 1000
+
+    def widget_id(self, key: Optional[str] = None, label: Optional[str] = None,
+                  element_type: Optional[str] = None) -> str:
+        """키(위젯 ID 끝부분), 버튼 라벨 또는 요소 종류로 위젯 ID 조회"""
+        for widget_id, widget_type in self.widgets.items():
+            if key is not None and widget_id.endswith(f"-{key}"):
+                return widget_id
+            if label is not None and self.buttons.get(widget_id, "").startswith(label):
+                return widget_id
+            if element_type is not None and key is None and label is None and widget_type == element_type:
+                return widget_id
+        raise LookupError(f"widget not found: key={key} label={label} type={element_type}")
+
+    def has_widget(self, key: str) -> bool:
+        return any(widget_id.endswith(f"-{key}") for widget_id in self.widgets)
+
+    async def select_symbol(self, symbol: str) -> float:
+        """1단계 종목 선택 - 첫 페이지에 버튼이 없으면 검색창에 입력 후 검색 결과 클릭"""
+        if self.has_widget(symbol):
+            return await self.click(key=symbol)
+        search = {'id': self.widget_id(element_type="text_input"), 'string': symbol}
+        elapsed = await self.rerun([search])
+        return elapsed + await self.click(key=f"search_{symbol}", extra=[search])
+
+    async def click(self, key: Optional[str] = None, label: Optional[str] = None,
+                    extra: Optional[List[Dict[str, Any]]] = None) -> float:
+        return await self.rerun([{'id': self.widget_id(key, label), 'trigger': True}] + (extra or []))
+
+
+async def _server_user(url: str, index: int, iterations: int, deadline: Optional[float], symbols: List[str],
+                       popularity: str, zipf_s: float, think_ms: float, seed: int,
+                       samples: Dict[str, List[float]], errors: List[str], counters: Dict[str, int]):
+    pick = symbol_sampler(symbols, popularity, zipf_s, seed + index)
+    rng = random.Random(seed * 1000 + index)
+    session = StreamlitSession(url, client_id=f"10.0.{(index + 1) // 256}.{(index + 1) % 256}")
+    try:
+        await session.connect()
+        await session.rerun()
+        await session.click(label="I understand and agree")
+        for iteration in range(iterations):
+            if deadline and time.perf_counter() > deadline:
+                break
+            timings = {}
+            timings["select"] = await session.select_symbol(pick())
+            timings["chart"] = await session.click(key=f"group_{rng.choice(GROUP_NAMES)}")
+            checkbox = session.widget_id(key="local_dip_checkbox")
+            timings["toggle"] = await session.click(label="🔄 Apply Signal Settings",
+                                                    extra=[{'id': checkbox, 'bool': iteration % 2 == 1}])
+            timings["back"] = await session.click(label="← Previous Step")
+            timings["back"] += await session.click(label="← Previous Step")
+            for step, value in timings.items():
+                samples[step].append(value)
+            counters['flows'] += 1
+            if think_ms:
+                await asyncio.sleep(think_ms / 1000)
+    except Exception as e:
+        errors.append(f"user {index}: {type(e).__name__}: {e}")
+    finally:
+        counters['rx_bytes'] += session.rx_bytes
+        await session.close()
+
+
+def _wait_for_server(http_url: str, timeout: float = 60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"{http_url}/_stcore/health", timeout=2) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError(f"Streamlit 서버가 응답하지 않습니다: {http_url}")
+
+
+def run_server(url: Optional[str], port: int, server_pid: Optional[int], data_dir: str, users: int,
+               iterations: int, duration: Optional[float], popularity: str, zipf_s: float,
+               think_ms: float, seed: int) -> Dict[str, Any]:
+    """Streamlit 서버(로컬 실행 또는 --url)에 가상 사용자 세션 연결"""
+    process = None
+    if url is None:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", APP_PATH, "--server.headless", "true",
+             "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+            cwd=parent_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        server_pid = process.pid
+        url = f"ws://localhost:{port}"
+    try:
+        _wait_for_server(url.replace("ws://", "http://").replace("wss://", "https://"))
+        symbols = _catalog_symbols(data_dir)
+
+        async def main():
+            samples: Dict[str, List[float]] = {step: [] for step in STEPS}
+            errors: List[str] = []
+            counters = {'flows': 0, 'rx_bytes': 0}
+            # 서버 첫 실행(import/캐시 준비)은 측정에서 제외
+            await _server_user(url, -1, 1, None, symbols[:1], "uniform", zipf_s, 0, seed,
+                               {step: [] for step in STEPS}, errors, {'flows': 0, 'rx_bytes': 0})
+            deadline = time.perf_counter() + duration if duration else None
+            monitor = RssMonitor(server_pid) if server_pid else None
+            if monitor:
+                monitor.__enter__()
+            start = time.perf_counter()
+            await asyncio.gather(*[
+                _server_user(url, i, iterations, deadline, symbols, popularity, zipf_s, think_ms, seed,
+                             samples, errors, counters)
+                for i in range(users)
+            ])
+            elapsed = time.perf_counter() - start
+            if monitor:
+                monitor.__exit__(None, None, None)
+            result = _summarize("server", users, samples, counters['flows'], elapsed, errors, monitor)
+            result['rx_mb'] = round(counters['rx_bytes'] / 1e6, 2)
+            return result
+
+        return asyncio.run(main())
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+# ---------------------------------------------------------------------------
+# 공통
+# ---------------------------------------------------------------------------
+
+def _catalog_symbols(data_dir: str) -> List[str]:
+    """인기도 순위로 쓸 종목 순서 (카탈로그 표시 순서)"""
+    catalog = get_catalog(data_dir, STOCK_CATEGORIES)
+    return [ticker for category in catalog.category_names()
+            for _, ticker in catalog.page(category, 0, page_size=catalog.category_size(category))]
+
+
+def _summarize(mode: str, users: int, samples: Dict[str, List[float]], flows: int, elapsed: float,
+               errors: List[str], monitor: Optional[RssMonitor]) -> Dict[str, Any]:
+    steps = {}
+    for step, values in samples.items():
+        if not values:
+            continue
+        steps[step] = {
+            'count': len(values),
+            'p50_ms': round(percentile(values, 50), 1),
+            'p90_ms': round(percentile(values, 90), 1),
+            'p99_ms': round(percentile(values, 99), 1),
+            'max_ms': round(max(values), 1),
+            'mean_ms': round(statistics.mean(values), 1)
+        }
+    memory = {}
+    if monitor is not None and monitor.baseline is not None:
+        memory = {
+            'baseline_mb': round(monitor.baseline / 1e6, 1),
+            'peak_mb': round(monitor.peak / 1e6, 1),
+            'end_mb': round(monitor.end / 1e6, 1) if monitor.end else None,
+            'per_session_mb': round((monitor.peak - monitor.baseline) / 1e6 / users, 2)
+        }
+    return {
+        'mode': mode,
+        'users': users,
+        'flows': flows,
+        'elapsed_s': round(elapsed, 2),
+        'flows_per_s': round(flows / elapsed, 2) if elapsed else 0,
+        'steps_per_s': round(sum(len(values) for values in samples.values()) / elapsed, 2) if elapsed else 0,
+        'steps': steps,
+        'memory': memory,
+        'errors': errors[:20],
+        'error_count': len(errors)
+    }
+
+
+def _print_summary(result: Dict[str, Any]):
+    print(f"[{result['mode']}] 사용자 {result['users']}명, 흐름 {result['flows']}회, {result['elapsed_s']}s "
+          f"→ {result['flows_per_s']} flows/s, {result['steps_per_s']} steps/s, 오류 {result['error_count']}개")
+    print(f"{'step':<8} {'count':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for step, row in result['steps'].items():
+        print(f"{step:<8} {row['count']:>6} {row['p50_ms']:>9} {row['p90_ms']:>9} {row['p99_ms']:>9} {row['max_ms']:>9}")
+    if result['memory']:
+        memory = result['memory']
+        print(f"RSS {memory['baseline_mb']}MB → 최대 {memory['peak_mb']}MB (세션당 {memory['per_session_mb']}MB)")
+    for error in result['errors'][:5]:
+        print(f"  ! {error}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 동시 사용자 부하 테스트")
+    parser.add_argument("--mode", choices=["core", "server"], default="core", help="측정 대상")
+    parser.add_argument("--users", type=int, default=8, help="동시 가상 사용자 수")
+    parser.add_argument("--iterations", type=int, default=3, help="사용자별 흐름 반복 횟수")
+    parser.add_argument("--duration", type=float, default=None, help="최대 측정 시간(초)")
+    parser.add_argument("--popularity", choices=["zipf", "uniform"], default="zipf", help="종목 인기도 분포")
+    parser.add_argument("--zipf-s", type=float, default=1.1, help="Zipf 지수 (클수록 상위 종목 집중)")
+    parser.add_argument("--think-ms", type=float, default=0, help="흐름 사이 대기 시간(ms)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="신호 데이터 폴더")
+    parser.add_argument("--url", default=None, help="실행 중인 서버 주소 (예: ws://localhost:8501, 없으면 로컬 실행)")
+    parser.add_argument("--port", type=int, default=8599, help="로컬 서버 포트")
+    parser.add_argument("--server-pid", type=int, default=None, help="--url 서버의 PID (메모리 측정용)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    data_dir = os.path.abspath(args.data_dir)
+    if args.mode == "server":
+        try:
+            _require_websockets()
+        except RuntimeError as e:
+            parser.error(str(e))
+    if args.mode == "core":
+        result = run_core(data_dir, args.users, args.iterations, args.duration, args.popularity,
+                          args.zipf_s, args.think_ms, args.seed)
+    else:
+        result = run_server(args.url, args.port, args.server_pid, data_dir, args.users, args.iterations,
+                            args.duration, args.popularity, args.zipf_s, args.think_ms, args.seed)
+
+    result['meta'] = {
+        'timestamp': datetime.now().isoformat(timespec="seconds"),
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+        'popularity': args.popularity,
+        'zipf_s': args.zipf_s,
+        'iterations': args.iterations,
+        'think_ms': args.think_ms
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    _print_summary(result)
+    print(f"결과 저장: {args.output}")
+    return 1 if result['error_count'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
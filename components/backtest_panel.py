@@ -0,0 +1,102 @@
+"""
+Backtest Panel Component - 캔들차트 아래 시그널 규칙 백테스트 및 자산 곡선
+"""
+import streamlit as st
+import plotly.graph_objects as go
+from typing import List, Optional
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.columnar import SIGNAL_COLUMNS
+from utils.backtest import get_symbol_backtest, run_universe_backtest
+from components.data_access import get_json_client
+
+
+def _build_equity_figure(result) -> go.Figure:
+    """전략/보유 전략 자산 곡선 (시작 = 0%)"""
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=result['dates'], y=(result['benchmark'] - 1) * 100, mode='lines',
+        name='Buy & Hold', line=dict(color='grey', width=1.5)
+    ))
+    fig.add_trace(go.Scattergl(
+        x=result['dates'], y=(result['equity'] - 1) * 100, mode='lines',
+        name='Signal strategy', line=dict(color='#FF4444', width=2)
+    ))
+    fig.update_layout(
+        height=300,
+        template="plotly_white",
+        margin=dict(l=2, r=2, t=15, b=2),
+        font=dict(size=9, color='black'),
+        plot_bgcolor='#dee2e6',
+        paper_bgcolor='#dee2e6',
+        dragmode='pan',
+        legend=dict(orientation='h', yanchor='bottom', y=1.0, xanchor='left', x=0),
+        yaxis=dict(title=dict(text="Return (%)"), fixedrange=True)
+    )
+    return fig
+
+
+def render_backtest_panel(symbol: str, selected_signals: Optional[List[str]] = None):
+    """
+    시그널 규칙 백테스트 패널
+
+    Args:
+        symbol: 종목 심볼
+        selected_signals: 현재 그룹의 시그널 (첫 번째 반전 시그널을 기본 진입 시그널로 사용)
+    """
+    with st.expander("🧪 Backtest this signal", expanded=False):
+        try:
+            default_entry = (selected_signals or ['combined_signal_v1'])[-1]
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                entry_signal = st.selectbox("Buy when", SIGNAL_COLUMNS,
+                                            index=SIGNAL_COLUMNS.index(default_entry) if default_entry in SIGNAL_COLUMNS else 0,
+                                            key="backtest_entry")
+            with col2:
+                exit_fcv = st.slider("Sell when FCV ≤", -1.0, 0.0, -0.5, 0.1, key="backtest_exit_fcv")
+            with col3:
+                fee_bps = st.number_input("Fee per trade (bp)", 0.0, 100.0, 0.0, 1.0, key="backtest_fee")
+
+            rule = {'entry_signal': entry_signal, 'exit_fcv_at_or_below': exit_fcv, 'fee_bps': fee_bps}
+            result = get_symbol_backtest(get_json_client(), symbol, rule)
+            if result is None:
+                st.warning("⚠️ Backtest is not available for this stock.")
+                return
+
+            metrics = result['metrics']
+            m1, m2, m3, m4 = st.columns(4)
+            m1.metric("Strategy", f"{metrics['total_return']:+.1%}",
+                      f"{metrics['total_return'] - metrics['buy_hold_return']:+.1%} vs hold")
+            m2.metric("Max drawdown", f"{metrics['max_drawdown']:.1%}")
+            m3.metric("Trades", metrics['trades'])
+            m4.metric("Win rate", f"{metrics['win_rate']:.0%}" if metrics['win_rate'] is not None else "-")
+
+            st.plotly_chart(_build_equity_figure(result), use_container_width=True,
+                            config={'displayModeBar': False, 'scrollZoom': True, 'displaylogo': False})
+
+            if st.button("Run this rule on all stocks", key="backtest_universe"):
+                with st.spinner("Running backtest on all stocks..."):
+                    universe = run_universe_backtest(get_json_client().data_dir, rule)
+                summary = universe['summary']
+                if not summary['symbol_count']:
+                    st.warning("⚠️ No stock could be backtested.")
+                    return
+                st.caption(f"{summary['symbol_count']} stocks in {universe['elapsed_s']}s · "
+                           f"median return {summary['median_total_return']:+.1%} "
+                           f"(buy & hold {summary['median_buy_hold_return']:+.1%}) · "
+                           f"beats buy & hold in {summary['beat_buy_hold']:.0%} of stocks")
+                rows = [
+                    {"Stock": name, "Return": f"{m['total_return']:+.1%}", "Buy & Hold": f"{m['buy_hold_return']:+.1%}",
+                     "Max DD": f"{m['max_drawdown']:.1%}", "Trades": m['trades']}
+                    for name, m in universe['symbols'].items() if 'error' not in m
+                ]
+                st.dataframe(rows, hide_index=True, use_container_width=True)
+
+            st.caption("Educational simulation on past data. Past performance does not guarantee future returns.")
+        except Exception as e:
+            st.error(f"백테스트 중 오류 발생: {e}")
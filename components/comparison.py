@@ -0,0 +1,74 @@
+"""
+Comparison Component - 여러 종목 정규화 가격 비교 화면
+"""
+import streamlit as st
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.columnar import SIGNAL_COLUMNS
+from utils.comparison import align_symbols, build_comparison_figure
+from components.data_access import get_json_client
+from components.stock_data import STOCK_CATEGORIES
+from utils.catalog import get_catalog
+
+# 자주 요청되는 기본 비교 조합 (KOSPI, USD/KRW, 미국 장기채)
+DEFAULT_COMPARISON = ["^KS11", "USDKRW=X", "TLT"]
+MAX_COMPARISON_SYMBOLS = 6
+
+
+def render_comparison_view():
+    """종목 비교 모드 - 공통 날짜 인덱스로 정렬한 정규화 가격과 시그널 표시"""
+    st.markdown("### 📊 Compare stocks(or indices)")
+
+    if st.button("← Previous Step"):
+        st.session_state.step = 1
+        st.rerun()
+
+    try:
+        client = get_json_client()
+        # 카탈로그 이름으로 표시 (데이터가 있는 종목만)
+        labels = get_catalog(client.data_dir, STOCK_CATEGORIES).labels
+
+        selected = st.multiselect(
+            "Stocks to compare",
+            list(labels),
+            default=[ticker for ticker in DEFAULT_COMPARISON if ticker in labels],
+            format_func=lambda ticker: labels.get(ticker, ticker),
+            max_selections=MAX_COMPARISON_SYMBOLS
+        )
+
+        col1, col2 = st.columns(2)
+        with col1:
+            join_label = st.radio("Dates", ["Common dates only", "All dates"], horizontal=True)
+        with col2:
+            period = st.selectbox("Period", ["1y", "3y", "5y", "max"], index=1)
+        overlay_signals = st.multiselect("Overlay signals", SIGNAL_COLUMNS, default=[])
+
+        if len(selected) < 2:
+            st.info("Select at least two stocks to compare.")
+            return
+
+        how = 'inner' if join_label == "Common dates only" else 'outer'
+        aligned = align_symbols(client, selected, how=how, period=period, signal_names=overlay_signals)
+
+        if aligned['missing']:
+            st.warning(f"⚠️ No data: {', '.join(aligned['missing'])}")
+        if len(aligned['dates']) == 0:
+            st.warning("⚠️ The selected stocks have no common dates.")
+            return
+
+        fig = build_comparison_figure(aligned, overlay_signals, labels)
+        st.plotly_chart(
+            fig,
+            use_container_width=True,
+            config={'displayModeBar': False, 'scrollZoom': True, 'displaylogo': False}
+        )
+        st.caption("Each line starts at 100 on the first date of the selected period. "
+                   "Markers show where the chosen signals fired for each stock.")
+
+    except Exception as e:
+        st.error(f"종목 비교 화면 렌더링 중 오류 발생: {e}")
@@ -0,0 +1,23 @@
+"""
+Data Access Adapter - Streamlit 세션과 JSON 클라이언트 연결
+
+클라이언트(와 그 캐시)는 프로세스 공용이며 세션 상태에는 저장하지 않습니다.
+세션에는 종목/그룹/토글 같은 작은 값만 두고 데이터는 공용 클라이언트에서 조회합니다.
+"""
+import sys
+import os
+
+# 현재 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.json_client import InvestSmartJSONClient, get_shared_client
+
+# data 폴더 경로 (프로젝트 루트 기준)
+DATA_DIR = os.path.abspath(os.path.join(parent_dir, "data"))
+
+
+def get_json_client() -> InvestSmartJSONClient:
+    """프로세스 공용 JSON 클라이언트 인스턴스 반환 (모든 세션/컴포넌트가 공유)"""
+    return get_shared_client(DATA_DIR)
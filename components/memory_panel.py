@@ -0,0 +1,78 @@
+"""
+Memory Panel Component - 개발자 모드 메모리 계측 (캐시/세션/증가량/tracemalloc)
+"""
+import streamlit as st
+import json
+import tracemalloc
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.memory_profiler import memory_report, start_tracing, stop_tracing
+
+
+def _mb(value) -> str:
+    return "-" if value is None else f"{value / (1024 * 1024):.1f}MB"
+
+
+def render_memory_panel(client):
+    """개발자 모드 메모리 보고서 (버튼을 누를 때만 gc 순회/tracemalloc 스냅샷)"""
+    st.markdown("##### 🧠 Memory")
+    include_figures = st.session_state.get('memory_count_figures', False)
+    report = memory_report(client, include_figures=include_figures)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("RSS", _mb(report['rss_bytes']), delta=_mb(report['growth']['deltas'].get('rss_bytes'))
+                  if report['growth']['samples'] > 1 else None, delta_color="inverse")
+    with col2:
+        st.metric("클라이언트 캐시", _mb(sum(info['bytes'] for info in report['client_caches'].values())))
+    with col3:
+        st.metric("모듈 캐시", _mb(sum(info['bytes'] for info in report['module_caches'].values())))
+    with col4:
+        st.metric("세션", report['sessions']['live_sessions'],
+                  help=f"평균 상태 {report['sessions']['state_bytes_avg']:,} bytes, 최대 {report['sessions']['state_bytes_max']:,} bytes")
+
+    caches = {f"client.{name}": info for name, info in report['client_caches'].items()}
+    caches.update(report['module_caches'])
+    st.caption(" | ".join(f"{name} {info['entries']}개 {_mb(info['bytes'])}"
+                          for name, info in sorted(caches.items(), key=lambda item: -item[1]['bytes']) if info['entries']))
+
+    shared = report['shared_store']
+    if shared:
+        st.caption(f"공유 저장소 ({shared['dir']}): 종목 {shared['symbols']}개 {_mb(shared['columns_bytes'])} "
+                   f"(이 워커 연결 {shared['attached']}개) | Figure {shared['figures']}개 {_mb(shared['figures_bytes'])}")
+
+    growth = report['growth']
+    if growth['samples'] > 1:
+        st.caption(f"증가량 ({growth['samples']}개 표본, {growth['elapsed_s']}s): "
+                   + " | ".join(f"{key} {value:+,}/h" for key, value in growth['per_hour'].items()))
+    if include_figures:
+        st.caption(f"살아 있는 Plotly Figure: {report['live_figures']}개")
+
+    col_btn1, col_btn2, col_btn3 = st.columns(3)
+    with col_btn1:
+        if not tracemalloc.is_tracing():
+            if st.button("▶️ tracemalloc 시작", key="memory_trace_start"):
+                start_tracing()
+                st.rerun()
+        elif st.button("⏹️ tracemalloc 중지", key="memory_trace_stop"):
+            stop_tracing()
+            st.rerun()
+    with col_btn2:
+        if st.button("🔢 Figure 수 세기", key="memory_count_figures_button"):
+            st.session_state.memory_count_figures = not include_figures
+            st.rerun()
+    with col_btn3:
+        st.download_button("💾 JSON", json.dumps(report, ensure_ascii=False, indent=2),
+                           file_name=f"memory_report_{report['pid']}.json", mime="application/json",
+                           key="memory_report_download")
+
+    if report['tracemalloc']['top_allocations']:
+        st.caption(f"tracemalloc: {_mb(report['tracemalloc']['traced_bytes'])} "
+                   f"(최대 {_mb(report['tracemalloc']['peak_bytes'])}) - 시작 시점 대비 증가 상위")
+        st.code("\n".join(f"{row['size_diff_kb']:>+10.1f} KB {row['count_diff']:>+7} {row['location']}"
+                          for row in report['tracemalloc']['top_allocations']), language=None)
@@ -10,8 +10,10 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
-from utils.json_client import InvestSmartJSONClient
+from components.data_access import get_json_client
 from components.stock_data import STOCK_CATEGORIES
+from utils.catalog import PAGE_SIZE, get_catalog
+from utils.search_index import get_search_index
 
 
 def render_simple_stock_selector() -> Optional[str]:
@@ -22,63 +24,69 @@ def render_simple_stock_selector() -> Optional[str]:
         선택된 종목의 심볼(ticker)을 반환합니다.
     """
     try:
-        data_dir = os.path.join(os.path.dirname(current_dir), "data")
-        data_dir = os.path.abspath(data_dir)
-        json_client = InvestSmartJSONClient(data_dir)
+        json_client = get_json_client()
         available_symbols = json_client.get_available_symbols()
  
         if not available_symbols:
             st.error("종목 목록을 불러올 수 없습니다. 데이터 파일을 확인해주세요.")
             return None
 
+        # 카탈로그 (데이터 있는 종목만, 카탈로그에 없는 종목은 'Other Data') 와 검색 인덱스 - 프로세스당 한 번 생성
+        catalog = get_catalog(json_client.data_dir, STOCK_CATEGORIES)
+        search_index = get_search_index(catalog.as_categories, available_symbols)
+
         # 세션 상태에 selected_symbol이 없으면 초기화
         if 'selected_symbol' not in st.session_state:
             st.session_state.selected_symbol = None
 
-        # Expander 상태 관리를 위한 세션 상태 초기화
-        if 'expanded_category' not in st.session_state:
-            st.session_state.expanded_category = None
+        # 카테고리별 아코디언 메뉴 - 열린 카테고리의 현재 페이지만 버튼 생성
+        # (on_change="rerun"으로 열림 상태를 추적하므로 닫힌 카테고리의 본문은 실행하지 않음)
+        for category in catalog.category_names():
+            size = catalog.category_size(category)
+            expander = st.expander(f"📁 {category} ({size})", key=f"catalog_expander_{category}", on_change="rerun")
+            if not expander.open:
+                continue
+            with expander:
+                page_key = f"catalog_page_{category}"
+                page_count = catalog.page_count(category)
+                page = min(st.session_state.get(page_key, 0), page_count - 1)
 
-        # 카테고리별 아코디언 메뉴
-        for category, stocks in STOCK_CATEGORIES.items():
-            # with 구문을 사용하여 expander 내부의 요소들이 정상적으로 렌더링되도록 합니다.
-            with st.expander(f"📁 {category}", expanded=(st.session_state.expanded_category == category)):
                 cols = st.columns(3)
-                col_idx = 0
-                for name, ticker in stocks.items():
-                    # 데이터가 있는 종목만 버튼으로 표시
-                    if ticker in available_symbols:
-                        if cols[col_idx].button(name, key=ticker, use_container_width=True):
-                            # 종목이 선택되면, 선택된 심볼을 저장하고
-                            # step을 2로 변경하여 다음 페이지로 즉시 이동합니다.
-                            st.session_state.selected_symbol = ticker
-                            st.session_state.expanded_category = None
-                            st.session_state.step = 2
-                            st.rerun()
-                        col_idx = (col_idx + 1) % 3
+                for col_idx, (name, ticker) in enumerate(catalog.page(category, page)):
+                    if cols[col_idx % 3].button(name, key=ticker, use_container_width=True):
+                        # 종목이 선택되면, 선택된 심볼을 저장하고
+                        # step을 2로 변경하여 다음 페이지로 즉시 이동합니다.
+                        st.session_state.selected_symbol = ticker
+                        st.session_state.step = 2
+                        st.rerun()
+
+                if page_count > 1:
+                    prev_col, info_col, next_col = st.columns([1, 2, 1])
+                    if prev_col.button("◀", key=f"{page_key}_prev", disabled=page == 0, use_container_width=True):
+                        st.session_state[page_key] = page - 1
+                        st.rerun()
+                    info_col.caption(f"{page * PAGE_SIZE + 1}-{min((page + 1) * PAGE_SIZE, size)} / {size}")
+                    if next_col.button("▶", key=f"{page_key}_next", disabled=page >= page_count - 1,
+                                       use_container_width=True):
+                        st.session_state[page_key] = page + 1
+                        st.rerun()
 
         st.markdown("---")
         # 검색창 (화면 하단으로 이동)
-        search_query = st.text_input("🔍 Search stocks (e.g., AAPL, KOSPI, Tesla)", "").lower()
+        search_query = st.text_input("🔍 Search stocks (e.g., AAPL, KOSPI, Tesla)", "")
 
-        # 검색어에 따라 실시간으로 후보군 표시
-        if search_query:
-            search_results = {}
-            for category, stocks in STOCK_CATEGORIES.items():
-                for name, ticker in stocks.items():
-                    if search_query in name.lower() or search_query in ticker.lower():
-                        if ticker in available_symbols:
-                            search_results[name] = ticker
+        # 검색어에 따라 실시간으로 후보군 표시 (접두사/부분 문자열/별칭/오타 허용, 점수순)
+        if search_query.strip():
+            search_results = search_index.search(search_query)
             
             if search_results:
                 st.markdown("##### Search Results")
                 search_cols = st.columns(3)
                 search_col_idx = 0
-                for name, ticker in search_results.items():
+                for name, ticker in search_results:
                     # 검색 결과는 버튼으로 표시하고, 클릭 시 step 2로 이동
                     if search_cols[search_col_idx].button(name, key=f"search_{ticker}", use_container_width=True):
                         st.session_state.selected_symbol = ticker
-                        st.session_state.expanded_category = None
                         st.session_state.step = 2
                         st.rerun()
                     search_col_idx = (search_col_idx + 1) % 3
@@ -0,0 +1,291 @@
+"""
+시그널 백테스트 엔진 - 컬럼형 종목 데이터 위에서 단순 규칙을 벡터 연산으로 검증
+
+규칙 예시 (dict):
+    {'entry_signal': 'combined_signal_v1', 'exit_fcv_at_or_below': -0.5}
+
+- 진입: entry_signal 값이 1인 봉의 종가에 매수 (이미 보유 중이면 무시)
+- 청산: FCV가 exit_fcv_at_or_below 이하이거나 exit_signal 값이 -1인 봉의 종가에 매도
+- 포지션은 진입/청산 이벤트를 전방 채움(forward fill)하여 계산하고,
+  자산 곡선은 전일 포지션 × 당일 수익률의 누적곱으로 구합니다.
+
+종목별 결과는 (규칙, 데이터 버전) 단위로 캐시되고, 전체 종목 실행은
+프로세스 풀로 병렬 처리합니다.
+
+사용법:
+    python -m utils.backtest --entry combined_signal_v1 --exit-fcv -0.5
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.columnar import SIGNAL_COLUMNS
+from utils.json_client import get_shared_client
+from utils.process_pool import spawn_pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULE = {
+    'entry_signal': 'combined_signal_v1',
+    'exit_fcv_at_or_below': -0.5,
+    'exit_signal': None,
+    'fee_bps': 0.0
+}
+
+# 캐시할 종목 결과 수 (자산 곡선/포지션 배열 포함) / 전체 백테스트 결과 수 (규칙별)
+_RESULT_CACHE_SIZE = 64
+_UNIVERSE_CACHE_SIZE = 8
+
+_result_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+_universe_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(cache: "OrderedDict[Tuple, Dict[str, Any]]", key: Tuple) -> Optional[Dict[str, Any]]:
+    with _cache_lock:
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+        return result
+
+
+def _cache_put(cache: "OrderedDict[Tuple, Dict[str, Any]]", key: Tuple, result: Dict[str, Any], size: int):
+    """LRU 저장 - 화면에서 바꿔 본 규칙마다 항목이 늘어나므로 오래된 것부터 정리"""
+    with _cache_lock:
+        cache[key] = result
+        cache.move_to_end(key)
+        while len(cache) > size:
+            cache.popitem(last=False)
+
+
+def normalize_rule(rule: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """기본값을 채우고 규칙을 검증"""
+    normalized = dict(DEFAULT_RULE, **(rule or {}))
+    if normalized['entry_signal'] not in SIGNAL_COLUMNS:
+        raise ValueError(f"알 수 없는 진입 시그널: {normalized['entry_signal']}")
+    if normalized['exit_signal'] is not None and normalized['exit_signal'] not in SIGNAL_COLUMNS:
+        raise ValueError(f"알 수 없는 청산 시그널: {normalized['exit_signal']}")
+    return normalized
+
+
+def rule_key(rule: Dict[str, Any]) -> str:
+    """캐시 키로 쓰는 규칙 식별자"""
+    return json.dumps(normalize_rule(rule), sort_keys=True)
+
+
+def _compute_position(columns: Dict[str, np.ndarray], rule: Dict[str, Any]) -> np.ndarray:
+    """진입/청산 이벤트를 전방 채움하여 봉별 포지션(0/1) 계산 - 같은 봉이면 청산 우선"""
+    n = len(columns['close'])
+    entry = columns[rule['entry_signal']] == 1
+    exit_ = np.zeros(n, dtype=bool)
+    if rule['exit_fcv_at_or_below'] is not None:
+        exit_ |= columns['fcv'] <= rule['exit_fcv_at_or_below']
+    if rule['exit_signal']:
+        exit_ |= columns[rule['exit_signal']] == -1
+
+    events = np.where(exit_, 0.0, np.where(entry, 1.0, np.nan))
+    has_event = ~np.isnan(events)
+    last_event = np.where(has_event, np.arange(n), 0)
+    np.maximum.accumulate(last_event, out=last_event)
+    position = np.where(has_event[last_event], events[last_event], 0.0)
+    return position
+
+
+def _max_drawdown(equity: np.ndarray) -> float:
+    """자산 곡선의 최대 낙폭 (음수)"""
+    if len(equity) == 0:
+        return 0.0
+    peaks = np.maximum.accumulate(equity)
+    return float(np.min(equity / peaks - 1))
+
+
+def run_backtest(columns: Dict[str, np.ndarray], rule: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    한 종목 백테스트
+
+    Returns:
+        {'dates', 'position', 'equity', 'benchmark', 'trades', 'metrics'} - 배열은 numpy
+    """
+    rule = normalize_rule(rule)
+    close = columns['close']
+    dates = columns['dates']
+    n = len(close)
+    if n < 2:
+        raise ValueError("백테스트에 필요한 데이터가 부족합니다")
+
+    position = _compute_position(columns, rule)
+    prev_position = np.concatenate(([0.0], position[:-1]))
+
+    # 봉별 수익률 (0 가격은 수익률 0으로 처리)
+    returns = np.zeros(n)
+    safe_prev = np.where(close[:-1] > 0, close[:-1], np.nan)
+    returns[1:] = np.nan_to_num(close[1:] / safe_prev - 1)
+
+    fee = rule['fee_bps'] / 10000.0
+    strategy_returns = prev_position * returns - np.abs(position - prev_position) * fee
+    equity = np.cumprod(1 + strategy_returns)
+    benchmark = np.cumprod(1 + returns)
+
+    # 거래 목록 (마지막 봉까지 보유 중이면 마지막 종가로 평가)
+    entries = np.flatnonzero((position == 1) & (prev_position == 0))
+    exits = np.flatnonzero((position == 0) & (prev_position == 1))
+    open_trade = len(exits) < len(entries)
+    if open_trade:
+        exits = np.append(exits, n - 1)
+    trade_returns = close[exits] / np.where(close[entries] > 0, close[entries], np.nan) - 1
+    trade_returns = np.nan_to_num(trade_returns) - 2 * fee
+
+    years = max((dates[-1] - dates[0]).astype('timedelta64[D]').astype(int) / 365.25, 1e-9)
+    total_return = float(equity[-1] - 1)
+    metrics = {
+        'total_return': total_return,
+        'cagr': float(equity[-1] ** (1 / years) - 1) if equity[-1] > 0 else -1.0,
+        'max_drawdown': _max_drawdown(equity),
+        'trades': int(len(entries)),
+        'win_rate': float(np.mean(trade_returns > 0)) if len(trade_returns) else None,
+        'avg_trade_return': float(np.mean(trade_returns)) if len(trade_returns) else None,
+        'exposure': float(np.mean(position)),
+        'open_position': bool(open_trade),
+        'buy_hold_return': float(benchmark[-1] - 1),
+        'buy_hold_max_drawdown': _max_drawdown(benchmark)
+    }
+    return {
+        'dates': dates,
+        'position': position,
+        'equity': equity,
+        'benchmark': benchmark,
+        'trades': {'entry_index': entries, 'exit_index': exits, 'returns': trade_returns},
+        'metrics': metrics
+    }
+
+
+def get_symbol_backtest(client, symbol: str, rule: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """종목 백테스트 결과 ((규칙, 종목, 데이터 버전)별 캐시)"""
+    try:
+        key = (os.path.abspath(client.data_dir), rule_key(rule), symbol, client.get_data_version(symbol))
+        cached = _cache_get(_result_cache, key)
+        if cached is not None:
+            return cached
+
+        columns = client.get_columns(symbol)
+        if columns is None:
+            return None
+        result = run_backtest(columns, rule)
+        _cache_put(_result_cache, key, result, _RESULT_CACHE_SIZE)
+        return result
+    except Exception as e:
+        logger.error(f"백테스트 실패: {symbol}, {e}")
+        return None
+
+
+def _backtest_worker(data_dir: str, symbols: List[str], rule: Dict[str, Any]) -> Dict[str, Any]:
+    """프로세스 풀 작업 단위 - 종목 묶음의 지표만 반환 (배열은 프로세스 간 전송하지 않음)"""
+    client = get_shared_client(data_dir)
+    results = {}
+    for symbol in symbols:
+        columns = client.get_columns(symbol)
+        if columns is None:
+            continue
+        try:
+            results[symbol] = run_backtest(columns, rule)['metrics']
+        except Exception as e:
+            results[symbol] = {'error': str(e)}
+    # 워커 프로세스에 원본 데이터가 쌓이지 않도록 정리
+    client.clear_cache()
+    return results
+
+
+def run_universe_backtest(data_dir: str, rule: Optional[Dict[str, Any]] = None,
+                          workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    전체 종목 백테스트 ((규칙, 전체 데이터 버전)별 캐시)
+
+    Returns:
+        {'rule', 'version', 'elapsed_s', 'symbols': {종목: metrics}, 'summary': {...}}
+    """
+    rule = normalize_rule(rule)
+    data_dir = os.path.abspath(data_dir)
+    client = get_shared_client(data_dir)
+    symbols = sorted(set(client.get_available_symbols()))
+    versions = tuple((symbol, client.get_data_version(symbol)) for symbol in symbols)
+    version = hashlib.sha1(repr(versions).encode('utf-8')).hexdigest()[:16]
+    key = (data_dir, rule_key(rule), version)
+    cached = _cache_get(_universe_cache, key)
+    if cached is not None:
+        return cached
+
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    chunks = [symbols[i::workers] for i in range(workers) if symbols[i::workers]]
+    per_symbol: Dict[str, Any] = {}
+    # 앱(Streamlit 스레드)에서도 호출되므로 spawn 방식 풀 사용
+    with spawn_pool(len(chunks)) as executor:
+        for chunk_result in executor.map(_backtest_worker, [data_dir] * len(chunks), chunks, [rule] * len(chunks)):
+            per_symbol.update(chunk_result)
+
+    valid = [m for m in per_symbol.values() if 'error' not in m]
+    summary = {
+        'symbol_count': len(valid),
+        'median_total_return': float(np.median([m['total_return'] for m in valid])) if valid else None,
+        'median_buy_hold_return': float(np.median([m['buy_hold_return'] for m in valid])) if valid else None,
+        'beat_buy_hold': float(np.mean([m['total_return'] > m['buy_hold_return'] for m in valid])) if valid else None,
+        'median_max_drawdown': float(np.median([m['max_drawdown'] for m in valid])) if valid else None,
+        'total_trades': int(sum(m['trades'] for m in valid))
+    }
+    result = {
+        'rule': rule,
+        'version': version,
+        'elapsed_s': round(time.perf_counter() - start, 2),
+        'symbols': dict(sorted(per_symbol.items())),
+        'summary': summary
+    }
+    _cache_put(_universe_cache, key, result, _UNIVERSE_CACHE_SIZE)
+    logger.info(f"🧪 전체 백테스트 완료: {len(valid)}개 종목, {result['elapsed_s']}s")
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 시그널 백테스트")
+    parser.add_argument("--data-dir", default=os.path.join(parent_dir, "data"), help="신호 데이터 폴더")
+    parser.add_argument("--entry", default=DEFAULT_RULE['entry_signal'], choices=SIGNAL_COLUMNS, help="진입 시그널")
+    parser.add_argument("--exit-fcv", type=float, default=DEFAULT_RULE['exit_fcv_at_or_below'],
+                        help="FCV가 이 값 이하이면 청산")
+    parser.add_argument("--exit-signal", choices=SIGNAL_COLUMNS, help="값이 -1이면 청산할 시그널")
+    parser.add_argument("--fee-bps", type=float, default=0.0, help="편도 수수료 (bp)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    rule = {'entry_signal': args.entry, 'exit_fcv_at_or_below': args.exit_fcv,
+            'exit_signal': args.exit_signal, 'fee_bps': args.fee_bps}
+    result = run_universe_backtest(args.data_dir, rule, args.workers)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+    summary = result['summary']
+    print(f"규칙: {json.dumps(result['rule'], ensure_ascii=False)}")
+    print(f"{summary['symbol_count']}개 종목, {result['elapsed_s']}s, 총 거래 {summary['total_trades']}회")
+    if summary['symbol_count']:
+        print(f"수익률 중앙값 {summary['median_total_return']:.1%} (보유 전략 {summary['median_buy_hold_return']:.1%}), "
+              f"보유 전략 초과 비율 {summary['beat_buy_hold']:.0%}, MDD 중앙값 {summary['median_max_drawdown']:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""
+종목 카탈로그 - 데이터 manifest 기반 종목 목록, 카테고리, 페이지 나눔
+
+파일명에서 심볼을 되돌리는 매핑 표(예: 'GCF' → 'GC=F')는 종목이 늘 때마다
+손으로 고쳐야 하고 빠진 항목(PA=F, HG=F 등)은 잘못된 심볼이 됩니다. 대신 각
+데이터 파일의 첫 행에 기록된 'symbol'을 읽어 data/manifest.json에 저장하고,
+파일이 바뀐 경우에만 해당 항목을 다시 읽습니다.
+
+SymbolCatalog는 손으로 관리하는 카테고리(components/stock_data.py)와 manifest를
+합쳐 카테고리별 페이지 단위 조회를 제공하며, 데이터가 없는 카탈로그 항목과
+카탈로그에 없는 데이터 파일을 보고합니다. 카탈로그에 없는 종목은 'Other Data'
+카테고리로 노출됩니다.
+
+사용법 (데이터 배포 직후 manifest 갱신 및 커버리지 보고):
+    python -m utils.catalog
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.compression import DATA_EXTENSIONS, data_extension
+from utils.json_stream import _open_text, iter_rows
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = os.path.join(parent_dir, "data")
+MANIFEST_FILENAME = "manifest.json"
+OTHER_CATEGORY = "Other Data"
+PAGE_SIZE = 30
+
+_manifest_cache: Dict[str, Tuple[Tuple, Dict[str, Any]]] = {}
+_catalog_cache: Dict[Tuple, "SymbolCatalog"] = {}
+_cache_lock = threading.Lock()
+
+
+def _is_signal_file(filename: str) -> bool:
+    return filename.startswith("signals_") and data_extension(filename) is not None
+
+
+def _scan_signal_files(data_dir: str) -> Dict[str, Tuple[int, int]]:
+    """신호 파일 목록 {파일명: (크기, 수정시각 ns)}"""
+    files = {}
+    if not os.path.isdir(data_dir):
+        return files
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and _is_signal_file(entry.name):
+                stat = entry.stat()
+                files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def _read_file_symbol(path: str) -> Optional[str]:
+    """데이터 파일 첫 행의 심볼 (첫 청크만 압축 해제)"""
+    with _open_text(path) as f:
+        for row, _ in iter_rows(f):
+            return row.get('symbol')
+    return None
+
+
+def load_data_manifest(data_dir: str) -> Dict[str, Any]:
+    """
+    데이터 manifest 조회 (파일 목록이 바뀐 경우에만 바뀐 파일을 다시 읽고 저장)
+
+    Returns:
+        {'files': {파일명: {'symbol', 'size', 'mtime_ns'}}, 'symbols': {심볼: 로드할 파일명}, 'generated_at'}
+    """
+    data_dir = os.path.abspath(data_dir)
+    files = _scan_signal_files(data_dir)
+    signature = tuple(sorted((name, size, mtime) for name, (size, mtime) in files.items()))
+    with _cache_lock:
+        cached = _manifest_cache.get(data_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    manifest_path = os.path.join(data_dir, MANIFEST_FILENAME)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f).get('files', {})
+    except (OSError, ValueError):
+        previous = {}
+
+    changed = False
+    file_entries = {}
+    for name, (size, mtime) in sorted(files.items()):
+        entry = previous.get(name)
+        if not entry or entry.get('size') != size or entry.get('mtime_ns') != mtime:
+            try:
+                symbol = _read_file_symbol(os.path.join(data_dir, name))
+            except Exception as e:
+                logger.error(f"데이터 파일 심볼 읽기 실패: {name}, {e}")
+                continue
+            entry = {'symbol': symbol, 'size': size, 'mtime_ns': mtime}
+            changed = True
+        if entry.get('symbol'):
+            file_entries[name] = entry
+    changed = changed or set(previous) != set(file_entries)
+
+    # 같은 심볼의 파일이 여러 형식으로 있으면 클라이언트 로드 순서(DATA_EXTENSIONS)의 첫 파일
+    symbols = {}
+    for name, entry in sorted(file_entries.items(), key=lambda item: DATA_EXTENSIONS.index(data_extension(item[0]))):
+        symbols.setdefault(entry['symbol'], name)
+
+    manifest = {
+        'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'files': file_entries,
+        'symbols': dict(sorted(symbols.items()))
+    }
+    if changed:
+        tmp_path = f"{manifest_path}.tmp{os.getpid()}"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, manifest_path)
+            logger.info(f"🗂️ 데이터 manifest 갱신: {len(symbols)}개 종목")
+        except OSError as e:
+            # 읽기 전용 배포 환경에서는 메모리 manifest만 사용
+            logger.warning(f"데이터 manifest 저장 실패: {e}")
+
+    with _cache_lock:
+        _manifest_cache[data_dir] = (signature, manifest)
+    return manifest
+
+
+class SymbolCatalog:
+    """카테고리별 종목 목록 (데이터가 있는 종목만, 페이지 단위 조회)"""
+
+    def __init__(self, categories: Dict[str, Dict[str, str]], available_symbols):
+        """
+        Args:
+            categories: {카테고리: {표시 이름: 티커}}
+            available_symbols: 데이터 파일이 있는 티커
+        """
+        self.available = frozenset(available_symbols)
+        self._entries: Dict[str, List[Tuple[str, str]]] = {}
+        self.missing_data: List[Dict[str, str]] = []
+
+        catalogued = set()
+        for category, stocks in categories.items():
+            entries = []
+            for name, ticker in stocks.items():
+                catalogued.add(ticker)
+                if ticker in self.available:
+                    entries.append((name, ticker))
+                else:
+                    self.missing_data.append({'category': category, 'name': name, 'ticker': ticker})
+            if entries:
+                self._entries[category] = entries
+
+        self.uncatalogued = sorted(self.available - catalogued)
+        if self.uncatalogued:
+            self._entries[OTHER_CATEGORY] = [(ticker, ticker) for ticker in self.uncatalogued]
+
+        # 검색 인덱스 입력 형식 {카테고리: {이름: 티커}} (같은 객체를 재사용해 인덱스 캐시 적중)
+        self.as_categories = {category: dict(entries) for category, entries in self._entries.items()}
+        self.labels = {ticker: name for entries in self._entries.values() for name, ticker in entries}
+
+    def category_names(self) -> List[str]:
+        return list(self._entries)
+
+    def category_size(self, category: str) -> int:
+        return len(self._entries.get(category, []))
+
+    def page_count(self, category: str, page_size: int = PAGE_SIZE) -> int:
+        return max(1, -(-self.category_size(category) // page_size))
+
+    def page(self, category: str, page: int, page_size: int = PAGE_SIZE) -> List[Tuple[str, str]]:
+        """카테고리의 page번째(0부터) 페이지 [(표시 이름, 티커), ...]"""
+        page = min(max(page, 0), self.page_count(category, page_size) - 1)
+        return self._entries.get(category, [])[page * page_size:(page + 1) * page_size]
+
+    def coverage_report(self) -> Dict[str, Any]:
+        """카탈로그/데이터 커버리지 {'catalogued', 'available', 'missing_data', 'uncatalogued'}"""
+        return {
+            'catalogued': sum(len(entries) for category, entries in self._entries.items()
+                              if category != OTHER_CATEGORY) + len(self.missing_data),
+            'available': len(self.available),
+            'missing_data': list(self.missing_data),
+            'uncatalogued': list(self.uncatalogued)
+        }
+
+
+def get_catalog(data_dir: str, categories: Dict[str, Dict[str, str]]) -> SymbolCatalog:
+    """manifest와 카테고리로 만든 카탈로그 (프로세스 내 공유, 데이터 파일이 바뀔 때만 재생성)"""
+    manifest = load_data_manifest(data_dir)
+    key = (os.path.abspath(data_dir), id(categories), id(manifest))
+    with _cache_lock:
+        catalog = _catalog_cache.get(key)
+    if catalog is None:
+        catalog = SymbolCatalog(categories, manifest['symbols'])
+        with _cache_lock:
+            _catalog_cache.clear()
+            _catalog_cache[key] = catalog
+    return catalog
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 데이터 manifest 갱신 및 카탈로그 커버리지 보고")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="신호 데이터 폴더")
+    args = parser.parse_args(argv)
+
+    from components.stock_data import STOCK_CATEGORIES
+
+    catalog = get_catalog(args.data_dir, STOCK_CATEGORIES)
+    report = catalog.coverage_report()
+    print(f"데이터 종목 {report['available']}개, 카탈로그 항목 {report['catalogued']}개")
+    print(f"데이터 없는 카탈로그 항목 {len(report['missing_data'])}개:")
+    for item in report['missing_data']:
+        print(f"  {item['ticker']:<12} {item['category']} / {item['name']}")
+    print(f"카탈로그에 없는 데이터 종목 {len(report['uncatalogued'])}개:")
+    for ticker in report['uncatalogued']:
+        print(f"  {ticker}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
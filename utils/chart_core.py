@@ -0,0 +1,883 @@
+"""
+차트 코어 - Streamlit 없이 동작하는 데이터 가공 및 Figure 생성 로직
+
+세션 상태를 읽지 않고 명시적인 입력(데이터, 설정, 표시 플래그)만 받아
+데이터 구조와 plotly Figure를 반환합니다. Streamlit 화면 출력은
+components/chart.py 어댑터가 담당합니다.
+"""
+import plotly.graph_objects as go
+import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+
+from utils.disk_cache import get_disk_cache
+from utils.events import ALERT_RULES, EVENTS_VERSION, SIGNAL_BUCKETS, find_events, first_per_bucket
+from utils.indicators import INDICATOR_PRESETS, OVERLAY_INDICATORS, align_to_dates, get_indicator, resolve_indicator
+from utils.single_flight import SingleFlight
+from utils.snapshot_diff import get_symbol_diff
+from utils.trendlines import TRENDLINE_VERSION, get_trendlines
+
+logger = logging.getLogger(__name__)
+
+# 같은 화면을 동시에 요청하면 리샘플링/Figure 생성을 한 번만 실행
+_view_flight = SingleFlight()
+_figure_flight = SingleFlight()
+
+# 리샘플링/Figure 생성 코드가 바뀌면 올려서 디스크 캐시('views', 'figures')의 결과를 무효화
+# (뷰는 이벤트를, Figure는 이벤트와 추세선을 담으므로 각 모듈의 버전도 함께 반영)
+VIEW_CACHE_VERSION = (1, EVENTS_VERSION)
+FIGURE_CACHE_VERSION = (1, EVENTS_VERSION, TRENDLINE_VERSION)
+
+# 시간축별 차트 제목
+TIMEFRAME_NAMES = {
+    "daily": "Daily Chart",
+    "weekly": "Weekly Chart",
+    "monthly": "Monthly Chart"
+}
+
+
+# 앱 기본 조회 기간 (app.py render_step3_chart_display)
+DEFAULT_PERIOD = "3y"
+
+# 시간축별 기본 지표 그룹 및 시그널 (app.py indicator_groups 기준)
+TIMEFRAME_GROUPS = {
+    "daily": ("Short-term Analysis (Daily)", ["short_signal_v2", "macd_signal"]),
+    "weekly": ("Mid-term Analysis (Weekly)", ["short_signal_v1", "momentum_color_signal"]),
+    "monthly": ("Long-term Analysis (Monthly)", ["long_signal", "combined_signal_v1"])
+}
+
+
+def default_chart_settings(timeframe: str) -> Dict[str, Any]:
+    """시간축별 기본 차트 설정 (3단계 화면과 동일)"""
+    group_name, signals = TIMEFRAME_GROUPS[timeframe]
+    return {
+        'selected_signals': list(signals),
+        'show_buy_signals': True,
+        'show_sell_signals': True,
+        'show_trendlines': True,
+        'selected_indicators': [],
+        'selected_indicator_group': group_name
+    }
+
+
+def resolve_timeframe(settings: Optional[Dict[str, Any]]) -> str:
+    """선택된 지표 그룹에 따라 시간축 결정"""
+    timeframe = "daily"  # 기본값
+    if settings and settings.get('selected_indicator_group'):
+        indicator_group = settings['selected_indicator_group']
+        if "Short-term" in indicator_group:
+            timeframe = "daily"
+        elif "Mid-term" in indicator_group:
+            timeframe = "weekly"
+        elif "Long-term" in indicator_group:
+            timeframe = "monthly"
+    return timeframe
+
+
+# 시간축별 리샘플링 규칙 (금요일 종가 기준 주봉, 월말 기준 월봉 - pandas 2.2+ 'M' 폐기)
+RESAMPLE_RULES = {
+    "weekly": 'W-FRI',
+    "monthly": 'ME'
+}
+
+OHLC_AGGREGATION = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum'
+}
+
+
+def resample_data_to_timeframe(data: Dict[str, Any], timeframe: str) -> Dict[str, Any]:
+    """
+    데이터를 지정된 시간축으로 리샘플링
+    
+    Args:
+        data: 원본 데이터 (OHLCV + signals)
+        timeframe: 'daily', 'weekly', 'monthly'
+    
+    Returns:
+        리샘플링된 데이터
+    """
+    if timeframe == "daily":
+        return data
+    
+    # DataFrame 생성 - JSON 클라이언트 데이터 구조에 맞게 수정
+    stock_data = data.get('data', {})
+    df = pd.DataFrame({
+        'date': pd.to_datetime(data['dates']),
+        'open': stock_data.get('open', []),
+        'high': stock_data.get('high', []),
+        'low': stock_data.get('low', []),
+        'close': stock_data.get('close', []),
+        'volume': stock_data.get('volume', [])
+    })
+    df.set_index('date', inplace=True)
+    
+    # 시간축별 리샘플링 규칙
+    resample_rule = RESAMPLE_RULES.get(timeframe)
+    if resample_rule is None:
+        return data
+    
+    # OHLCV 리샘플링
+    resampled_df = df.resample(resample_rule).agg(OHLC_AGGREGATION).dropna()
+    
+    # 시그널을 리샘플링된 시간축에 매핑
+    original_signals = data.get('signals', {})
+    resampled_dates = resampled_df.index.strftime('%Y-%m-%d').tolist()
+    mapped_signals = map_signals_to_timeframe(original_signals, data['dates'], resampled_dates, timeframe)
+    
+    # FCV 값들도 리샘플링에 맞게 처리
+    resampled_indicators = {}
+    if data.get('indicators'):
+        for indicator_name, indicator_values in data['indicators'].items():
+            if indicator_name == 'Final_Composite_Value' and len(indicator_values) > 0:
+                # FCV는 주봉/월봉에서는 해당 기간의 마지막 값 사용
+                resampled_fcv = []
+                for i, resampled_date in enumerate(resampled_dates):
+                    # 해당 주/월에 해당하는 원본 FCV 값들 중 마지막 값 사용
+                    resampled_date_dt = pd.to_datetime(resampled_date)
+                    if timeframe == "weekly":
+                        week_start = resampled_date_dt - pd.Timedelta(days=6)
+                        week_end = resampled_date_dt
+                    elif timeframe == "monthly":
+                        week_start = resampled_date_dt.replace(day=1)
+                        week_end = resampled_date_dt
+                    else:
+                        week_start = week_end = resampled_date_dt
+                    
+                    # 해당 기간의 원본 데이터에서 FCV 값 찾기
+                    period_fcv_values = []
+                    for j, orig_date in enumerate(pd.to_datetime(data['dates'])):
+                        if week_start <= orig_date <= week_end and j < len(indicator_values):
+                            period_fcv_values.append(indicator_values[j])
+                    
+                    # 해당 기간의 마지막 FCV 값 사용
+                    if period_fcv_values:
+                        resampled_fcv.append(period_fcv_values[-1])
+                    else:
+                        resampled_fcv.append(0)
+                
+                resampled_indicators[indicator_name] = resampled_fcv
+            else:
+                resampled_indicators[indicator_name] = indicator_values
+    
+    # 리샘플링된 데이터로 변환 - JSON 클라이언트 구조에 맞게
+    resampled_data = {
+        'symbol': data['symbol'],
+        'dates': resampled_dates,
+        'data': {
+            'open': resampled_df['open'].tolist(),
+            'high': resampled_df['high'].tolist(),
+            'low': resampled_df['low'].tolist(),
+            'close': resampled_df['close'].tolist(),
+            'volume': resampled_df['volume'].tolist()
+        },
+        'signals': mapped_signals,  # 매핑된 시그널 사용
+        'indicators': resampled_indicators,  # 리샘플링된 지표 사용
+        'trendlines': [],  # 추세선은 리샘플링된 봉에서 다시 검출 (build_chart_view)
+        'events': find_events(mapped_signals, resampled_indicators.get('Final_Composite_Value')),
+        'last_updated': data.get('last_updated')
+    }
+    
+    return resampled_data
+
+
+def map_signals_to_timeframe(original_signals: Dict[str, List], original_dates: List[str], 
+                           resampled_dates: List[str], timeframe: str) -> Dict[str, List]:
+    """
+    원본 일봉 시그널을 리샘플링된 시간축에 매핑
+    
+    Args:
+        original_signals: 원본 시그널 데이터
+        original_dates: 원본 일봉 날짜들
+        resampled_dates: 리샘플링된 날짜들 (주봉/월봉)
+        timeframe: 'weekly' 또는 'monthly'
+    
+    Returns:
+        리샘플링된 시간축에 맞춰진 시그널 데이터
+    """
+    if timeframe == "daily":
+        return original_signals
+    
+    # 원본 날짜를 datetime으로 변환
+    original_dt = pd.to_datetime(original_dates)
+    resampled_dt = pd.to_datetime(resampled_dates)
+    
+    # 리샘플링된 시그널 초기화
+    mapped_signals = {}
+    for signal_name in original_signals.keys():
+        mapped_signals[signal_name] = [0] * len(resampled_dates)
+    
+    # 각 원본 날짜에 대해 해당하는 주봉/월봉 인덱스 찾기
+    for i, orig_date in enumerate(original_dt):
+        # 해당 날짜가 속하는 주봉/월봉 찾기
+        if timeframe == "weekly":
+            # 금요일 기준으로 해당 주 찾기
+            week_end = orig_date + pd.Timedelta(days=(4 - orig_date.weekday()) % 7)
+            try:
+                resampled_idx = resampled_dt.get_loc(week_end)
+            except KeyError:
+                # 정확한 날짜가 없으면 가장 가까운 날짜 찾기
+                closest_idx = resampled_dt.searchsorted(week_end)
+                if closest_idx > 0:
+                    resampled_idx = closest_idx - 1
+                else:
+                    continue
+        elif timeframe == "monthly":
+            # 해당 월의 마지막 날 찾기
+            month_end = orig_date + pd.offsets.MonthEnd(0)
+            try:
+                resampled_idx = resampled_dt.get_loc(month_end)
+            except KeyError:
+                # 정확한 날짜가 없으면 가장 가까운 날짜 찾기
+                closest_idx = resampled_dt.searchsorted(month_end)
+                if closest_idx > 0:
+                    resampled_idx = closest_idx - 1
+                else:
+                    continue
+        else:
+            continue
+        
+        # 해당 시그널 값들을 매핑
+        for signal_name, signal_values in original_signals.items():
+            if i < len(signal_values) and signal_values[i] != 0:
+                mapped_signals[signal_name][resampled_idx] = signal_values[i]
+    
+    return mapped_signals
+
+
+DEFAULT_DISPLAY_FLAGS = {
+    'show_local_dip': True,
+    'show_rebound_potential': True,
+    'show_rebound_alert': True,
+    'show_fcv_zones': True
+}
+
+# 시그널별 색깔 및 스타일 정의 (매수 신호: 가로 삼각형, 반전 신호: 세로 삼각형)
+SIGNAL_STYLES = {
+    'short_signal_v2': {
+        'buy': {'color': '#32CD32', 'size': 8, 'opacity': 0.8, 'line_width': 2, 'label': 'SHORT', 'symbol': 'circle'},
+        'sell': {'color': '#FF4444', 'size': 12, 'opacity': 0.8, 'line_width': 2, 'label': 'SHORT', 'symbol': 'triangle-left'}
+    },
+    'macd_signal': {
+        'buy': {'color': '#FF4444', 'size': 16, 'opacity': 0.95, 'line_width': 4, 'label': 'Rebound 가능성', 'symbol': 'circle'},
+        'sell': {'color': '#FF6666', 'size': 16, 'opacity': 0.85, 'line_width': 2, 'label': 'SHORT', 'symbol': 'triangle-down'}
+    },
+    'short_signal_v1': {
+        'buy': {'color': '#32CD32', 'size': 9, 'opacity': 0.8, 'line_width': 2, 'label': 'MID', 'symbol': 'circle'},
+        'sell': {'color': '#FF7777', 'size': 13, 'opacity': 0.8, 'line_width': 2, 'label': 'MID', 'symbol': 'triangle-left'}
+    },
+    'momentum_color_signal': {
+        'buy': {'color': '#FF4444', 'size': 18, 'opacity': 0.95, 'line_width': 4, 'label': 'Rebound 가능성', 'symbol': 'circle'},
+        'sell': {'color': '#FF8888', 'size': 17, 'opacity': 0.85, 'line_width': 2, 'label': 'MID', 'symbol': 'triangle-down'}
+    },
+    'long_signal': {
+        'buy': {'color': '#32CD32', 'size': 10, 'opacity': 0.8, 'line_width': 2, 'label': 'LONG', 'symbol': 'circle'},
+        'sell': {'color': '#FF9999', 'size': 14, 'opacity': 0.8, 'line_width': 2, 'label': 'LONG', 'symbol': 'triangle-left'}
+    },
+    'combined_signal_v1': {
+        'buy': {'color': '#FF4444', 'size': 17, 'opacity': 0.95, 'line_width': 4, 'label': 'Rebound 가능성', 'symbol': 'circle'},
+        'sell': {'color': '#FFAAAA', 'size': 15, 'opacity': 0.85, 'line_width': 2, 'label': 'LONG', 'symbol': 'triangle-down'}
+    }
+}
+DEFAULT_SIGNAL_STYLE = {
+    'buy': {'color': '#00FF00', 'size': 14, 'opacity': 0.8, 'line_width': 2, 'label': 'SIGNAL', 'symbol': 'triangle-up'},
+    'sell': {'color': '#FF0000', 'size': 14, 'opacity': 0.8, 'line_width': 2, 'label': 'SIGNAL', 'symbol': 'triangle-down'}
+}
+
+
+def view_events(signals_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    뷰의 시그널/FCV 이벤트 위치 (utils.events.find_events 형식)
+    
+    일봉 뷰는 get_signals_data가, 주봉/월봉 뷰는 리샘플링 시 채우며, 없으면(이전 형식의
+    캐시된 뷰) 봉 배열에서 계산합니다.
+    """
+    events = signals_data.get('events')
+    if events is None:
+        events = find_events(signals_data.get('signals') or {},
+                             (signals_data.get('indicators') or {}).get('Final_Composite_Value'))
+        signals_data['events'] = events
+    return events
+
+
+def compute_signal_markers(
+    signals_data: Dict[str, Any],
+    settings: Optional[Dict[str, Any]],
+    dates: pd.DatetimeIndex,
+    low_prices: List[float],
+    min_length: int,
+    display_flags: Dict[str, bool]
+) -> List[Dict[str, Any]]:
+    """
+    선택된 시그널의 매수 마커 및 Rebound Alert 위치 계산
+    
+    Args:
+        signals_data: 시간축에 맞춰진 신호 데이터
+        settings: 차트 표시 설정
+        dates: 차트 날짜 (min_length로 잘린 상태)
+        low_prices: 저가 리스트
+        min_length: 유효 데이터 길이
+        display_flags: 시그널 표시/숨김 플래그
+    
+    Returns:
+        시그널별 마커 정보 리스트 (signal_name, style, buy_points, alert_points)
+    """
+    markers = []
+    if not (settings and settings.get('selected_signals') and signals_data.get("signals")):
+        return markers
+    
+    signals = signals_data["signals"]
+    events = view_events(signals_data)
+    bar_dates = dates.values.astype('datetime64[D]')
+    show_buy_signals = settings.get('show_buy_signals', True)
+    
+    for signal_name in settings['selected_signals']:
+        if signal_name not in signals:
+            continue
+        signal_style = SIGNAL_STYLES.get(signal_name, DEFAULT_SIGNAL_STYLE)
+        
+        # 매수 신호 표시 (인덱스 오류 방지) - FCV 제외
+        # 체크박스 상태 확인
+        should_show_signal = True
+        if signal_name in ['short_signal_v2', 'short_signal_v1', 'long_signal']:
+            should_show_signal = display_flags.get('show_local_dip', True)
+        elif signal_name in ['macd_signal', 'momentum_color_signal', 'combined_signal_v1']:
+            should_show_signal = display_flags.get('show_rebound_potential', True)
+        
+        if not (show_buy_signals and signal_name != 'fcv_signal' and should_show_signal):
+            continue
+        
+        # 발생 위치는 이벤트 인덱스에서 조회 (봉 전체를 훑지 않음)
+        # 표시 간격이 지정된 시그널(주봉 기준 신호 등)은 구간마다 첫 번째만 표시
+        bucket = SIGNAL_BUCKETS.get(signal_name)
+        positions = [i for i in events['signals'].get(signal_name, []) if i < min_length]
+        if bucket:
+            positions = first_per_bucket(positions, bar_dates, bucket)
+        offset = 0.99 if bucket else 0.97  # 구간별 첫 신호는 봉에 더 가깝게 표시
+        buy_signals = [(dates[i], low_prices[i] * offset) for i in positions]
+        
+        # 반전 시그널에 대한 BUY! 텍스트 표시
+        # (같은 그룹 매수 시그널이 직전 20/50봉 안에 있는 위치 - utils.events.ALERT_RULES)
+        buy_text_signals = []
+        if signal_name in ALERT_RULES:
+            alert_positions = [i for i in events['alerts'].get(signal_name, []) if i < min_length]
+            if bucket:
+                alert_positions = first_per_bucket(alert_positions, bar_dates, bucket)
+            buy_text_signals = [(dates[i], low_prices[i] * 0.95) for i in alert_positions]  # 위치 올림
+        
+        # Rebound Alert 체크박스 상태 확인
+        if not display_flags.get('show_rebound_alert', True):
+            buy_text_signals = []
+        
+        markers.append({
+            'signal_name': signal_name,
+            'style': signal_style,
+            'buy_points': buy_signals,
+            'alert_points': buy_text_signals
+        })
+        
+        # 매도 신호 표시 (인덱스 오류 방지) - 일시적으로 비활성화
+        # if show_sell_signals:
+        #     sell_signals = []
+        #     for i, signal in enumerate(signal_values):
+        #         if i < min_length and signal == -1:  # 인덱스 범위 체크
+        #             sell_signals.append((dates[i], high_prices[i] * 1.02))
+    
+    return markers
+
+def build_candlestick_figure(
+    signals_data: Dict[str, Any],
+    settings: Optional[Dict[str, Any]],
+    display_flags: Dict[str, bool]
+) -> Optional[Tuple[go.Figure, bool, bool]]:
+    """
+    캔들스틱 Figure 생성 (Streamlit 출력 없음)
+    
+    Returns:
+        (fig, fcv_has_green, fcv_has_red) 튜플, 데이터가 없으면 None
+    """
+    # 데이터 추출
+    dates = pd.to_datetime(signals_data["dates"])
+    open_prices = signals_data["data"]["open"]
+    high_prices = signals_data["data"]["high"]
+    low_prices = signals_data["data"]["low"]
+    close_prices = signals_data["data"]["close"]
+    
+    # 데이터 길이 검증 및 정렬 (인덱스 오류 방지)
+    min_length = min(len(dates), len(open_prices), len(high_prices), len(low_prices), len(close_prices))
+    if min_length == 0:
+        return None
+        
+    # 모든 데이터를 동일한 길이로 맞춤
+    dates = dates[:min_length]
+    open_prices = open_prices[:min_length]
+    high_prices = high_prices[:min_length]
+    low_prices = low_prices[:min_length]
+    close_prices = close_prices[:min_length]
+    
+    # 단일 차트 생성 (FCV 서브차트 제거) - 최적화된 설정
+    fig = go.Figure()
+    
+    # 캔들스틱 차트 (메인 차트) - 최적화된 설정
+    fig.add_trace(
+        go.Candlestick(
+            x=dates,
+            open=open_prices,
+            high=high_prices,
+            low=low_prices,
+            close=close_prices,
+            name="주가",
+            increasing_line_color='red',
+            decreasing_line_color='blue',
+            # 성능 최적화 설정
+            hovertext=[f'Date: {date}<br>Open: {open}<br>High: {high}<br>Low: {low}<br>Close: {close}' 
+                      for date, open, high, low, close in zip(dates, open_prices, high_prices, low_prices, close_prices)],
+            showlegend=False,  # 개별 범례 비활성화
+            visible=True  # 기본 표시
+        )
+    )
+    
+    # 추세선 추가 (JSON 데이터에서 읽어오기)
+    if signals_data.get("trendlines") and (settings or {}).get('show_trendlines', True):
+        trendlines = signals_data["trendlines"]
+        for trendline in trendlines:
+            points = trendline.get("points", [])
+            if len(points) >= 2:
+                trendline_dates = [pd.to_datetime(p["date"]) for p in points]
+                trendline_prices = [p["price"] for p in points]
+                
+                fig.add_trace(
+                    go.Scatter(
+                        x=trendline_dates,
+                        y=trendline_prices,
+                        name=trendline["name"],
+                        line=dict(
+                            color=trendline["color"],
+                            width=2,
+                            dash="dash"
+                        ),
+                        mode="lines"
+                    )
+                )
+    
+    # 시그널 표시 (원본 코드와 정확히 동일 + 색깔 구분)
+    markers = compute_signal_markers(signals_data, settings, dates, low_prices, min_length, display_flags)
+    for marker in markers:
+        signal_style = marker['style']
+        
+        # BUY! 텍스트 표시 (테두리가 있는 네모 칸)
+        # 텍스트 박스를 위한 annotation 사용 (위치 아래로 + 선 연결)
+        for date, price in marker['alert_points']:
+            # Rebound Alert 텍스트 박스 (아래쪽에 배치)
+            fig.add_annotation(
+                x=date,
+                y=price - 1,  # 위치를 아래로 이동
+                text="Rebound Alert 🚀",
+                showarrow=True,  # 화살표 표시
+                arrowhead=2,
+                arrowcolor='red',
+                arrowwidth=2,
+                ax=0,  # 화살표 X 방향 (수직)
+                ay=60,  # 화살표 Y 방향 (위쪽으로) - 2배로 늘림
+                font=dict(
+                    color='white',
+                    size=12,
+                    family='Arial Black'
+                ),
+                bgcolor='red',
+                bordercolor='darkred',
+                borderwidth=2,
+                borderpad=4,
+                xref='x',
+                yref='y'
+            )
+        
+        if marker['buy_points']:
+            buy_dates, buy_prices = zip(*marker['buy_points'])
+            
+            # 매수 신호 표시 (가로 삼각형) - 최적화된 설정
+            fig.add_trace(
+                go.Scattergl( # WebGL 기반 렌더링으로 변경
+                    x=buy_dates,
+                    y=buy_prices,
+                    mode='markers',
+                    marker=dict(
+                        symbol=signal_style['buy']['symbol'],
+                        size=signal_style['buy']['size'],
+                        color=signal_style['buy']['color'],
+                        opacity=signal_style['buy']['opacity'],
+                        line=dict(width=signal_style['buy']['line_width'], color='darkgreen' if signal_style['buy']['color'] in ['#32CD32', '#00FFFF'] else 'darkred')
+                    ),
+                    name=f'{signal_style["buy"]["label"]} BUY',
+                    # 성능 최적화 설정
+                    hovertext=[f'Date: {date}<br>Price: {price}<br>Signal: BUY' 
+                              for date, price in zip(buy_dates, buy_prices)],
+                    showlegend=False,  # 개별 범례 비활성화
+                    visible=True  # 기본 표시
+                )
+            )
+    
+    # FCV 배경 색칠 (단기중기장기 무관하게 배경에 색칠) - FCV Zones 체크박스 상태 확인
+    fcv_has_green = False
+    fcv_has_red = False
+    
+    if display_flags.get('show_fcv_zones', True):
+        # FCV >= 0.5: 녹색 배경, FCV <= -0.5: 빨간색 배경 (연속 구간마다 사각형 하나)
+        fcv_runs = view_events(signals_data)['fcv_runs']
+        for zone, fillcolor in (('green', "rgba(0, 255, 0, 0.1)"), ('red', "rgba(255, 0, 0, 0.1)")):
+            for start, end in fcv_runs.get(zone, []):
+                if start >= min_length:
+                    continue
+                end = min(end, min_length - 1)
+                if zone == 'green':
+                    fcv_has_green = True
+                else:
+                    fcv_has_red = True
+                fig.add_shape(
+                    type="rect",
+                    x0=dates[start], x1=dates[end+1] if end+1 < len(dates) else dates[end],
+                    y0=0, y1=1,
+                    yref="paper",
+                    fillcolor=fillcolor,
+                    line=dict(width=0)
+                )
+    
+    # 차트 레이아웃 설정 (모바일 최적화 - 가로 스크롤)
+    fig.update_layout(
+        title="",  # 제목 제거
+        xaxis_rangeslider_visible=False,
+        height=450,  # 차트 높이 확대
+        width=None,  # 전체 화면 사용
+        showlegend=False,  # 기본 범례 비활성화 (동적 범례 사용)
+        template="plotly_white",
+        margin=dict(l=2, r=2, t=15, b=2),  # 여백 원래대로
+        font=dict(size=9, color='black'),  # 폰트 크기 확대 및 색상 진하게
+        plot_bgcolor='#dee2e6',  # 더욱 어두운 회색 배경
+        paper_bgcolor='#dee2e6',  # 더욱 어두운 회색 배경
+        # 모바일 가로 스크롤 활성화
+        dragmode='pan',
+        hovermode=False,  # 호버 툴팁 완전 비활성화
+        # 범례 제거 (Streamlit으로 별도 표시)
+        annotations=[],
+        # 가로 스크롤 설정
+        xaxis=dict(
+            fixedrange=False,  # X축 스크롤 허용
+            showspikes=False,  # 스파이크 제거
+            spikemode='across',
+            spikecolor='grey',
+            spikesnap='cursor',
+            spikethickness=1,
+            # 가로 스크롤 범위 설정
+            rangeslider=dict(visible=False),
+            autorange=True,
+            spikedash='dot',
+            # 눈금 글자 설정
+            tickfont=dict(size=11, color='black'),
+            title=dict(font=dict(size=12, color='black'))
+        ),
+        yaxis=dict(
+            fixedrange=False,  # Y축 스크롤 허용 (자동 범위 조정)
+            showspikes=False,  # 스파이크 제거
+            spikemode='across',
+            spikecolor='grey',
+            spikesnap='cursor',
+            spikethickness=1,
+            spikedash='dot',
+            # 눈금 글자 설정
+            tickfont=dict(size=11, color='black'),
+            title=dict(font=dict(size=12, color='black'))
+        )
+    )
+    
+    # Y축 설정 (제목 제거로 공간 확보 + 인터랙티브 제한)
+    fig.update_yaxes(
+        title_text="", 
+        fixedrange=True,  # Y축 패닝(드래그 이동) 방지
+        showspikes=False
+    )
+
+    # X축에만 줌/팬이 가능하도록 명시적으로 설정
+    fig.update_xaxes(constrain='domain')
+    fig.update_yaxes(constrain='domain')
+    
+    return fig, fcv_has_green, fcv_has_red
+
+
+# 지표 패널 (RSI/MACD/ATR) 높이 비율과 패널당 추가 차트 높이
+INDICATOR_PANEL_HEIGHT = 0.2
+INDICATOR_PANEL_GAP = 0.03
+INDICATOR_PANEL_PIXELS = 130
+
+
+def _indicator_inputs(client, symbol: str, timeframe: str) -> Optional[Dict[str, np.ndarray]]:
+    """지표 입력 - 전체 기간 OHLC (주봉/월봉은 차트와 같은 규칙으로 컬럼을 바로 리샘플링)"""
+    columns = client.get_columns(symbol)
+    if columns is None:
+        return None
+    names = ('open', 'high', 'low', 'close')
+    if timeframe not in RESAMPLE_RULES:
+        return {name: columns[name] for name in ('dates',) + names}
+    df = pd.DataFrame({name: columns[name] for name in names}, index=pd.DatetimeIndex(columns['dates']))
+    resampled = df.resample(RESAMPLE_RULES[timeframe]).agg({name: OHLC_AGGREGATION[name] for name in names}).dropna()
+    inputs = {'dates': resampled.index.values.astype('datetime64[D]')}
+    for name in names:
+        inputs[name] = resampled[name].to_numpy(dtype=np.float64)
+    return inputs
+
+
+def add_indicator_overlays(fig: go.Figure, client, symbol: str, timeframe: str, view_dates: List[str],
+                           specs: List[Any]):
+    """
+    선택된 기술적 지표를 차트에 추가
+
+    이동평균/볼린저 밴드는 가격 차트 위에, RSI/MACD/ATR은 아래 패널에 그립니다.
+    지표는 전체 기간에서 계산하므로 화면 시작 부분도 값이 채워져 있습니다.
+    """
+    valid_specs = []
+    for spec in specs:
+        try:
+            resolve_indicator(spec)
+            valid_specs.append(spec)
+        except ValueError as e:
+            logger.warning(f"⚠️ 지표 건너뜀: {e}")
+    specs = valid_specs
+    
+    series_key = (os.path.abspath(client.data_dir), symbol, timeframe)
+    version = client.get_data_version(symbol)
+    dates = np.array(view_dates, dtype='datetime64[D]')
+    x = pd.to_datetime(view_dates)
+    panels = [spec for spec in specs if resolve_indicator(spec)[0] not in OVERLAY_INDICATORS]
+
+    for spec in specs:
+        name, params = resolve_indicator(spec)
+        result = get_indicator(series_key, version, spec,
+                               lambda: _indicator_inputs(client, symbol, timeframe))
+        if result is None:
+            continue
+        values = align_to_dates(result, dates)
+        preset = INDICATOR_PRESETS.get(spec, {}) if isinstance(spec, str) else {}
+        color = preset.get('color', '#555555')
+        label = preset.get('label', name.upper())
+        if name in OVERLAY_INDICATORS:
+            for key, series in values.items():
+                fig.add_trace(go.Scatter(
+                    x=x, y=series, mode='lines', name=f"{label} {key}" if len(values) > 1 else label,
+                    line=dict(color=color, width=1 if key != 'middle' else 1.5,
+                              dash='dot' if key in ('upper', 'lower') else 'solid'),
+                    showlegend=False, hoverinfo='skip'
+                ))
+            continue
+
+        axis = f"y{panels.index(spec) + 2}"
+        if name == 'macd':
+            fig.add_trace(go.Bar(x=x, y=values['histogram'], name=f"{label} histogram", yaxis=axis,
+                                 marker_color=np.where(np.nan_to_num(values['histogram']) >= 0, '#26A69A', '#EF5350'),
+                                 showlegend=False, hoverinfo='skip'))
+            fig.add_trace(go.Scatter(x=x, y=values['macd'], mode='lines', name=label, yaxis=axis,
+                                     line=dict(color=color, width=1.2), showlegend=False, hoverinfo='skip'))
+            fig.add_trace(go.Scatter(x=x, y=values['signal'], mode='lines', name=f"{label} signal", yaxis=axis,
+                                     line=dict(color='#FF8C00', width=1), showlegend=False, hoverinfo='skip'))
+        else:
+            series = values[name]
+            fig.add_trace(go.Scatter(x=x, y=series, mode='lines', name=label, yaxis=axis,
+                                     line=dict(color=color, width=1.2), showlegend=False, hoverinfo='skip'))
+            if name == 'rsi':
+                for level in (30, 70):
+                    fig.add_shape(type="line", xref="paper", x0=0, x1=1, yref=axis, y0=level, y1=level,
+                                  line=dict(color="grey", width=1, dash="dash"))
+
+    if panels:
+        _layout_indicator_panels(fig, panels)
+
+
+def _layout_indicator_panels(fig: go.Figure, panels: List[Any]):
+    """가격 차트 아래에 지표 패널 배치 (배경 FCV 구간은 가격 차트 영역으로 제한)"""
+    step = INDICATOR_PANEL_HEIGHT + INDICATOR_PANEL_GAP
+    price_bottom = len(panels) * step
+    layout = {
+        'height': (fig.layout.height or 450) + INDICATOR_PANEL_PIXELS * len(panels),
+        'yaxis': dict(domain=[price_bottom, 1]),
+        'xaxis': dict(anchor=f"y{len(panels) + 1}")
+    }
+    for index, spec in enumerate(panels):
+        top = price_bottom - INDICATOR_PANEL_GAP - index * step
+        preset = INDICATOR_PRESETS.get(spec, {}) if isinstance(spec, str) else {}
+        layout[f"yaxis{index + 2}"] = dict(
+            domain=[max(top - INDICATOR_PANEL_HEIGHT, 0), top], anchor='x', fixedrange=True, showspikes=False,
+            title=dict(text=preset.get('label', resolve_indicator(spec)[0].upper()), font=dict(size=10)),
+            tickfont=dict(size=10, color='black')
+        )
+    fig.update_layout(**layout)
+    fig.update_shapes(y0=price_bottom, selector=dict(yref='paper'))
+
+
+# 스냅샷 비교 마커 (utils.snapshot_diff 변경 종류별)
+SNAPSHOT_MARKERS = {
+    'added': {'kinds': ('new', 'added'), 'symbol': 'star', 'color': '#FFD700', 'line': '#B8860B',
+              'label': 'New signal'},
+    'removed': {'kinds': ('removed', 'dropped'), 'symbol': 'x', 'color': '#555555', 'line': '#333333',
+                'label': 'Removed signal'},
+}
+
+
+def _snapshot_positions(view_dates: np.ndarray, event_dates: List[str], timeframe: str) -> np.ndarray:
+    """변경 날짜가 속한 차트 봉 위치 (주봉/월봉은 날짜를 포함하는 기간의 봉)"""
+    events = np.array(event_dates, dtype='datetime64[D]')
+    positions = np.searchsorted(view_dates, events, side='left')
+    inside = positions < len(view_dates)
+    positions, events = positions[inside], events[inside]
+    rule = RESAMPLE_RULES.get(timeframe)
+    if rule is None:
+        return np.unique(positions[view_dates[positions] == events])
+    # 리샘플링 봉 날짜는 기간 끝 - 첫 봉은 이전 기간 끝 이후의 날짜만 포함
+    first_period_start = np.datetime64((pd.Timestamp(view_dates[0]) - pd.tseries.frequencies.to_offset(rule)).date())
+    return np.unique(positions[(positions > 0) | (events > first_period_start)])
+
+
+def add_snapshot_overlay(fig: go.Figure, client, symbol: str, timeframe: str, view: Dict[str, Any],
+                         snapshot: str, signal_names: List[str]):
+    """
+    이전 데이터 스냅샷(data/<스냅샷>) 대비 생기거나 사라진 시그널을 봉 위에 표시
+
+    Args:
+        snapshot: 데이터 폴더 아래 스냅샷 폴더 이름 (utils.snapshot_diff.list_snapshots)
+        signal_names: 비교할 시그널 (차트에 표시 중인 시그널)
+    """
+    if not snapshot or os.path.basename(snapshot) != snapshot:
+        return
+    diff = get_symbol_diff(os.path.join(client.data_dir, snapshot), client.data_dir, symbol)
+    if diff is None:
+        return
+    view_dates = np.array(view['dates'], dtype='datetime64[D]')
+    high = np.asarray(view['data']['high'], dtype=np.float64)
+    for marker in SNAPSHOT_MARKERS.values():
+        event_dates = [date for name in signal_names for kind in marker['kinds']
+                       for date in diff['signals'].get(name, {}).get(kind, [])]
+        positions = _snapshot_positions(view_dates, event_dates, timeframe)
+        if len(positions) == 0:
+            continue
+        fig.add_trace(go.Scatter(
+            x=pd.to_datetime(view_dates[positions]), y=high[positions] * 1.03, mode='markers',
+            marker=dict(symbol=marker['symbol'], size=11, color=marker['color'],
+                        line=dict(width=1, color=marker['line'])),
+            name=f"{marker['label']} (vs {snapshot})", showlegend=False, hoverinfo='skip'
+        ))
+
+
+def chart_settings_key(settings: Optional[Dict[str, Any]], display_flags: Optional[Dict[str, bool]]) -> str:
+    """차트 설정/표시 플래그 식별자 (같은 화면이면 같은 값)"""
+    flags = dict(DEFAULT_DISPLAY_FLAGS, **(display_flags or {}))
+    payload = json.dumps({'settings': settings or {}, 'flags': flags}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+
+def _view_key(client, symbol: str, period: str, timeframe: str) -> Tuple:
+    """리샘플링 결과 식별 키 (데이터 버전 포함)"""
+    return (os.path.abspath(client.data_dir), symbol, period, timeframe, client.get_data_version(symbol))
+
+
+def build_chart_view(client, symbol: str, period: str, timeframe: str) -> Dict[str, Any]:
+    """
+    종목 데이터를 로드하여 시간축에 맞게 리샘플링
+    
+    Args:
+        client: InvestSmartJSONClient 인스턴스
+        symbol: 종목 심볼
+        period: 조회 기간
+        timeframe: 'daily', 'weekly', 'monthly'
+    
+    Returns:
+        시간축에 맞춰진 신호 데이터 (오류 시 'error' 키 포함)
+    """
+    key = _view_key(client, symbol, period, timeframe)
+    return _view_flight.do(key, _build_chart_view, client, symbol, period, timeframe)
+
+
+def _build_chart_view(client, symbol: str, period: str, timeframe: str) -> Dict[str, Any]:
+    # 주봉/월봉 리샘플링 결과는 영구 디스크 캐시에서 재사용 (키에 데이터 버전·코드 버전 포함)
+    cache = get_disk_cache() if timeframe != "daily" else None
+    version = client.get_data_version(symbol)
+    cache_key = (symbol, period, timeframe, version, VIEW_CACHE_VERSION)
+    view = cache.get_json('views', cache_key) if cache is not None and version is not None else None
+    if view is None:
+        signals_data = client.get_signals_data(symbol, period)
+        if signals_data.get('error') or not signals_data.get('dates') or timeframe == "daily":
+            return signals_data  # 일봉 추세선은 get_signals_data가 채움
+        view = resample_data_to_timeframe(signals_data, timeframe)
+        # 로드 중 데이터 파일이 바뀌었으면 새 버전 키로 저장하지 않음
+        if cache is not None and version is not None and signals_data.get('data_version') == version:
+            cache.put_json('views', cache_key, view)
+
+    # 주봉/월봉 추세선은 리샘플링된 봉에서 검출 (결과는 추세선 캐시에서 조회)
+    inputs = {'dates': view['dates'], 'high': view['data']['high'], 'low': view['data']['low'],
+              'close': view['data']['close']}
+    view['trendlines'] = get_trendlines(symbol, period, timeframe, version, inputs)
+    return view
+
+
+def build_chart(
+    client,
+    symbol: str,
+    period: str,
+    settings: Optional[Dict[str, Any]] = None,
+    display_flags: Optional[Dict[str, bool]] = None
+) -> Dict[str, Any]:
+    """
+    차트 핫패스 전체 실행 (로드 → 리샘플링 → Figure 생성)
+    
+    Returns:
+        {'symbol', 'timeframe', 'data', 'figure', 'fcv_has_green', 'fcv_has_red', 'error'}
+    """
+    timeframe = resolve_timeframe(settings)
+    key = _view_key(client, symbol, period, timeframe) + (chart_settings_key(settings, display_flags),)
+    return _figure_flight.do(key, _build_chart, client, symbol, period, settings, display_flags)
+
+
+def _build_chart(
+    client,
+    symbol: str,
+    period: str,
+    settings: Optional[Dict[str, Any]],
+    display_flags: Optional[Dict[str, bool]]
+) -> Dict[str, Any]:
+    timeframe = resolve_timeframe(settings)
+    flags = dict(DEFAULT_DISPLAY_FLAGS, **(display_flags or {}))
+    view = build_chart_view(client, symbol, period, timeframe)
+    result = {
+        'symbol': view.get('symbol', symbol),
+        'timeframe': timeframe,
+        'data': view,
+        'figure': None,
+        'fcv_has_green': False,
+        'fcv_has_red': False,
+        'error': view.get('error')
+    }
+    if result['error'] or not view.get('dates'):
+        result['error'] = result['error'] or '데이터를 찾을 수 없습니다'
+        return result
+    
+    built = build_candlestick_figure(view, settings, flags)
+    if built is None:
+        result['error'] = '데이터가 없습니다.'
+        return result
+    result['figure'], result['fcv_has_green'], result['fcv_has_red'] = built
+    
+    # 선택된 기술적 지표 겹쳐 그리기
+    selected_indicators = (settings or {}).get('selected_indicators') or []
+    if selected_indicators:
+        add_indicator_overlays(result['figure'], client, symbol, timeframe, view['dates'], selected_indicators)
+    
+    # 이전 데이터 스냅샷 대비 시그널 변경 표시
+    compare_snapshot = (settings or {}).get('compare_snapshot')
+    if compare_snapshot:
+        add_snapshot_overlay(result['figure'], client, symbol, timeframe, view, compare_snapshot,
+                             (settings or {}).get('selected_signals') or [])
+    return result
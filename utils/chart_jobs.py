@@ -0,0 +1,111 @@
+"""
+차트 백그라운드 작업 - 데이터 로드/리샘플링/Figure 생성을 스크립트 스레드 밖에서 실행
+
+(종목, 기간, 시간축, 차트 설정)마다 하나의 Future를 만들고, 같은 요청이 동시에
+들어오면 새 작업을 만들지 않고 진행 중인 Future를 함께 기다립니다. 완료된 Future는
+최근 결과 캐시 역할도 하므로 같은 화면을 다시 그릴 때는 즉시 결과를 돌려줍니다.
+멀티 프로세스 실행(utils.serve)에서는 다른 워커가 만든 Figure를 공유 저장소에서, 재시작 후에는
+이전 실행이 만든 Figure를 디스크 캐시(utils.disk_cache)에서 가져옵니다.
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import plotly.io as pio
+
+from utils.chart_core import FIGURE_CACHE_VERSION, build_chart, chart_settings_key, resolve_timeframe
+from utils.disk_cache import get_disk_cache
+from utils.shared_store import get_shared_dir, load_figure, store_figure
+
+logger = logging.getLogger(__name__)
+
+# 차트 작업 스레드 수 (Figure 생성은 대부분 numpy/pandas 연산)
+CHART_WORKERS = min(4, os.cpu_count() or 1)
+
+# 보관할 Future 수 (진행 중 + 최근 완료)
+_MAX_FUTURES = 64
+
+_executor = ThreadPoolExecutor(max_workers=CHART_WORKERS, thread_name_prefix="chart")
+_futures: "OrderedDict[Tuple, Future]" = OrderedDict()
+_futures_lock = threading.Lock()
+
+
+def chart_job_key(client, symbol: str, period: str, settings: Optional[Dict[str, Any]] = None,
+                  display_flags: Optional[Dict[str, bool]] = None) -> Tuple:
+    """차트 작업 키 (데이터 버전·Figure 코드 버전 포함 - 재배포되면 새 작업)"""
+    return (
+        os.path.abspath(client.data_dir), symbol, period, resolve_timeframe(settings),
+        client.get_data_version(symbol), chart_settings_key(settings, display_flags), FIGURE_CACHE_VERSION
+    )
+
+
+def submit_chart(client, symbol: str, period: str, settings: Optional[Dict[str, Any]] = None,
+                 display_flags: Optional[Dict[str, bool]] = None) -> Future:
+    """
+    차트 생성 작업 제출 (동일 요청은 진행 중/완료된 Future 재사용)
+
+    Returns:
+        utils.chart_core.build_chart 결과를 담을 Future
+    """
+    key = chart_job_key(client, symbol, period, settings, display_flags)
+    with _futures_lock:
+        future = _futures.get(key)
+        if future is not None and not (future.done() and future.exception() is not None):
+            _futures.move_to_end(key)
+            return future
+
+        future = _executor.submit(_run_chart_job, key, client, symbol, period, settings, display_flags)
+        _futures[key] = future
+        # 오래된 완료 작업부터 정리 (진행 중인 작업은 유지)
+        for old_key in list(_futures):
+            if len(_futures) <= _MAX_FUTURES:
+                break
+            if _futures[old_key].done():
+                del _futures[old_key]
+    logger.info(f"🧵 차트 작업 시작: {symbol} {key[3]}")
+    return future
+
+
+def _run_chart_job(key: Tuple, client, symbol: str, period: str, settings: Optional[Dict[str, Any]],
+                   display_flags: Optional[Dict[str, bool]]) -> Dict[str, Any]:
+    """차트 생성 (공유 저장소 또는 디스크 캐시에 같은 키의 Figure가 있으면 생성 생략)"""
+    shared_dir = get_shared_dir()
+    cache = get_disk_cache()
+    cache_key = key[1:]  # 데이터 폴더 경로 제외 (버전 해시가 내용을 식별)
+    if not shared_dir and cache is None:
+        return build_chart(client, symbol, period, settings, display_flags)
+
+    stored = load_figure(shared_dir, key) if shared_dir else None
+    if stored is None and cache is not None and key[4] is not None:
+        stored = cache.get_json('figures', cache_key)
+    if stored is not None:
+        logger.info(f"🔗 저장된 Figure 사용: {symbol} {key[3]}")
+        return {
+            'symbol': symbol,
+            'timeframe': key[3],
+            'data': None,
+            'figure': pio.from_json(stored['figure_json']),
+            'fcv_has_green': stored['fcv_has_green'],
+            'fcv_has_red': stored['fcv_has_red'],
+            'error': None
+        }
+
+    chart = build_chart(client, symbol, period, settings, display_flags)
+    if not chart['error'] and chart['figure'] is not None:
+        figure_json = chart['figure'].to_json()
+        if shared_dir:
+            store_figure(shared_dir, key, figure_json, chart['fcv_has_green'], chart['fcv_has_red'])
+        if cache is not None and key[4] is not None:
+            cache.put_json('figures', cache_key, {'figure_json': figure_json, 'fcv_has_green': chart['fcv_has_green'],
+                                                  'fcv_has_red': chart['fcv_has_red']})
+    return chart
+
+
+def get_chart_job_stats() -> Dict[str, int]:
+    """진행 중/완료된 차트 작업 수"""
+    with _futures_lock:
+        running = sum(1 for future in _futures.values() if not future.done())
+        return {'running': running, 'completed': len(_futures) - running}
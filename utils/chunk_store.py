@@ -0,0 +1,226 @@
+"""
+연도별 청크 저장소 - 최근 구간만 디스크에서 읽기 위한 데이터 레이아웃
+
+signals_*.json.gz는 항상 2020년부터 전체를 읽어야 하므로, 데이터 배포 후
+종목별 데이터를 연도 단위 numpy 청크로 나눠 저장하고 청크별 날짜 범위를
+index.json에 기록합니다. 클라이언트는 요청 기간을 덮는 청크만 읽으므로 첫 차트
+표시 시간이 전체 히스토리 길이와 무관해집니다. 원본 JSON이 기준 데이터이며,
+청크가 없거나 원본보다 오래되면(source_version 불일치) 클라이언트는 원본을 읽습니다.
+
+    data/chunks/<종목>/index.json   {'symbol', 'source_version', 'last_updated', 'rows', 'chunks': [...], 'events'}
+    data/chunks/<종목>/2020.npz ...
+    data/chunks/<종목>/events.npz   전체 기간 시그널/FCV 이벤트 (utils.events)
+
+사용법 (데이터 배포 직후 실행):
+    python -m utils.chunk_store
+    python -m utils.chunk_store --symbols AAPL ^KS11
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.events import EVENTS_VERSION, build_event_arrays
+from utils.json_stream import load_columns
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = os.path.join(parent_dir, "data")
+CHUNKS_DIRNAME = "chunks"
+INDEX_FILENAME = "index.json"
+EVENTS_FILENAME = "events.npz"
+
+_index_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_index_lock = threading.Lock()
+
+
+def get_chunk_dir(data_dir: str, symbol: str) -> str:
+    """종목별 청크 폴더 경로"""
+    safe_symbol = symbol.replace('^', '').replace('=', '').replace('/', '_')
+    return os.path.join(data_dir, CHUNKS_DIRNAME, safe_symbol)
+
+
+def build_symbol_chunks(client, symbol: str) -> Optional[Dict[str, Any]]:
+    """
+    한 종목의 원본 데이터를 연도별 청크로 저장
+
+    Returns:
+        저장한 index 딕셔너리 (데이터가 없으면 None)
+    """
+    file_path = client._get_symbol_path(symbol)
+    if file_path is None:
+        return None
+    columns, meta = load_columns(file_path)
+    if len(columns['dates']) == 0:
+        return None
+
+    chunk_dir = get_chunk_dir(client.data_dir, symbol)
+    tmp_dir = f"{chunk_dir}.tmp{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    # 날짜 오름차순이므로 연도 경계는 searchsorted로 한 번에 계산
+    dates = columns['dates']
+    years = dates.astype('datetime64[Y]')
+    boundaries = np.flatnonzero(years[1:] != years[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(dates)]))
+
+    chunks = []
+    for lo, hi in zip(starts, ends):
+        year = str(years[lo])
+        filename = f"{year}.npz"
+        np.savez(os.path.join(tmp_dir, filename), **{name: values[lo:hi] for name, values in columns.items()})
+        chunks.append({
+            'file': filename,
+            'start': str(dates[lo]),
+            'end': str(dates[hi - 1]),
+            'rows': int(hi - lo)
+        })
+
+    # 시그널/FCV 이벤트는 전체 기간에서 한 번 계산해 저장 (차트는 이벤트만 조회)
+    np.savez(os.path.join(tmp_dir, EVENTS_FILENAME), **build_event_arrays(columns))
+
+    index = {
+        'symbol': symbol,
+        'source_version': client.get_data_version(symbol),
+        'last_updated': meta['last_updated'],
+        'rows': int(len(dates)),
+        'chunks': chunks,
+        'events': {'file': EVENTS_FILENAME, 'version': EVENTS_VERSION}
+    }
+    with open(os.path.join(tmp_dir, INDEX_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+    # 폴더 단위로 교체하여 앱이 새/옛 청크를 섞어 읽지 않도록 함
+    old_dir = f"{chunk_dir}.old{os.getpid()}"
+    if os.path.exists(chunk_dir):
+        os.replace(chunk_dir, old_dir)
+    os.replace(tmp_dir, chunk_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    return index
+
+
+def run_chunk_build(data_dir: str, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    전체(또는 지정) 종목 청크 생성
+
+    Returns:
+        실행 요약 {'built', 'failed', 'elapsed_s'}
+    """
+    from utils.json_client import InvestSmartJSONClient
+
+    client = InvestSmartJSONClient(os.path.abspath(data_dir))
+    symbols = symbols or sorted(set(client.get_available_symbols()))
+    failed = {}
+    start = time.perf_counter()
+    for symbol in symbols:
+        try:
+            if build_symbol_chunks(client, symbol) is None:
+                failed[symbol] = '데이터 없음'
+            else:
+                logger.info(f"🧱 청크 생성 완료: {symbol}")
+        except Exception as e:
+            failed[symbol] = str(e)
+            logger.error(f"청크 생성 실패: {symbol}, {e}")
+    return {
+        'built': len(symbols) - len(failed),
+        'failed': failed,
+        'elapsed_s': round(time.perf_counter() - start, 2)
+    }
+
+
+def read_chunk_index(data_dir: str, symbol: str, source_version: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    원본 데이터와 일치하는 청크 index 조회 (없거나 오래되었으면 None)
+
+    index.json은 파일 수정시각이 바뀔 때만 다시 읽습니다.
+    """
+    index_path = os.path.join(get_chunk_dir(data_dir, symbol), INDEX_FILENAME)
+    try:
+        mtime = os.stat(index_path).st_mtime_ns
+    except OSError:
+        return None
+    with _index_lock:
+        cached = _index_cache.get(index_path)
+    if cached is None or cached[0] != mtime:
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                cached = (mtime, json.load(f))
+        except (OSError, ValueError):
+            return None
+        with _index_lock:
+            _index_cache[index_path] = cached
+    index = cached[1]
+    if source_version is None or index.get('source_version') != source_version:
+        return None
+    return index
+
+
+def load_chunked_columns(data_dir: str, index: Dict[str, Any],
+                         start: Optional[np.datetime64] = None) -> Dict[str, np.ndarray]:
+    """
+    start 이후를 덮는 청크만 읽어 컬럼 배열 생성
+
+    Args:
+        data_dir: 신호 데이터 폴더
+        index: read_chunk_index 결과
+        start: 조회 시작일 (None이면 전체)
+    """
+    chunk_dir = get_chunk_dir(data_dir, index['symbol'])
+    start_str = None if start is None else str(np.datetime64(start, 'D'))
+    parts = []
+    for chunk in index['chunks']:
+        if start_str is not None and chunk['end'] < start_str:
+            continue
+        with np.load(os.path.join(chunk_dir, chunk['file'])) as npz:
+            parts.append({name: npz[name] for name in npz.files})
+
+    if not parts:
+        return {}
+    columns = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    if start is not None:
+        lo = int(np.searchsorted(columns['dates'], np.datetime64(start, 'D'), side='left'))
+        if lo:
+            columns = {name: values[lo:].copy() for name, values in columns.items()}
+    return columns
+
+
+def load_chunk_events(data_dir: str, index: Dict[str, Any]) -> Optional[Dict[str, np.ndarray]]:
+    """청크와 함께 저장된 이벤트 배열 (없거나 이벤트 형식이 바뀌었으면 None)"""
+    events = index.get('events')
+    if not events or events.get('version') != EVENTS_VERSION:
+        return None
+    try:
+        with np.load(os.path.join(get_chunk_dir(data_dir, index['symbol']), events['file'])) as npz:
+            return {name: npz[name] for name in npz.files}
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 연도별 청크 생성")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="신호 데이터 폴더")
+    parser.add_argument("--symbols", nargs="*", help="대상 종목 (기본: 전체)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    summary = run_chunk_build(args.data_dir, args.symbols)
+    print(f"청크 생성 완료: {summary['built']}개 종목, 실패 {len(summary['failed'])}개, {summary['elapsed_s']}s")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+컬럼형 데이터 유틸리티 - 종목 데이터를 컬럼별 numpy 배열로 변환
+
+행(dict) 리스트 대신 날짜/가격/시그널별 배열을 사용하면 비교, 통계,
+백테스트 등에서 벡터 연산으로 전체 기간을 한 번에 처리할 수 있습니다.
+"""
+import numpy as np
+from typing import Dict, List, Any, Optional
+
+# 가격 컬럼 (float64)
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# 시그널 컬럼 (int8: -1 매도 / 0 없음 / 1 매수)
+SIGNAL_COLUMNS = [
+    'short_signal_v1', 'short_signal_v2', 'long_signal',
+    'combined_signal_v1', 'macd_signal', 'momentum_color_signal'
+]
+
+# 조회 기간 → 일수 (None: 전체 기간)
+PERIOD_DAYS = {
+    '1m': 31, '3m': 92, '6m': 183,
+    '1y': 366, '2y': 731, '3y': 1096, '5y': 1827,
+    'max': None, 'all': None
+}
+
+
+def rows_to_columns(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    JSON 행 리스트를 컬럼별 배열로 변환
+
+    Returns:
+        {'dates': datetime64[D], 'open'...'volume': float64, 시그널: int8, 'fcv': float64}
+    """
+    count = len(rows)
+    columns = {'dates': np.array([row['date'] for row in rows], dtype='datetime64[D]')}
+    for name in PRICE_COLUMNS:
+        columns[name] = np.fromiter((row.get(name, 0) for row in rows), dtype=np.float64, count=count)
+    for name in SIGNAL_COLUMNS:
+        columns[name] = np.fromiter((row.get(name, 0) for row in rows), dtype=np.int8, count=count)
+    columns['fcv'] = np.fromiter((row.get('fcv', 0) for row in rows), dtype=np.float64, count=count)
+    return columns
+
+
+def period_start(last_date: np.datetime64, period: str) -> Optional[np.datetime64]:
+    """마지막 날짜 기준 조회 기간의 시작일 (전체 기간이거나 알 수 없는 기간이면 None)"""
+    days = PERIOD_DAYS.get(period)
+    if days is None:
+        return None
+    return np.datetime64(last_date, 'D') - np.timedelta64(days, 'D')
+
+
+def slice_columns(columns: Dict[str, np.ndarray], start: Optional[np.datetime64] = None,
+                  end: Optional[np.datetime64] = None) -> Dict[str, np.ndarray]:
+    """날짜 범위 [start, end]에 해당하는 구간만 잘라낸 컬럼 (배열 뷰, 복사 없음)"""
+    dates = columns['dates']
+    lo = 0 if start is None else int(np.searchsorted(dates, start, side='left'))
+    hi = len(dates) if end is None else int(np.searchsorted(dates, end, side='right'))
+    return {name: values[lo:hi] for name, values in columns.items()}
@@ -0,0 +1,199 @@
+"""
+종목 비교 - 여러 종목을 하나의 날짜 인덱스로 정렬하고 가격을 정규화
+
+종목별 날짜 배열을 벡터 연산(교집합/합집합)으로 합쳐 공통 인덱스를 만들고,
+각 종목의 종가와 시그널을 그 인덱스 위로 투영합니다. 정렬 결과는 종목 순서의
+접두사(prefix) 단위로 캐시되므로 비교 종목을 하나 추가해도 앞선 종목들은
+다시 파싱하거나 정렬하지 않습니다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+import plotly.graph_objects as go
+
+from utils.columnar import period_start
+
+# 'inner': 모든 종목에 데이터가 있는 날짜만 / 'outer': 어느 한 종목이라도 데이터가 있는 날짜
+JOIN_METHODS = ('inner', 'outer')
+
+# 비교 차트 색상 (plotly 기본 팔레트)
+COMPARISON_COLORS = ['#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A', '#19D3F3', '#FF6692', '#B6E880']
+
+_CACHE_SIZE = 128
+_index_cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+_aligned_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(cache: OrderedDict, key: Tuple):
+    with _cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    return None
+
+
+def _cache_put(cache: OrderedDict, key: Tuple, value):
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _merge_dates(index: np.ndarray, dates: np.ndarray, how: str) -> np.ndarray:
+    """정렬된 두 날짜 배열을 교집합/합집합으로 병합"""
+    if how == 'inner':
+        return np.intersect1d(index, dates, assume_unique=True)
+    return np.union1d(index, dates)
+
+
+def _aligned_index(client, versioned: Tuple[Tuple[str, str], ...], how: str) -> np.ndarray:
+    """
+    종목들의 공통 날짜 인덱스 - 가장 긴 캐시된 접두사부터 이어서 병합
+
+    Args:
+        versioned: ((종목, 데이터 버전), ...) 순서 있는 튜플
+    """
+    # 캐시된 가장 긴 접두사 찾기
+    index = None
+    start = 0
+    for k in range(len(versioned), 0, -1):
+        cached = _cache_get(_index_cache, (client.data_dir, how, versioned[:k]))
+        if cached is not None:
+            index, start = cached, k
+            break
+
+    for k in range(start, len(versioned)):
+        symbol = versioned[k][0]
+        dates = client.get_columns(symbol)['dates']
+        index = dates if index is None else _merge_dates(index, dates, how)
+        _cache_put(_index_cache, (client.data_dir, how, versioned[:k + 1]), index)
+    return index
+
+
+def _project(columns: Dict[str, np.ndarray], index: np.ndarray, signal_names: List[str]) -> Dict[str, Any]:
+    """종목 컬럼을 공통 인덱스 위로 투영 (데이터 없는 날짜: 종가 NaN, 시그널 0)"""
+    dates = columns['dates']
+    positions = np.minimum(np.searchsorted(dates, index), len(dates) - 1)
+    present = dates[positions] == index
+
+    close = np.where(present, columns['close'][positions], np.nan)
+    valid = np.flatnonzero(present)
+    base = close[valid[0]] if len(valid) else np.nan
+    normalized = close / base * 100 if base else np.full(len(index), np.nan)
+
+    signals = {name: np.where(present, columns[name][positions], 0).astype(np.int8) for name in signal_names}
+    return {'close': close, 'normalized': normalized, 'signals': signals, 'coverage': float(present.mean()) if len(index) else 0.0}
+
+
+def align_symbols(client, symbols: List[str], how: str = 'inner', period: str = 'max',
+                  signal_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    여러 종목을 하나의 날짜 인덱스로 정렬하고 기간 시작 시점 = 100으로 정규화
+
+    Args:
+        client: InvestSmartJSONClient 인스턴스
+        symbols: 비교할 종목 (순서 유지)
+        how: 'inner' (공통 날짜) 또는 'outer' (전체 날짜)
+        period: 조회 기간 ('1y', '3y', 'max' 등)
+        signal_names: 함께 정렬할 시그널 컬럼
+
+    Returns:
+        {'dates', 'symbols', 'missing', 'close', 'normalized', 'signals', 'coverage'}
+    """
+    if how not in JOIN_METHODS:
+        raise ValueError(f"지원하지 않는 정렬 방식: {how}")
+    signal_names = list(signal_names or [])
+
+    # 데이터가 없는 종목 제외 (데이터 버전을 캐시 키에 포함하여 재배포 시 무효화)
+    versioned = []
+    missing = []
+    for symbol in dict.fromkeys(symbols):
+        if client.get_columns(symbol) is None:
+            missing.append(symbol)
+        else:
+            versioned.append((symbol, client.get_data_version(symbol)))
+    versioned = tuple(versioned)
+
+    if not versioned:
+        return {'dates': np.array([], dtype='datetime64[D]'), 'symbols': [], 'missing': missing,
+                'close': {}, 'normalized': {}, 'signals': {}, 'coverage': {}}
+
+    cache_key = (client.data_dir, how, period, tuple(signal_names), versioned)
+    cached = _cache_get(_aligned_cache, cache_key)
+    if cached is not None:
+        return dict(cached, missing=missing)
+
+    index = _aligned_index(client, versioned, how)
+    if len(index) and period:
+        start = period_start(index[-1], period)
+        if start is not None:
+            index = index[index >= start]
+
+    result = {'dates': index, 'symbols': [symbol for symbol, _ in versioned], 'missing': missing,
+              'close': {}, 'normalized': {}, 'signals': {}, 'coverage': {}}
+    for symbol, _ in versioned:
+        projected = _project(client.get_columns(symbol), index, signal_names)
+        result['close'][symbol] = projected['close']
+        result['normalized'][symbol] = projected['normalized']
+        result['signals'][symbol] = projected['signals']
+        result['coverage'][symbol] = projected['coverage']
+
+    _cache_put(_aligned_cache, cache_key, result)
+    return result
+
+
+def build_comparison_figure(aligned: Dict[str, Any], overlay_signals: Optional[List[str]] = None,
+                            labels: Optional[Dict[str, str]] = None) -> go.Figure:
+    """
+    정규화 가격 비교 차트 생성 (시그널은 해당 종목 선 위에 마커로 표시)
+
+    Args:
+        aligned: align_symbols 결과
+        overlay_signals: 마커로 겹쳐 표시할 시그널 컬럼
+        labels: 종목 → 표시 이름
+    """
+    labels = labels or {}
+    dates = aligned['dates']
+    fig = go.Figure()
+
+    for i, symbol in enumerate(aligned['symbols']):
+        color = COMPARISON_COLORS[i % len(COMPARISON_COLORS)]
+        normalized = aligned['normalized'][symbol]
+        name = labels.get(symbol, symbol)
+        fig.add_trace(go.Scattergl(
+            x=dates, y=normalized, mode='lines', name=name,
+            line=dict(color=color, width=2), connectgaps=True
+        ))
+
+        for signal_name in overlay_signals or []:
+            signal_values = aligned['signals'][symbol].get(signal_name)
+            if signal_values is None:
+                continue
+            hits = np.flatnonzero((signal_values == 1) & ~np.isnan(normalized))
+            if len(hits) == 0:
+                continue
+            fig.add_trace(go.Scattergl(
+                x=dates[hits], y=normalized[hits], mode='markers',
+                name=f"{name} · {signal_name}",
+                marker=dict(color=color, size=9, symbol='circle', line=dict(width=1, color='black')),
+                showlegend=False
+            ))
+
+    fig.add_hline(y=100, line=dict(color='grey', width=1, dash='dot'))
+    fig.update_layout(
+        height=450,
+        template="plotly_white",
+        margin=dict(l=2, r=2, t=15, b=2),
+        font=dict(size=9, color='black'),
+        plot_bgcolor='#dee2e6',
+        paper_bgcolor='#dee2e6',
+        dragmode='pan',
+        hovermode='x unified',
+        legend=dict(orientation='h', yanchor='bottom', y=1.0, xanchor='left', x=0),
+        yaxis=dict(title=dict(text="Start = 100"), fixedrange=True)
+    )
+    return fig
@@ -0,0 +1,122 @@
+"""
+데이터 파일 압축 코덱 - 신호 파일 확장자별 열기/크기 조회
+
+신호 파일은 signals_<심볼>.json 원본과 코덱별 압축본(.json.gz / .json.xz /
+.json.zst)으로 존재할 수 있습니다. 로더는 DATA_EXTENSIONS 순서로 처음 찾은
+파일을 사용합니다. zstd는 zstandard 패키지가 설치된 경우에만 사용할 수 있습니다.
+"""
+import gzip
+import io
+import lzma
+import os
+import struct
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+
+class Codec(NamedTuple):
+    """압축 코덱 (이름, 파일 확장자, 압축 레벨 범위, 기본 레벨)"""
+    name: str
+    extension: str
+    levels: range
+    default_level: int
+
+
+CODECS: Dict[str, Codec] = {
+    'gzip': Codec('gzip', '.json.gz', range(1, 10), 9),
+    'lzma': Codec('lzma', '.json.xz', range(0, 10), 6),
+    'zstd': Codec('zstd', '.json.zst', range(1, 23), 19),
+}
+
+# 종목별 데이터 파일을 찾는 순서 (압축본 우선, 원본은 마지막)
+DATA_EXTENSIONS = ('.json.zst', '.json.xz', '.json.gz', '.json')
+
+
+def available_codecs() -> List[str]:
+    """현재 환경에서 사용 가능한 코덱 이름"""
+    return [name for name in CODECS if name != 'zstd' or zstandard is not None]
+
+
+def data_extension(filename: str) -> Optional[str]:
+    """신호 파일 확장자 (해당 없으면 None)"""
+    for extension in DATA_EXTENSIONS:
+        if filename.endswith(extension):
+            return extension
+    return None
+
+
+def codec_for_path(path: str) -> Optional[Codec]:
+    """파일 확장자에 해당하는 코덱 (원본 .json이면 None)"""
+    for codec in CODECS.values():
+        if path.endswith(codec.extension):
+            return codec
+    return None
+
+
+def open_data_file(path: str, mode: str = 'rt'):
+    """
+    확장자에 맞춰 신호 파일 열기 ('rt' 텍스트 / 'rb' 압축 해제된 바이트)
+    """
+    codec = codec_for_path(path)
+    binary = mode == 'rb'
+    if codec is None:
+        return open(path, 'rb') if binary else open(path, 'r', encoding='utf-8')
+    if codec.name == 'gzip':
+        return gzip.open(path, mode, encoding=None if binary else 'utf-8')
+    if codec.name == 'lzma':
+        return lzma.open(path, mode, encoding=None if binary else 'utf-8')
+    if zstandard is None:
+        raise RuntimeError(f"zstandard 패키지가 없어 파일을 열 수 없습니다: {path}")
+    raw = open(path, 'rb')
+    reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return reader if binary else io.TextIOWrapper(reader, encoding='utf-8')
+
+
+@contextmanager
+def compressed_writer(path: str, codec: Codec, level: int, size: Optional[int] = None) -> Iterator:
+    """
+    압축 쓰기 스트림 (gzip은 헤더 시각을 0으로 고정해 같은 내용이면 같은 바이트)
+
+    Args:
+        size: 원본 크기 (zstd 프레임 헤더에 기록 - 로더의 배열 크기 추정용)
+    """
+    with open(path, 'wb') as raw:
+        if codec.name == 'gzip':
+            with gzip.GzipFile(filename='', mode='wb', compresslevel=level, fileobj=raw, mtime=0) as writer:
+                yield writer
+        elif codec.name == 'lzma':
+            with lzma.LZMAFile(raw, 'wb', preset=level) as writer:
+                yield writer
+        else:
+            if zstandard is None:
+                raise RuntimeError("zstandard 패키지가 설치되지 않았습니다")
+            with zstandard.ZstdCompressor(level=level).stream_writer(raw, size=-1 if size is None else size, closefd=False) as writer:
+                yield writer
+
+
+def uncompressed_size(path: str) -> Optional[int]:
+    """
+    압축 해제 후 크기 (gzip: 트레일러 ISIZE, 원본: 파일 크기, zstd: 프레임 헤더)
+
+    Returns:
+        크기 또는 None (파일을 끝까지 읽지 않고는 알 수 없는 경우)
+    """
+    codec = codec_for_path(path)
+    if codec is None:
+        return os.path.getsize(path)
+    if codec.name == 'gzip':
+        with open(path, 'rb') as f:
+            f.seek(-4, os.SEEK_END)
+            # ISIZE는 2^32로 나눈 나머지 - 신호 파일 크기에서는 그대로 사용 가능
+            return struct.unpack('<I', f.read(4))[0]
+    if codec.name == 'zstd' and zstandard is not None:
+        with open(path, 'rb') as f:
+            size = zstandard.frame_content_size(f.read(18))
+        return size if size >= 0 else None
+    return None
+
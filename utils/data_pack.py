@@ -0,0 +1,329 @@
+"""
+데이터 파일 압축 도구 - 전체 종목 파일을 프로세스 풀로 (재)압축하고 코덱별 로드 시간 비교
+
+각 종목의 현재 데이터 파일(원본 .json 또는 압축본)을 압축 해제 스트림으로 읽어
+선택한 코덱/레벨로 바로 다시 압축합니다. 파일 전체를 메모리에 올리지 않으며,
+임시 파일에 쓴 뒤 교체하므로 작업 중에도 앱은 기존 파일을 읽을 수 있습니다.
+원본 .json은 그대로 두고, 다른 코덱의 압축본은 새 파일로 교체한 뒤 삭제합니다.
+
+벤치마크는 표본 파일을 후보 코덱/레벨마다 압축한 뒤 실제 로드 경로
+(utils.json_stream.load_columns - 청크 생성과 청크가 없을 때의 로드에 사용)의
+시간을 측정하여, 로드 시간이 가장 짧은 후보(3% 이내면 더 작은 파일)를 추천합니다.
+
+사용법:
+    python -m utils.data_pack --benchmark                  # 코덱/레벨별 압축률·로드 시간 비교
+    python -m utils.data_pack --codec gzip --level 9       # 전체 파일을 gzip -9로 (재)압축
+    python -m utils.data_pack --codec best --workers 4     # 벤치마크 추천 코덱으로 (재)압축
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import as_completed
+from typing import Any, Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.catalog import load_data_manifest
+from utils.compression import CODECS, available_codecs, codec_for_path, compressed_writer, open_data_file, uncompressed_size
+from utils.json_stream import load_columns
+from utils.process_pool import spawn_pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = os.path.join(parent_dir, "data")
+
+# 스트리밍 복사 단위 (압축 해제된 바이트)
+COPY_BLOCK_SIZE = 1024 * 1024
+
+# 벤치마크 후보 (코덱, 레벨) - 설치되지 않은 코덱은 제외
+DEFAULT_CANDIDATES = (('gzip', 6), ('gzip', 9), ('lzma', 6), ('zstd', 3), ('zstd', 19))
+
+# 벤치마크 표본 파일 수 / 파일당 로드 반복 횟수 (최솟값 사용)
+BENCHMARK_SAMPLE = 24
+BENCHMARK_REPEAT = 3
+
+# 로드 시간이 이 비율 이내로 비슷하면 더 작은 파일을 추천
+LOAD_TIME_TOLERANCE = 0.03
+
+
+def _packed_path(source_path: str, codec_name: str) -> str:
+    """원본 경로에서 코덱 확장자를 바꾼 출력 경로"""
+    stem = source_path
+    source_codec = codec_for_path(source_path)
+    if source_codec is not None:
+        stem = source_path[:-len(source_codec.extension)] + '.json'
+    return stem[:-len('.json')] + CODECS[codec_name].extension
+
+
+def _compress_stream(source_path: str, target_path: str, codec_name: str, level: int) -> int:
+    """source를 압축 해제 스트림으로 읽어 target에 압축 기록 (원본 바이트 수 반환)"""
+    original_bytes = 0
+    with open_data_file(source_path, 'rb') as f_in, \
+            compressed_writer(target_path, CODECS[codec_name], level, size=uncompressed_size(source_path)) as f_out:
+        for block in iter(lambda: f_in.read(COPY_BLOCK_SIZE), b''):
+            f_out.write(block)
+            original_bytes += len(block)
+    return original_bytes
+
+
+def _measure_load_ms(path: str, repeat: int) -> float:
+    """실제 로드 경로(스트리밍 파싱) 시간의 최솟값 (ms)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load_columns(path)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def pack_file(source_path: str, codec_name: str, level: int) -> Dict[str, Any]:
+    """
+    종목 파일 하나를 지정 코덱으로 (재)압축 (프로세스 풀 작업 단위)
+
+    Returns:
+        {'file', 'source', 'original_bytes', 'packed_bytes', 'ratio', 'compress_ms', 'load_ms'}
+    """
+    target_path = _packed_path(source_path, codec_name)
+    tmp_path = f"{target_path}.tmp{os.getpid()}"
+    start = time.perf_counter()
+    try:
+        original_bytes = _compress_stream(source_path, tmp_path, codec_name, level)
+        os.replace(tmp_path, target_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    compress_ms = (time.perf_counter() - start) * 1000
+
+    # 다른 코덱의 압축본 정리 (원본 .json은 유지)
+    for other in CODECS.values():
+        other_path = target_path[:-len(CODECS[codec_name].extension)] + other.extension
+        if other_path != target_path and os.path.exists(other_path):
+            os.remove(other_path)
+
+    packed_bytes = os.path.getsize(target_path)
+    return {
+        'file': os.path.basename(target_path),
+        'source': os.path.basename(source_path),
+        'original_bytes': original_bytes,
+        'packed_bytes': packed_bytes,
+        'ratio': round(original_bytes / packed_bytes, 2) if packed_bytes else 0,
+        'compress_ms': round(compress_ms, 1),
+        'load_ms': round(_measure_load_ms(target_path, 1), 1)
+    }
+
+
+def benchmark_file(source_path: str, candidates: List[Tuple[str, int]], repeat: int = BENCHMARK_REPEAT) -> List[Dict[str, Any]]:
+    """
+    파일 하나를 후보 코덱/레벨마다 임시 폴더에 압축해 크기와 로드 시간 측정
+
+    Returns:
+        후보별 {'codec', 'level', 'original_bytes', 'packed_bytes', 'compress_ms', 'decode_ms', 'load_ms'}
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="data_pack_") as tmp_dir:
+        for codec_name, level in candidates:
+            target_path = os.path.join(tmp_dir, os.path.basename(_packed_path(source_path, codec_name)))
+            start = time.perf_counter()
+            original_bytes = _compress_stream(source_path, target_path, codec_name, level)
+            compress_ms = (time.perf_counter() - start) * 1000
+
+            decode_ms = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                with open_data_file(target_path, 'rb') as f:
+                    while f.read(COPY_BLOCK_SIZE):
+                        pass
+                decode_ms = min(decode_ms, (time.perf_counter() - start) * 1000)
+
+            results.append({
+                'codec': codec_name,
+                'level': level,
+                'original_bytes': original_bytes,
+                'packed_bytes': os.path.getsize(target_path),
+                'compress_ms': compress_ms,
+                'decode_ms': decode_ms,
+                'load_ms': _measure_load_ms(target_path, repeat)
+            })
+            os.remove(target_path)
+    return results
+
+
+def _source_files(data_dir: str, symbols: Optional[List[str]] = None) -> Dict[str, str]:
+    """종목별 현재 데이터 파일 경로 (manifest 기준 - 로더가 읽는 파일)"""
+    manifest_symbols = load_data_manifest(data_dir)['symbols']
+    if symbols:
+        manifest_symbols = {symbol: manifest_symbols[symbol] for symbol in symbols if symbol in manifest_symbols}
+    return {symbol: os.path.join(data_dir, filename) for symbol, filename in manifest_symbols.items()}
+
+
+def _valid_candidates(candidates) -> List[Tuple[str, int]]:
+    codecs = available_codecs()
+    valid = [(codec_name, level) for codec_name, level in candidates
+             if codec_name in codecs and level in CODECS[codec_name].levels]
+    skipped = [candidate for candidate in candidates if candidate not in valid]
+    if skipped:
+        logger.warning(f"사용할 수 없는 코덱/레벨 제외: {skipped} (사용 가능: {codecs})")
+    return valid
+
+
+def run_benchmark(data_dir: str, candidates=DEFAULT_CANDIDATES, symbols: Optional[List[str]] = None,
+                  workers: Optional[int] = None, sample: int = BENCHMARK_SAMPLE) -> Dict[str, Any]:
+    """
+    코덱/레벨별 압축률과 로드 시간 비교
+
+    Args:
+        data_dir: 신호 데이터 폴더
+        candidates: (코덱, 레벨) 후보
+        symbols: 표본 종목 (기본: 파일 크기순으로 고르게 sample개)
+        workers: 프로세스 수 (기본: CPU 수)
+
+    Returns:
+        {'candidates': [후보별 합계/중앙값], 'best': {'codec', 'level'} 또는 None, 'files': 표본 수}
+    """
+    candidates = _valid_candidates(candidates)
+    sources = _source_files(data_dir, symbols)
+    paths = sorted(sources.values(), key=os.path.getsize)
+    if not symbols and len(paths) > sample:
+        # 작은 파일부터 큰 파일까지 고르게 표본 추출
+        step = len(paths) / sample
+        paths = [paths[int(i * step)] for i in range(sample)]
+    if not candidates or not paths:
+        return {'candidates': [], 'best': None, 'files': 0}
+
+    per_candidate: Dict[Tuple[str, int], List[Dict[str, Any]]] = {candidate: [] for candidate in candidates}
+    with spawn_pool(workers) as executor:
+        futures = {executor.submit(benchmark_file, path, candidates): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                for row in future.result():
+                    per_candidate[(row['codec'], row['level'])].append(row)
+            except Exception as e:
+                logger.error(f"벤치마크 실패: {os.path.basename(futures[future])}, {e}")
+
+    summary = []
+    for (codec_name, level), rows in per_candidate.items():
+        if not rows:
+            continue
+        original = sum(row['original_bytes'] for row in rows)
+        packed = sum(row['packed_bytes'] for row in rows)
+        summary.append({
+            'codec': codec_name,
+            'level': level,
+            'original_bytes': original,
+            'packed_bytes': packed,
+            'ratio': round(original / packed, 2) if packed else 0,
+            'compress_mb_s': round(original / 1e6 / (sum(row['compress_ms'] for row in rows) / 1000), 1),
+            'decode_mb_s': round(original / 1e6 / (sum(row['decode_ms'] for row in rows) / 1000), 1),
+            'median_load_ms': round(statistics.median(row['load_ms'] for row in rows), 2),
+            'total_load_ms': round(sum(row['load_ms'] for row in rows), 1)
+        })
+
+    best = None
+    if summary:
+        fastest = min(row['total_load_ms'] for row in summary)
+        close = [row for row in summary if row['total_load_ms'] <= fastest * (1 + LOAD_TIME_TOLERANCE)]
+        winner = min(close, key=lambda row: row['packed_bytes'])
+        best = {'codec': winner['codec'], 'level': winner['level']}
+    return {'candidates': summary, 'best': best, 'files': len(paths)}
+
+
+def run_pack(data_dir: str, codec_name: str = 'gzip', level: Optional[int] = None,
+             symbols: Optional[List[str]] = None, workers: Optional[int] = None,
+             only_uncompressed: bool = False) -> Dict[str, Any]:
+    """
+    전체(또는 지정) 종목 파일 (재)압축
+
+    Args:
+        codec_name: 'gzip', 'lzma', 'zstd'
+        level: 압축 레벨 (기본: 코덱 기본값)
+        only_uncompressed: True면 원본 .json만 있는 종목만 압축
+
+    Returns:
+        {'packed', 'failed', 'original_bytes', 'packed_bytes', 'savings_percent', 'elapsed_s', 'files'}
+    """
+    if codec_name not in available_codecs():
+        raise ValueError(f"사용할 수 없는 코덱: {codec_name} (사용 가능: {available_codecs()})")
+    codec = CODECS[codec_name]
+    level = codec.default_level if level is None else level
+
+    sources = _source_files(data_dir, symbols)
+    if only_uncompressed:
+        sources = {symbol: path for symbol, path in sources.items() if codec_for_path(path) is None}
+
+    files, failed = [], {}
+    start = time.perf_counter()
+    if sources:
+        with spawn_pool(workers) as executor:
+            futures = {executor.submit(pack_file, path, codec_name, level): symbol for symbol, path in sources.items()}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    result = future.result()
+                    files.append(result)
+                    logger.info(f"📦 압축 완료: {symbol} ({result['original_bytes']:,} → {result['packed_bytes']:,} bytes, "
+                                f"{result['ratio']}x, 로드 {result['load_ms']}ms)")
+                except Exception as e:
+                    failed[symbol] = str(e)
+                    logger.error(f"압축 실패: {symbol}, {e}")
+
+    original = sum(row['original_bytes'] for row in files)
+    packed = sum(row['packed_bytes'] for row in files)
+    return {
+        'codec': codec_name,
+        'level': level,
+        'packed': len(files),
+        'failed': failed,
+        'original_bytes': original,
+        'packed_bytes': packed,
+        'savings_percent': round((1 - packed / original) * 100, 1) if original else 0,
+        'elapsed_s': round(time.perf_counter() - start, 2),
+        'files': sorted(files, key=lambda row: row['file'])
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 데이터 파일 (재)압축 및 코덱 벤치마크")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="신호 데이터 폴더")
+    parser.add_argument("--benchmark", action="store_true", help="코덱/레벨별 압축률·로드 시간 비교만 실행")
+    parser.add_argument("--codec", default="gzip", choices=list(CODECS) + ["best"],
+                        help="압축 코덱 (best: 벤치마크 추천 코덱)")
+    parser.add_argument("--level", type=int, default=None, help="압축 레벨 (기본: 코덱 기본값)")
+    parser.add_argument("--symbols", nargs="*", help="대상 종목 (기본: 전체)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    data_dir = os.path.abspath(args.data_dir)
+    codec_name, level = args.codec, args.level
+
+    if args.benchmark or codec_name == "best":
+        result = run_benchmark(data_dir, symbols=args.symbols, workers=args.workers)
+        print(f"표본 {result['files']}개 파일")
+        print(f"{'codec':<6} {'level':>5} {'ratio':>6} {'MB':>8} {'comp MB/s':>10} {'dec MB/s':>9} {'load ms(med)':>13}")
+        for row in result['candidates']:
+            print(f"{row['codec']:<6} {row['level']:>5} {row['ratio']:>6} {row['packed_bytes'] / 1e6:>8.2f} "
+                  f"{row['compress_mb_s']:>10} {row['decode_mb_s']:>9} {row['median_load_ms']:>13}")
+        if result['best'] is None:
+            print("벤치마크 결과가 없습니다.")
+            return 1
+        print(f"추천: {result['best']['codec']} -{result['best']['level']}")
+        if args.benchmark:
+            return 0
+        codec_name, level = result['best']['codec'], result['best']['level']
+
+    summary = run_pack(data_dir, codec_name, level, args.symbols, args.workers)
+    print(f"압축 완료: {summary['packed']}개 파일 ({summary['codec']} -{summary['level']}), "
+          f"{summary['original_bytes'] / 1e6:.1f}MB → {summary['packed_bytes'] / 1e6:.1f}MB "
+          f"({summary['savings_percent']}% 절약), 실패 {len(summary['failed'])}개, {summary['elapsed_s']}s")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
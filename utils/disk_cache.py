@@ -0,0 +1,196 @@
+"""
+영구 디스크 캐시 - 재시작/재배포 후에도 파싱·리샘플링·Figure 결과를 재사용
+
+프로세스 메모리 캐시는 재시작하면 모두 사라져 배포 직후에는 종목/시간축마다 다시
+파싱하고 리샘플링합니다. 이 캐시는 결과를 로컬 폴더에 저장하고, 키에 원본 파일 내용
+해시(client.get_data_version)를 포함하므로 데이터가 다시 배포되면 자연히 새 키를
+사용합니다. 오래된 항목은 용량 제한에 걸릴 때 가장 오래 사용하지 않은 것부터 삭제됩니다.
+
+    <캐시 폴더>/columns/ab/ab12....npz    전체 기간 컬럼 (utils.columnar 형식)
+    <캐시 폴더>/views/cd/cd34....json     리샘플링된 주봉/월봉 데이터
+    <캐시 폴더>/figures/ef/ef56....json   직렬화된 차트 Figure
+
+- 쓰기는 임시 파일 → os.replace로 원자적이므로 여러 워커 프로세스가 같은 폴더를 써도 안전합니다.
+- 읽을 때 파일 수정시각을 갱신하여 LRU 순서로 사용합니다.
+- 폴더는 INVESTSMART_CACHE_DIR(기본: 프로젝트/.cache), 용량은 INVESTSMART_CACHE_MAX_MB(기본 512)로
+  지정하며, 컨테이너 재배포 후에도 유지하려면 이 폴더를 볼륨으로 마운트합니다.
+"""
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "INVESTSMART_CACHE_DIR"
+CACHE_MAX_MB_ENV = "INVESTSMART_CACHE_MAX_MB"
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+DEFAULT_MAX_MB = 512
+
+# 용량 초과 시 이 비율까지 줄임 (매 쓰기마다 정리하지 않도록 여유를 둠)
+EVICT_TARGET_RATIO = 0.9
+
+
+class DiskCache:
+    """이름공간별 파일 캐시 (원자적 쓰기 + 용량 제한 LRU 삭제)"""
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # 첫 쓰기 때 폴더를 훑어 계산
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evicted': 0}
+
+    def _path(self, namespace: str, key: Tuple[Hashable, ...], suffix: str) -> str:
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.root, namespace, digest[:2], f"{digest}{suffix}")
+
+    def get_bytes(self, namespace: str, key: Tuple[Hashable, ...], suffix: str = ".bin") -> Optional[bytes]:
+        """저장된 값 (없으면 None) - 읽은 항목은 최근 사용으로 표시"""
+        path = self._path(namespace, key, suffix)
+        try:
+            with open(path, 'rb') as f:
+                payload = f.read()
+        except FileNotFoundError:
+            self.stats['misses'] += 1
+            return None
+        except OSError as e:
+            logger.error(f"디스크 캐시 읽기 실패: {path}, {e}")
+            self.stats['misses'] += 1
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        self.stats['hits'] += 1
+        return payload
+
+    def put_bytes(self, namespace: str, key: Tuple[Hashable, ...], payload: bytes, suffix: str = ".bin"):
+        """값 저장 (임시 파일에 쓴 뒤 교체) - 용량을 넘으면 오래된 항목 삭제"""
+        path = self._path(namespace, key, suffix)
+        tmp_path = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            logger.error(f"디스크 캐시 쓰기 실패: {path}, {e}")
+            return
+
+        with self._lock:
+            self.stats['writes'] += 1
+            if self._total_bytes is None:
+                self._total_bytes = self._scan()[0]
+            else:
+                self._total_bytes += len(payload)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _scan(self) -> Tuple[int, list]:
+        """폴더 전체 크기와 [(수정시각, 크기, 경로), ...]"""
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if '.tmp' in name:
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return sum(size for _, size, _ in entries), entries
+
+    def _evict(self):
+        """가장 오래 사용하지 않은 항목부터 삭제하여 용량 제한의 EVICT_TARGET_RATIO까지 줄임"""
+        total, entries = self._scan()  # 다른 프로세스의 쓰기/삭제도 반영
+        target = int(self.max_bytes * EVICT_TARGET_RATIO)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+                evicted += 1
+            total -= size
+        self._total_bytes = total
+        self.stats['evicted'] += evicted
+        if evicted:
+            logger.info(f"🧹 디스크 캐시 정리: {evicted}개 삭제 → {total / (1024 * 1024):.1f}MB")
+
+    def get_json(self, namespace: str, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        payload = self.get_bytes(namespace, key, ".json")
+        if payload is None:
+            return None
+        try:
+            return json.loads(payload)
+        except ValueError as e:
+            logger.error(f"디스크 캐시 항목 손상: {namespace} {key}, {e}")
+            return None
+
+    def put_json(self, namespace: str, key: Tuple[Hashable, ...], value: Any):
+        self.put_bytes(namespace, key, json.dumps(value, ensure_ascii=False, default=str).encode('utf-8'), ".json")
+
+    def get_arrays(self, namespace: str, key: Tuple[Hashable, ...]) -> Optional[Dict[str, np.ndarray]]:
+        payload = self.get_bytes(namespace, key, ".npz")
+        if payload is None:
+            return None
+        try:
+            with np.load(io.BytesIO(payload)) as npz:
+                return {name: npz[name] for name in npz.files}
+        except (OSError, ValueError) as e:
+            logger.error(f"디스크 캐시 항목 손상: {namespace} {key}, {e}")
+            return None
+
+    def put_arrays(self, namespace: str, key: Tuple[Hashable, ...], arrays: Dict[str, np.ndarray]):
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        self.put_bytes(namespace, key, buffer.getvalue(), ".npz")
+
+    def usage(self) -> Dict[str, Any]:
+        """{'dir', 'bytes', 'entries', 'max_bytes', 'hits', 'misses', 'writes', 'evicted'}"""
+        total, entries = self._scan()
+        return dict(self.stats, dir=self.root, bytes=total, entries=len(entries), max_bytes=self.max_bytes)
+
+    def clear(self):
+        """캐시 폴더 비우기"""
+        with self._lock:
+            for _, _, path in self._scan()[1]:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+            self._total_bytes = 0
+
+
+_disk_cache: Optional[DiskCache] = None
+_disk_cache_lock = threading.Lock()
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """프로세스 공용 디스크 캐시 (INVESTSMART_CACHE_MAX_MB=0이면 사용 안 함 - None)"""
+    global _disk_cache
+    with _disk_cache_lock:
+        if _disk_cache is None:
+            try:
+                max_mb = float(os.environ.get(CACHE_MAX_MB_ENV, DEFAULT_MAX_MB))
+            except ValueError:
+                max_mb = DEFAULT_MAX_MB
+            if max_mb <= 0:
+                return None
+            root = os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+            _disk_cache = DiskCache(root, int(max_mb * 1024 * 1024))
+            logger.info(f"💾 디스크 캐시: {_disk_cache.root} (최대 {max_mb:g}MB)")
+        return _disk_cache
+
+
+def reset_disk_cache():
+    """공용 디스크 캐시 해제 - 다음 get_disk_cache 호출 때 환경 변수를 다시 읽음"""
+    global _disk_cache
+    with _disk_cache_lock:
+        _disk_cache = None
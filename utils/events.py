@@ -0,0 +1,204 @@
+"""
+시그널/FCV 이벤트 인덱스 - 봉 배열 대신 이벤트 위치만 다루어 차트·스크리닝을 O(이벤트)로 처리
+
+차트 생성은 시그널 배열을 봉마다 훑어 매수 시그널(1) 위치, Rebound Alert 조건(같은 그룹
+매수 시그널이 직전 20/50봉 안에 있음), FCV 배경 구간을 찾았습니다. 이 모듈은 이를 벡터 연산
+한 번으로 희소 이벤트 목록으로 만듭니다.
+
+- 전체 기간 이벤트는 데이터 빌드 단계(utils.chunk_store)가 청크와 함께 날짜 배열로 저장하고,
+  청크가 없으면 클라이언트가 계산해 디스크 캐시에 둡니다 (InvestSmartJSONClient.get_events).
+- 조회 구간(일봉 뷰)에는 이벤트 날짜를 searchsorted로 맞춰 위치만 옮깁니다 (slice_events).
+  저장된 이벤트가 없으면 조회 구간 컬럼에서 바로 계산합니다 (find_events - 결과 동일).
+- 주봉/월봉 뷰는 리샘플링된 봉에서 바로 계산합니다 (find_events).
+
+    signal.<시그널>           매수 시그널 발생일
+    alert.<반전 시그널>       Rebound Alert 조건을 만족한 발생일
+    alert_prev.<반전 시그널>  해당 Alert를 확정한 직전 그룹 매수 시그널 날짜
+    fcv_<green|red>_start/end FCV 구간 시작/끝 날짜 (끝 포함)
+"""
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.columnar import SIGNAL_COLUMNS
+
+# 저장 형식/규칙이 바뀌면 올려서 저장된 이벤트를 무효화
+EVENTS_VERSION = 1
+
+# 반전 시그널 → (같은 그룹 매수 시그널, 확인할 직전 봉 수)
+ALERT_RULES = {
+    'macd_signal': ('short_signal_v2', 20),            # 단기
+    'momentum_color_signal': ('short_signal_v1', 50),  # 중기
+    'combined_signal_v1': ('long_signal', 20),         # 장기
+}
+
+# FCV 배경 구간 (FCV >= 0.5: 녹색, FCV <= -0.5: 빨간색)
+FCV_ZONES = {'green': 0.5, 'red': -0.5}
+
+# 시그널별 표시 간격 - 구간(주/월)마다 첫 발생만 표시 (first_per_bucket)
+SIGNAL_BUCKETS = {
+    'momentum_color_signal': 'week',  # 주봉 기준 신호
+}
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+# datetime64[D]의 0일(1970-01-01)은 목요일 - 3일을 더하면 월요일 시작 주 번호
+_EPOCH_WEEKDAY_OFFSET = 3
+
+
+def signal_positions(values: Sequence) -> np.ndarray:
+    """매수 시그널(1) 위치"""
+    return np.flatnonzero(np.asarray(values) == 1)
+
+
+def alert_positions(reversal: np.ndarray, group: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    반전 시그널 중 직전 window봉 안에 그룹 매수 시그널이 있는 위치
+
+    Args:
+        reversal: 반전 시그널 위치 (오름차순)
+        group: 그룹 매수 시그널 위치 (오름차순)
+
+    Returns:
+        (Alert 위치, 각 Alert 직전의 그룹 매수 시그널 위치)
+    """
+    if len(reversal) == 0 or len(group) == 0:
+        return _EMPTY, _EMPTY
+    previous = np.searchsorted(group, reversal, side='left') - 1
+    has_previous = previous >= 0
+    prev_positions = group[np.maximum(previous, 0)]
+    confirmed = has_previous & (prev_positions >= reversal - window)
+    return reversal[confirmed], prev_positions[confirmed]
+
+
+def zone_runs(fcv: Sequence[float], zone: str) -> Tuple[np.ndarray, np.ndarray]:
+    """FCV 구간 연속 봉의 (시작 위치, 끝 위치) - 끝 포함"""
+    values = np.asarray(fcv, dtype=np.float64)
+    threshold = FCV_ZONES[zone]
+    mask = values >= threshold if threshold > 0 else values <= threshold
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], mask, [False])).astype(np.int8)))
+    return edges[0::2], edges[1::2] - 1
+
+
+def bucket_ids(dates: Sequence, bucket: str) -> np.ndarray:
+    """
+    날짜별 달력 구간 번호 (같은 구간이면 같은 값)
+
+    Args:
+        dates: datetime64 배열 (또는 변환 가능한 값)
+        bucket: 'week' (월요일 시작 주) 또는 'month'
+    """
+    days = np.asarray(dates, dtype='datetime64[D]')
+    if bucket == 'week':
+        return (days.astype(np.int64) + _EPOCH_WEEKDAY_OFFSET) // 7
+    if bucket == 'month':
+        return days.astype('datetime64[M]').astype(np.int64)
+    raise ValueError(f"지원하지 않는 구간: {bucket}")
+
+
+def first_per_bucket(positions: Sequence[int], dates: Sequence, bucket: str) -> np.ndarray:
+    """
+    이벤트 위치 중 달력 구간(주/월)마다 첫 번째만 남김
+
+    Args:
+        positions: 이벤트 위치 (오름차순)
+        dates: 봉 날짜 배열 (datetime64, 오름차순)
+        bucket: 'week' 또는 'month'
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    if len(positions) == 0:
+        return positions
+    ids = bucket_ids(np.asarray(dates, dtype='datetime64[D]')[positions], bucket)
+    keep = np.empty(len(ids), dtype=bool)
+    keep[0] = True
+    np.not_equal(ids[1:], ids[:-1], out=keep[1:])
+    return positions[keep]
+
+
+def _event_positions(signals: Dict[str, Sequence], fcv: Optional[Sequence[float]]):
+    positions = {name: signal_positions(values) for name, values in signals.items()}
+    alerts = {}
+    for name, (group_name, window) in ALERT_RULES.items():
+        if name in positions and group_name in positions:
+            alerts[name] = alert_positions(positions[name], positions[group_name], window)
+    runs = {zone: zone_runs(fcv, zone) if fcv is not None and len(fcv) else (_EMPTY, _EMPTY)
+            for zone in FCV_ZONES}
+    return positions, alerts, runs
+
+
+def find_events(signals: Dict[str, Sequence], fcv: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+    """
+    뷰(봉 배열)의 이벤트 위치
+
+    Returns:
+        {'signals': {시그널: [위치, ...]}, 'alerts': {반전 시그널: [위치, ...]},
+         'fcv_runs': {'green'|'red': [[시작, 끝], ...]}} (JSON 직렬화 가능)
+    """
+    positions, alerts, runs = _event_positions(signals, fcv)
+    return {
+        'signals': {name: values.tolist() for name, values in positions.items()},
+        'alerts': {name: values[0].tolist() for name, values in alerts.items()},
+        'fcv_runs': {zone: np.column_stack(run).tolist() for zone, run in runs.items()}
+    }
+
+
+def build_event_arrays(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    전체 기간 컬럼(utils.columnar)의 이벤트를 날짜 배열로 변환 (npz 저장 형식)
+
+    위치 대신 날짜로 저장하므로 어떤 조회 구간에도 그대로 맞출 수 있습니다.
+    """
+    dates = columns['dates']
+    signals = {name: columns[name] for name in SIGNAL_COLUMNS if name in columns}
+    positions, alerts, runs = _event_positions(signals, columns.get('fcv'))
+    arrays = {f"signal.{name}": dates[values] for name, values in positions.items()}
+    for name, (alert, previous) in alerts.items():
+        arrays[f"alert.{name}"] = dates[alert]
+        arrays[f"alert_prev.{name}"] = dates[previous]
+    for zone, (starts, ends) in runs.items():
+        arrays[f"fcv_{zone}_start"] = dates[starts]
+        arrays[f"fcv_{zone}_end"] = dates[ends]
+    return arrays
+
+
+def _locate(view_dates: np.ndarray, event_dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """이벤트 날짜의 뷰 위치와 뷰에 있는지 여부"""
+    positions = np.searchsorted(view_dates, event_dates, side='left')
+    inside = positions < len(view_dates)
+    inside[inside] = view_dates[positions[inside]] == event_dates[inside]
+    return positions, inside
+
+
+def slice_events(arrays: Dict[str, np.ndarray], view_dates: Sequence) -> Dict[str, Any]:
+    """
+    전체 기간 이벤트(build_event_arrays)를 조회 구간 위치로 변환 - find_events와 같은 형식
+
+    Alert는 확정한 그룹 매수 시그널이 구간 시작 전이면 제외합니다 (구간 데이터만으로
+    계산했을 때와 같은 결과).
+    """
+    view_dates = np.asarray(view_dates, dtype='datetime64[D]')
+    events = {'signals': {}, 'alerts': {}, 'fcv_runs': {}}
+    if len(view_dates) == 0:
+        return events
+    first, last = view_dates[0], view_dates[-1]
+
+    for key, event_dates in arrays.items():
+        kind, _, name = key.partition('.')
+        if kind == 'signal':
+            positions, inside = _locate(view_dates, event_dates)
+            events['signals'][name] = positions[inside].tolist()
+        elif kind == 'alert':
+            positions, inside = _locate(view_dates, event_dates)
+            inside &= arrays[f"alert_prev.{name}"] >= first
+            events['alerts'][name] = positions[inside].tolist()
+
+    for zone in FCV_ZONES:
+        starts, ends = arrays.get(f"fcv_{zone}_start"), arrays.get(f"fcv_{zone}_end")
+        if starts is None or ends is None:
+            events['fcv_runs'][zone] = []
+            continue
+        overlap = (ends >= first) & (starts <= last)
+        run_starts = np.searchsorted(view_dates, starts[overlap], side='left')
+        run_ends = np.searchsorted(view_dates, ends[overlap], side='right') - 1
+        events['fcv_runs'][zone] = np.column_stack((run_starts, run_ends)).tolist()
+    return events
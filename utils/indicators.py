@@ -0,0 +1,335 @@
+"""
+기술적 지표 엔진 - OHLCV 배열에서 이동평균/RSI/MACD/볼린저 밴드/ATR을 즉석 계산
+
+각 지표는 numpy 배열 연산(sliding_window_view, pandas ewm)으로 한 번에 계산하며,
+계산을 이어가는 데 필요한 상태(직전 window-1개 입력, 마지막 지수평균 값 등)를 함께
+돌려줍니다. 결과는 (종목, 시간축, 지표, 파라미터)별로 캐시되고, 데이터가 다시
+배포되어 버전이 바뀌어도 기존 봉이 그대로이면 새로 추가된 봉만 상태에서 이어서
+계산합니다. 마지막 봉은 주봉/월봉에서 기간이 끝나기 전까지 값이 바뀔 수 있으므로
+마지막 봉 직전 상태를 기준으로 이어 붙입니다.
+
+지수평균(EMA, Wilder 평균)은 첫 값에서 시작하며(pandas ewm adjust=False),
+값이 안정되기 전 구간(RSI/ATR: window봉, MACD: slow봉)은 NaN으로 표시합니다.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger(__name__)
+
+# 지표별 기본 파라미터
+INDICATOR_DEFAULTS = {
+    'sma': {'window': 20},
+    'ema': {'window': 20},
+    'bollinger': {'window': 20, 'num_std': 2.0},
+    'rsi': {'window': 14},
+    'macd': {'fast': 12, 'slow': 26, 'signal': 9},
+    'atr': {'window': 14},
+}
+
+# 가격 차트 위에 겹쳐 그리는 지표 (나머지는 아래 별도 패널)
+OVERLAY_INDICATORS = ('sma', 'ema', 'bollinger')
+
+# 화면 선택 목록 (프리셋 ID → 지표/파라미터/라벨/색)
+INDICATOR_PRESETS = {
+    'sma20': {'indicator': 'sma', 'params': {'window': 20}, 'label': 'SMA 20', 'color': '#FF8C00'},
+    'sma50': {'indicator': 'sma', 'params': {'window': 50}, 'label': 'SMA 50', 'color': '#8A2BE2'},
+    'sma200': {'indicator': 'sma', 'params': {'window': 200}, 'label': 'SMA 200', 'color': '#2F4F4F'},
+    'ema20': {'indicator': 'ema', 'params': {'window': 20}, 'label': 'EMA 20', 'color': '#1E90FF'},
+    'bb20': {'indicator': 'bollinger', 'params': {'window': 20, 'num_std': 2.0}, 'label': 'Bollinger (20, 2)',
+             'color': '#708090'},
+    'rsi14': {'indicator': 'rsi', 'params': {'window': 14}, 'label': 'RSI 14', 'color': '#8B008B'},
+    'macd': {'indicator': 'macd', 'params': {'fast': 12, 'slow': 26, 'signal': 9}, 'label': 'MACD (12, 26, 9)',
+             'color': '#00008B'},
+    'atr14': {'indicator': 'atr', 'params': {'window': 14}, 'label': 'ATR 14', 'color': '#A0522D'},
+}
+
+# 캐시할 (종목, 시간축, 지표, 파라미터) 수
+_CACHE_SIZE = 256
+
+_indicator_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {'hits': 0, 'incremental': 0, 'full': 0}
+
+
+def resolve_indicator(spec: Any) -> Tuple[str, Dict[str, Any]]:
+    """
+    지표 지정 → (지표 이름, 파라미터)
+
+    Args:
+        spec: 프리셋 ID('sma20'), 지표 이름('rsi'), 또는 {'name': 'sma', 'params': {'window': 50}}
+    """
+    if isinstance(spec, dict):
+        name, params = spec.get('name'), spec.get('params') or {}
+    elif spec in INDICATOR_PRESETS:
+        name, params = INDICATOR_PRESETS[spec]['indicator'], INDICATOR_PRESETS[spec]['params']
+    else:
+        name, params = spec, {}
+    if name not in INDICATOR_DEFAULTS:
+        raise ValueError(f"지원하지 않는 지표: {spec}")
+    return name, dict(INDICATOR_DEFAULTS[name], **params)
+
+
+# ---------------------------------------------------------------------------
+# 기본 연산 (이어서 계산할 수 있도록 carry/last 상태를 받고 돌려줌)
+# ---------------------------------------------------------------------------
+
+def _rolling_mean_std(values: np.ndarray, window: int, carry: Optional[np.ndarray],
+                      with_std: bool = False) -> Tuple[np.ndarray, Optional[np.ndarray], np.ndarray]:
+    """이동평균(및 표준편차) - carry는 직전 window-1개 입력 (처음이면 None)"""
+    full = values if carry is None else np.concatenate([carry, values])
+    mean = np.full(len(full), np.nan)
+    std = np.full(len(full), np.nan) if with_std else None
+    if len(full) >= window:
+        windows = sliding_window_view(full, window)
+        mean[window - 1:] = windows.mean(axis=1)
+        if with_std:
+            std[window - 1:] = windows.std(axis=1)
+    offset = len(full) - len(values)
+    new_carry = full[len(full) - min(len(full), window - 1):]
+    return mean[offset:], (std[offset:] if with_std else None), new_carry
+
+
+def _ema(values: np.ndarray, alpha: float, last: Optional[float]) -> Tuple[np.ndarray, Optional[float]]:
+    """지수평균 y_t = a*x_t + (1-a)*y_(t-1) - last가 없으면 첫 값에서 시작"""
+    if len(values) == 0:
+        return np.empty(0), last
+    series = values if last is None else np.concatenate([[last], values])
+    out = pd.Series(series, dtype=float).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    if last is not None:
+        out = out[1:]
+    return out, float(out[-1])
+
+
+def _mask_warmup(values: np.ndarray, offset: int, warmup: int) -> np.ndarray:
+    """전체 기준 인덱스가 warmup 미만인 값은 NaN (상태 계산에는 영향 없음)"""
+    if offset < warmup:
+        values = values.copy()
+        values[:warmup - offset] = np.nan
+    return values
+
+
+# ---------------------------------------------------------------------------
+# 지표 (inputs: {'open', 'high', 'low', 'close'}, offset: 첫 입력의 전체 기준 인덱스)
+# ---------------------------------------------------------------------------
+
+def _sma(inputs, params, state, offset):
+    mean, _, carry = _rolling_mean_std(inputs['close'], params['window'], state.get('carry'))
+    return {'sma': mean}, {'carry': carry}
+
+
+def _ema_indicator(inputs, params, state, offset):
+    values, last = _ema(inputs['close'], 2.0 / (params['window'] + 1), state.get('last'))
+    return {'ema': values}, {'last': last}
+
+
+def _bollinger(inputs, params, state, offset):
+    mean, std, carry = _rolling_mean_std(inputs['close'], params['window'], state.get('carry'), with_std=True)
+    band = params['num_std'] * std
+    return {'middle': mean, 'upper': mean + band, 'lower': mean - band}, {'carry': carry}
+
+
+def _rsi(inputs, params, state, offset):
+    close = inputs['close']
+    prev_close = state.get('prev_close')
+    if prev_close is None:
+        delta, lead = np.diff(close), min(1, len(close))  # 첫 봉은 변화량 없음
+    else:
+        delta, lead = np.diff(np.concatenate([[prev_close], close])), 0
+    alpha = 1.0 / params['window']
+    avg_gain, last_gain = _ema(np.maximum(delta, 0.0), alpha, state.get('avg_gain'))
+    avg_loss, last_loss = _ema(np.maximum(-delta, 0.0), alpha, state.get('avg_loss'))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0),
+                       100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    rsi = np.concatenate([np.full(lead, np.nan), rsi])
+    new_state = {'prev_close': float(close[-1]) if len(close) else prev_close,
+                 'avg_gain': last_gain, 'avg_loss': last_loss}
+    return {'rsi': _mask_warmup(rsi, offset, params['window'])}, new_state
+
+
+def _macd(inputs, params, state, offset):
+    close = inputs['close']
+    fast, last_fast = _ema(close, 2.0 / (params['fast'] + 1), state.get('fast'))
+    slow, last_slow = _ema(close, 2.0 / (params['slow'] + 1), state.get('slow'))
+    line = fast - slow
+    signal, last_signal = _ema(line, 2.0 / (params['signal'] + 1), state.get('signal'))
+    warmup = params['slow'] - 1
+    outputs = {
+        'macd': _mask_warmup(line, offset, warmup),
+        'signal': _mask_warmup(signal, offset, warmup),
+        'histogram': _mask_warmup(line - signal, offset, warmup)
+    }
+    return outputs, {'fast': last_fast, 'slow': last_slow, 'signal': last_signal}
+
+
+def _atr(inputs, params, state, offset):
+    high, low, close = inputs['high'], inputs['low'], inputs['close']
+    prev_close = state.get('prev_close')
+    previous = np.concatenate([[np.nan if prev_close is None else prev_close], close[:-1]])[:len(close)]
+    # 첫 봉(직전 종가 없음)은 고가-저가 (fmax는 NaN을 무시)
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - previous), np.abs(low - previous)))
+    atr, last_atr = _ema(true_range, 1.0 / params['window'], state.get('atr'))
+    new_state = {'prev_close': float(close[-1]) if len(close) else prev_close, 'atr': last_atr}
+    return {'atr': _mask_warmup(atr, offset, params['window'] - 1)}, new_state
+
+
+_INDICATOR_FUNCTIONS: Dict[str, Callable] = {
+    'sma': _sma,
+    'ema': _ema_indicator,
+    'bollinger': _bollinger,
+    'rsi': _rsi,
+    'macd': _macd,
+    'atr': _atr,
+}
+
+_INPUT_COLUMNS = ('open', 'high', 'low', 'close')
+
+
+def compute_indicator(name: str, params: Dict[str, Any], inputs: Dict[str, np.ndarray],
+                      state: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    지표 계산 (state가 있으면 그 뒤에 이어지는 봉만 계산)
+
+    Args:
+        name: 지표 이름 (INDICATOR_DEFAULTS 키)
+        params: 파라미터 (resolve_indicator 결과)
+        inputs: {'open', 'high', 'low', 'close'} float 배열 (이어서 계산할 때는 새 봉만)
+        state: 직전 계산이 돌려준 상태
+
+    Returns:
+        (출력 이름별 배열, 다음 계산에 넘길 상태)
+    """
+    state = state or {'count': 0}
+    count = state['count']
+    arrays = {column: np.asarray(inputs[column], dtype=np.float64) for column in _INPUT_COLUMNS}
+    outputs, new_state = _INDICATOR_FUNCTIONS[name](arrays, params, state, count)
+    new_state['count'] = count + len(arrays['close'])
+    return outputs, new_state
+
+
+def _slice_inputs(inputs: Dict[str, np.ndarray], start: int, stop: Optional[int] = None) -> Dict[str, np.ndarray]:
+    return {column: inputs[column][start:stop] for column in _INPUT_COLUMNS}
+
+
+def _compute_full(name: str, params: Dict[str, Any], inputs: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """전체 계산 - 마지막 봉 직전 상태(stable_state)를 함께 보관"""
+    n = len(inputs['dates'])
+    head, stable_state = compute_indicator(name, params, _slice_inputs(inputs, 0, max(n - 1, 0)))
+    tail, _ = compute_indicator(name, params, _slice_inputs(inputs, max(n - 1, 0)), stable_state)
+    return {
+        'dates': inputs['dates'],
+        'outputs': {key: np.concatenate([head[key], tail[key]]) for key in head},
+        'stable_state': stable_state,
+        'stable_close': float(inputs['close'][n - 2]) if n >= 2 else None
+    }
+
+
+def _extend(entry: Dict[str, Any], name: str, params: Dict[str, Any],
+            inputs: Dict[str, np.ndarray]) -> Optional[Dict[str, Any]]:
+    """기존 결과의 마지막 봉 직전까지가 그대로이면 그 뒤만 이어서 계산 (아니면 None)"""
+    stable = len(entry['dates']) - 1
+    n = len(inputs['dates'])
+    if stable < 1 or n < stable + 1:
+        return None
+    if not np.array_equal(inputs['dates'][:stable], entry['dates'][:stable]):
+        return None
+    if float(inputs['close'][stable - 1]) != entry['stable_close']:
+        return None
+
+    middle, stable_state = compute_indicator(name, params, _slice_inputs(inputs, stable, n - 1),
+                                             entry['stable_state'])
+    tail, _ = compute_indicator(name, params, _slice_inputs(inputs, n - 1), stable_state)
+    return {
+        'dates': inputs['dates'],
+        'outputs': {key: np.concatenate([values[:stable], middle[key], tail[key]])
+                    for key, values in entry['outputs'].items()},
+        'stable_state': stable_state,
+        'stable_close': float(inputs['close'][n - 2])
+    }
+
+
+def get_indicator(series_key: Tuple[Hashable, ...], version: Optional[str], spec: Any,
+                  load_inputs: Callable[[], Optional[Dict[str, np.ndarray]]]) -> Optional[Dict[str, Any]]:
+    """
+    지표 결과 조회 (캐시 → 새 봉만 이어서 계산 → 전체 계산)
+
+    Args:
+        series_key: 입력 시계열 식별자 (예: (데이터 폴더, 종목, 시간축))
+        version: 데이터 버전 (같으면 캐시 그대로 사용)
+        spec: resolve_indicator가 받는 지표 지정
+        load_inputs: 캐시에 없을 때 호출 - {'dates': datetime64 배열, 'open', 'high', 'low', 'close'}
+
+    Returns:
+        {'dates', 'outputs': {출력 이름: 배열}} 또는 None (입력 데이터 없음)
+    """
+    name, params = resolve_indicator(spec)
+    key = (series_key, name, tuple(sorted(params.items())))
+    with _cache_lock:
+        entry = _indicator_cache.get(key)
+        if entry is not None:
+            _indicator_cache.move_to_end(key)
+            if entry['version'] == version and version is not None:
+                _stats['hits'] += 1
+                return entry
+
+    inputs = load_inputs()
+    if not inputs or len(inputs['dates']) == 0:
+        return None
+
+    result = _extend(entry, name, params, inputs) if entry is not None else None
+    with _cache_lock:
+        _stats['incremental' if result is not None else 'full'] += 1
+    if result is None:
+        result = _compute_full(name, params, inputs)
+    else:
+        logger.info(f"📐 지표 이어서 계산: {series_key[1:]} {name} (+{len(inputs['dates']) - len(entry['dates'])}봉)")
+    result['version'] = version
+
+    with _cache_lock:
+        _indicator_cache[key] = result
+        _indicator_cache.move_to_end(key)
+        while len(_indicator_cache) > _CACHE_SIZE:
+            _indicator_cache.popitem(last=False)
+    return result
+
+
+def align_to_dates(result: Dict[str, Any], dates: np.ndarray) -> Dict[str, np.ndarray]:
+    """지표 출력을 화면 날짜에 맞춤 (없는 날짜는 NaN)"""
+    source_dates = result['dates']
+    positions = np.searchsorted(source_dates, dates)
+    positions = np.minimum(positions, len(source_dates) - 1)
+    valid = source_dates[positions] == dates
+    aligned = {}
+    for key, values in result['outputs'].items():
+        out = np.full(len(dates), np.nan)
+        out[valid] = values[positions[valid]]
+        aligned[key] = out
+    return aligned
+
+
+def get_indicator_stats() -> Dict[str, int]:
+    """캐시 히트/이어서 계산/전체 계산 횟수"""
+    with _cache_lock:
+        return dict(_stats, cached=len(_indicator_cache))
+
+
+def indicator_labels(specs: List[Any]) -> List[Tuple[str, str]]:
+    """선택된 지표의 (라벨, 색) 목록 - 범례 표시용"""
+    labels = []
+    for spec in specs:
+        preset = INDICATOR_PRESETS.get(spec) if isinstance(spec, str) else None
+        if preset is not None:
+            labels.append((preset['label'], preset['color']))
+        else:
+            try:
+                name, params = resolve_indicator(spec)
+            except ValueError:
+                continue
+            labels.append((f"{name.upper()} {', '.join(str(v) for v in params.values())}", '#555555'))
+    return labels
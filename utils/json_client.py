@@ -3,34 +3,99 @@ JSON 데이터 클라이언트 - gzip 압축 지원
 JSON 파일에서 직접 데이터를 읽어오는 최적화된 클라이언트
 """
 import json
-import gzip
-import streamlit as st
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 import logging
 import os
 
+import numpy as np
+
+from utils.catalog import load_data_manifest
+from utils.columnar import PERIOD_DAYS, PRICE_COLUMNS, SIGNAL_COLUMNS, period_start, slice_columns
+from utils.chunk_store import load_chunk_events, load_chunked_columns, read_chunk_index
+from utils.compression import DATA_EXTENSIONS, open_data_file
+from utils.data_pack import run_pack
+from utils.disk_cache import get_disk_cache
+from utils.events import EVENTS_VERSION, build_event_arrays, find_events, slice_events
+from utils.json_stream import load_columns, read_last_date
+from utils.shared_store import attach_columns, build_lock, get_shared_dir, publish_columns
+from utils.single_flight import SingleFlight
+from utils.trendlines import get_trendlines
+
 logger = logging.getLogger(__name__)
 
+# 세션(클라이언트)이 달라도 같은 파일/구간 로드는 프로세스 내에서 한 번만 실행
+_load_flight = SingleFlight()
+
+# 디스크 캐시의 전체 기간 항목은 요청 경로 밖에서 한 번에 하나씩 채움 (진행 중인 (종목, 버전) 중복 방지)
+_disk_fill_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-fill")
+_disk_fill_pending = set()
+_disk_fill_lock = threading.Lock()
+
+
+def wait_disk_fills():
+    """예약된 디스크 캐시 채우기가 모두 끝날 때까지 대기 (작업 스레드 1개 - 순서대로 실행)"""
+    _disk_fill_executor.submit(lambda: None).result()
+
+
+def _fill_disk_columns(cache, file_path: str, symbol: str, version: str):
+    """원본 파일 전체를 파싱하여 디스크 캐시('columns')에 저장"""
+    try:
+        if cache.get_arrays('columns', (symbol, version)) is None:
+            logger.info(f"💾 디스크 캐시 채우기: {symbol}")
+            columns, meta = load_columns(file_path)
+            if columns and len(columns['dates']):
+                cache.put_arrays('columns', (symbol, version),
+                                 dict(columns, _meta=np.array(json.dumps(meta, default=str))))
+    except Exception as e:
+        logger.error(f"디스크 캐시 채우기 실패: {symbol}, {e}")
+    finally:
+        with _disk_fill_lock:
+            _disk_fill_pending.discard((symbol, version))
+
+
+def _schedule_disk_fill(cache, file_path: str, symbol: str, version: str):
+    """전체 기간 디스크 캐시 항목을 백그라운드에서 채우도록 예약 (이미 예약되었으면 생략)"""
+    with _disk_fill_lock:
+        if (symbol, version) in _disk_fill_pending:
+            return
+        _disk_fill_pending.add((symbol, version))
+    _disk_fill_executor.submit(_fill_disk_columns, cache, file_path, symbol, version)
+
+
+def _covers(loaded_from: Optional[np.datetime64], start: Optional[np.datetime64]) -> bool:
+    """loaded_from부터 로드한 컬럼이 start부터의 구간을 포함하는지 (None: 전체 기간)"""
+    return loaded_from is None or (start is not None and start >= loaded_from)
+
 
 class InvestSmartJSONClient:
-    """InvestSmart JSON 데이터 클라이언트 - 최적화된 캐싱 버전"""
+    """InvestSmart JSON 데이터 클라이언트 - 최적화된 캐싱 버전 (Streamlit 비의존)"""
     
     def __init__(self, data_dir: str = "data"):
         self.data_dir = data_dir
-        self._cache = {}  # 종목별 데이터 캐시 (로컬)
-        self._processed_cache = {}  # 처리된 데이터 캐시 (로컬)
-        
-        # Streamlit session_state 초기화
-        if 'json_data_cache' not in st.session_state:
-            st.session_state.json_data_cache = {}
-        if 'processed_data_cache' not in st.session_state:
-            st.session_state.processed_data_cache = {}
-        if 'cache_stats' not in st.session_state:
-            st.session_state.cache_stats = {
-                'cache_hits': 0,
-                'cache_misses': 0,
-                'total_requests': 0
-            }
+        self._cache = {}  # 종목별 (데이터 버전, 데이터) 캐시 (로컬)
+        self._processed_cache = {}  # 처리된 데이터 (데이터 버전, 결과) 캐시 (로컬)
+        # 종목별 컬럼형(numpy) 데이터 캐시: (데이터 버전, 시작일(None: 전체 기간), 컬럼, 부가 정보)
+        # 여러 스레드가 같은 클라이언트를 쓰므로 항목 전체를 한 번에 교체
+        self._columns_cache = {}
+        self._events_cache = {}  # 종목별 (데이터 버전, 전체 기간 이벤트 배열)
+        self._available_symbols = None  # 종목 목록 캐시
+        self._data_info = None  # 데이터 정보 캐시
+        self._version_cache = {}  # (경로, 수정시각, 크기) → 내용 해시
+        self.cache_stats = {
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'total_requests': 0
+        }
+        # 프로세스 공용 클라이언트(스크립트 스레드 + 차트 작업 스레드)의 캐시 교체/통계 갱신 보호
+        self._lock = threading.Lock()
+    
+    def _count(self, stat: str):
+        """캐시 통계 증가 (스레드 안전)"""
+        with self._lock:
+            self.cache_stats[stat] += 1
     
     def _get_symbol_filename(self, symbol: str, compressed: bool = True) -> str:
         """종목 심볼을 파일명으로 변환 - 압축 지원"""
@@ -41,77 +106,285 @@ class InvestSmartJSONClient:
         else:
             return f"signals_{safe_symbol}.json"
     
+    def _get_symbol_path(self, symbol: str) -> Optional[str]:
+        """종목의 실제 데이터 파일 경로 (DATA_EXTENSIONS 순서 - 압축 파일 우선, 없으면 None)"""
+        stem = self._get_symbol_filename(symbol, compressed=False)
+        for extension in DATA_EXTENSIONS:
+            file_path = os.path.join(self.data_dir, stem[:-len('.json')] + extension)
+            if os.path.exists(file_path):
+                return file_path
+        return None
+    
+    def get_data_version(self, symbol: str) -> Optional[str]:
+        """
+        종목 데이터 버전 식별자 - 파일 내용 해시 기반
+        
+        데이터 파일이 교체되면 값이 바뀌므로 사전 렌더링/통계 캐시 무효화에 사용합니다.
+        (배포 시 파일 수정시각이 바뀌어도 내용이 같으면 동일한 버전)
+        """
+        file_path = self._get_symbol_path(symbol)
+        if file_path is None:
+            return None
+        stat = os.stat(file_path)
+        stat_key = (file_path, stat.st_mtime_ns, stat.st_size)
+        version = self._version_cache.get(stat_key)
+        if version is None:
+            digest = hashlib.sha1()
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+            version = digest.hexdigest()[:16]
+            self._version_cache[stat_key] = version
+        return version
+    
     def _load_symbol_data(self, symbol: str) -> List[Dict]:
-        """특정 종목의 JSON 파일에서 데이터 로드 - gzip 압축 지원"""
+        """특정 종목의 JSON 파일에서 데이터 로드 - gzip/lzma/zstd 압축 지원"""
         try:
-            # 1. Streamlit session_state에서 먼저 확인
-            if symbol in st.session_state.json_data_cache:
-                st.session_state.cache_stats['cache_hits'] += 1
+            # 1. 로컬 캐시에서 확인 (데이터 파일이 바뀌었으면 다시 로드)
+            version = self.get_data_version(symbol)
+            cached = self._cache.get(symbol)
+            if cached is not None and cached[0] == version:
+                self._count('cache_hits')
                 logger.info(f"✅ 캐시 히트: {symbol}")
-                return st.session_state.json_data_cache[symbol]
-            
-            # 2. 로컬 캐시에서 확인
-            if symbol in self._cache:
-                st.session_state.cache_stats['cache_hits'] += 1
-                logger.info(f"✅ 로컬 캐시 히트: {symbol}")
-                # session_state에도 저장
-                st.session_state.json_data_cache[symbol] = self._cache[symbol]
-                return self._cache[symbol]
+                return cached[1]
             
-            # 3. 파일에서 로드 (압축 파일 우선, 없으면 일반 파일)
-            st.session_state.cache_stats['cache_misses'] += 1
+            # 2. 파일에서 로드 (압축 파일 우선, 없으면 일반 파일)
+            self._count('cache_misses')
             logger.info(f"📁 파일에서 로드: {symbol}")
             
-            # 압축 파일 시도
-            compressed_filename = self._get_symbol_filename(symbol, compressed=True)
-            compressed_file_path = os.path.join(self.data_dir, compressed_filename)
-            
-            # 일반 파일 시도
-            normal_filename = self._get_symbol_filename(symbol, compressed=False)
-            normal_file_path = os.path.join(self.data_dir, normal_filename)
-            
-            data = []
-            
-            # 압축 파일이 있으면 압축 해제로 로드
-            if os.path.exists(compressed_file_path):
-                logger.info(f"📦 압축 파일 로드: {compressed_filename}")
-                with gzip.open(compressed_file_path, 'rt', encoding='utf-8') as f:
-                    data = json.load(f)
-            # 일반 파일이 있으면 일반 로드
-            elif os.path.exists(normal_file_path):
-                logger.info(f"📄 일반 파일 로드: {normal_filename}")
-                with open(normal_file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
+            # 압축 파일(zstd/lzma/gzip) 또는 일반 파일
+            file_path = self._get_symbol_path(symbol)
+            if file_path is None:
                 logger.warning(f"파일이 존재하지 않음: {symbol}")
                 return []
+            logger.info(f"📦 파일 로드: {os.path.basename(file_path)}")
+            with open_data_file(file_path, 'rt') as f:
+                data = json.load(f)
                 
-            # 4. 모든 캐시에 저장
-            self._cache[symbol] = data
-            st.session_state.json_data_cache[symbol] = data
+            # 3. 캐시에 저장
+            self._cache[symbol] = (version, data)
             return data
             
         except Exception as e:
             logger.error(f"JSON 파일 로드 실패: {symbol}, {e}")
             return []
     
+    def get_columns(self, symbol: str, start: Optional[np.datetime64] = None) -> Optional[Dict[str, Any]]:
+        """
+        종목 데이터를 컬럼별 numpy 배열로 조회 (캐시)
+        
+        연도별 청크(utils.chunk_store)가 최신이면 start 이후를 덮는 청크만 읽고,
+        없으면 원본 파일을 스트리밍으로 읽어 start 이전 행은 버립니다.
+        
+        Args:
+            symbol: 종목 심볼
+            start: 조회 시작일 (None이면 전체 기간)
+        
+        Returns:
+            utils.columnar.rows_to_columns 형식의 딕셔너리, 데이터가 없으면 None
+        """
+        try:
+            # 같은 데이터 버전으로 캐시된 구간이 요청 구간을 덮으면 잘라서 반환
+            version = self.get_data_version(symbol)
+            entry = self._columns_cache.get(symbol)
+            if entry is not None and entry[0] == version and _covers(entry[1], start):
+                self._count('cache_hits')
+                columns = entry[2]
+                return columns if start is None else slice_columns(columns, start)
+            
+            file_path = self._get_symbol_path(symbol)
+            if file_path is None:
+                logger.warning(f"파일이 존재하지 않음: {symbol}")
+                return None
+            
+            self._count('cache_misses')
+            shared_dir = get_shared_dir()
+            if shared_dir:
+                # 멀티 프로세스 실행: 전체 기간을 공유 mmap으로 연결하고 요청 구간은 뷰로 반환
+                key = (os.path.abspath(file_path), version, 'shared')
+                columns, meta = _load_flight.do(key, self._load_shared_columns, shared_dir, file_path,
+                                                symbol, version)
+            else:
+                key = (os.path.abspath(file_path), version, None if start is None else str(start))
+                columns, meta = _load_flight.do(key, self._read_columns, file_path, symbol, version, start)
+            if not columns or len(columns['dates']) == 0:
+                return None
+            
+            loaded_from = None if shared_dir else start
+            with self._lock:
+                # 다른 스레드가 같은 버전의 더 넓은 구간을 먼저 저장했으면 좁은 구간으로 덮어쓰지 않음
+                current = self._columns_cache.get(symbol)
+                if current is None or current[0] != version or _covers(loaded_from, current[1]):
+                    self._columns_cache[symbol] = (version, loaded_from, columns, meta)
+            return slice_columns(columns, start) if shared_dir and start is not None else columns
+            
+        except Exception as e:
+            logger.error(f"컬럼 데이터 변환 실패: {symbol}, {e}")
+            return None
+    
+    def _read_columns(self, file_path: str, symbol: str, version: Optional[str],
+                      start: Optional[np.datetime64]):
+        """
+        청크(최신일 때), 디스크 캐시 또는 원본 파일에서 컬럼 로드 - (컬럼, 부가 정보)
+        
+        디스크 캐시에 없을 때 구간(start) 요청은 해당 구간만 스트리밍으로 읽고, 전체 기간
+        항목은 백그라운드에서 채웁니다 (다음 로드부터 디스크 캐시 사용).
+        """
+        index = read_chunk_index(self.data_dir, symbol, version)
+        if index is not None:
+            logger.info(f"🧱 청크 로드: {symbol} (from {start or 'start'})")
+            columns = load_chunked_columns(self.data_dir, index, start)
+            return columns, {'symbol': symbol, 'last_updated': index.get('last_updated')}
+        cache = get_disk_cache()
+        if cache is None or version is None:
+            logger.info(f"📦 스트리밍 로드: {os.path.basename(file_path)}")
+            return load_columns(file_path, start=None if start is None else str(start))
+        
+        # 영구 디스크 캐시: 전체 기간을 파싱해 저장해 두고 요청 구간만 잘라 사용 (재시작 후에도 유지)
+        arrays = cache.get_arrays('columns', (symbol, version))
+        if arrays is not None:
+            logger.info(f"💾 디스크 캐시 로드: {symbol}")
+            meta = json.loads(str(arrays.pop('_meta')))
+            columns = arrays
+        elif start is not None:
+            logger.info(f"📦 스트리밍 로드: {os.path.basename(file_path)} (from {start})")
+            _schedule_disk_fill(cache, file_path, symbol, version)
+            return load_columns(file_path, start=str(start))
+        else:
+            logger.info(f"📦 스트리밍 로드: {os.path.basename(file_path)}")
+            columns, meta = load_columns(file_path)
+            if columns and len(columns['dates']):
+                cache.put_arrays('columns', (symbol, version),
+                                 dict(columns, _meta=np.array(json.dumps(meta, default=str))))
+        if start is not None and columns:
+            columns = {name: values.copy() for name, values in slice_columns(columns, start).items()}
+        return columns, meta
+    
+    def _load_shared_columns(self, shared_dir: str, file_path: str, symbol: str, version: Optional[str]):
+        """공유 저장소의 전체 기간 컬럼 연결 (없으면 한 워커만 파싱하여 게시) - (컬럼, 부가 정보)"""
+        attached = attach_columns(shared_dir, symbol, version)
+        if attached is not None:
+            return attached
+        with build_lock(shared_dir, symbol, version):
+            attached = attach_columns(shared_dir, symbol, version)
+            if attached is not None:
+                return attached
+            columns, meta = self._read_columns(file_path, symbol, version, None)
+            if not columns or len(columns['dates']) == 0:
+                return columns, meta
+            if not publish_columns(shared_dir, symbol, version, columns, meta):
+                return columns, meta
+        # 파싱한 사본 대신 공유 페이지를 사용하도록 게시본으로 교체
+        return attach_columns(shared_dir, symbol, version) or (columns, meta)
+    
+    def _cached_meta(self, symbol: str) -> Dict[str, Any]:
+        """캐시된 컬럼의 부가 정보 (last_updated 등)"""
+        entry = self._columns_cache.get(symbol)
+        return entry[3] if entry is not None else {}
+    
+    def get_period_columns(self, symbol: str, period: str) -> Optional[Dict[str, Any]]:
+        """
+        마지막 날짜 기준 조회 기간(period)의 컬럼 데이터
+        
+        마지막 날짜는 청크 index 또는 파일 끝부분(read_last_date)에서 읽으므로 전체 기간을
+        로드하지 않습니다. 청크가 있으면 해당 기간의 청크만 읽고, 디스크 캐시에 전체 기간이
+        있으면 잘라 쓰며, 둘 다 없으면 스트리밍 파서가 조회 기간만 배열로 만듭니다 (디스크
+        캐시는 백그라운드에서 채움 - _read_columns). 컬럼 캐시에는 조회 구간만 남습니다.
+        """
+        if PERIOD_DAYS.get(period) is None:
+            return self.get_columns(symbol)
+        
+        last_date = self._last_date(symbol)
+        if last_date is None:
+            columns = self.get_columns(symbol)
+            if columns is None:
+                return None
+            last_date = columns['dates'][-1]
+        return self.get_columns(symbol, period_start(last_date, period))
+    
+    def _last_date(self, symbol: str) -> Optional[np.datetime64]:
+        """전체 기간을 로드하지 않고 마지막 날짜 조회 (캐시된 전체 기간 → 청크 index → 파일 끝부분)"""
+        version = self.get_data_version(symbol)
+        entry = self._columns_cache.get(symbol)
+        if entry is not None and entry[0] == version and entry[1] is None and len(entry[2]['dates']):
+            return entry[2]['dates'][-1]
+        index = read_chunk_index(self.data_dir, symbol, version)
+        if index is not None and index['chunks']:
+            return np.datetime64(index['chunks'][-1]['end'], 'D')
+        if get_shared_dir():
+            return None  # 공유 저장소는 전체 기간을 한 번에 연결하므로 그대로 사용
+        file_path = self._get_symbol_path(symbol)
+        last_date = read_last_date(file_path) if file_path is not None else None
+        return np.datetime64(last_date, 'D') if last_date else None
+    
+    def get_events(self, symbol: str, compute: bool = True) -> Optional[Dict[str, np.ndarray]]:
+        """
+        전체 기간 시그널/FCV 이벤트 (utils.events.build_event_arrays 형식, 캐시)
+        
+        데이터 빌드 단계(utils.chunk_store)가 저장한 이벤트를 우선 사용하고, 없으면 전체 기간
+        컬럼에서 계산하여 디스크 캐시에 저장합니다. 전체 기간 컬럼은 컬럼 캐시에 넣지 않습니다
+        (조회 구간만 캐시된 상태 유지).
+        
+        Args:
+            compute: False면 저장된 이벤트만 조회 (없으면 None - 전체 기간을 로드하지 않음)
+        """
+        try:
+            version = self.get_data_version(symbol)
+            cached = self._events_cache.get(symbol)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            
+            index = read_chunk_index(self.data_dir, symbol, version)
+            events = load_chunk_events(self.data_dir, index) if index is not None else None
+            if events is None:
+                cache = get_disk_cache() if version is not None else None
+                key = (symbol, version, EVENTS_VERSION)
+                events = cache.get_arrays('events', key) if cache is not None else None
+                if events is None:
+                    if not compute:
+                        return None
+                    columns = self._full_columns(symbol, version)
+                    if columns is None or len(columns['dates']) == 0:
+                        return None
+                    events = build_event_arrays(columns)
+                    if cache is not None:
+                        cache.put_arrays('events', key, events)
+            
+            self._events_cache[symbol] = (version, events)
+            return events
+        except Exception as e:
+            logger.error(f"이벤트 조회 실패: {symbol}, {e}")
+            return None
+    
+    def _full_columns(self, symbol: str, version: Optional[str]) -> Optional[Dict[str, Any]]:
+        """전체 기간 컬럼 (캐시된 전체 기간이 없으면 컬럼 캐시를 건드리지 않고 로드)"""
+        entry = self._columns_cache.get(symbol)
+        if entry is not None and entry[0] == version and entry[1] is None:
+            return entry[2]
+        file_path = self._get_symbol_path(symbol)
+        if file_path is None:
+            return None
+        return self._read_columns(file_path, symbol, version, None)[0]
+    
     def get_signals_data(self, symbol: str, period: str = "1y") -> Dict[str, Any]:
         """특정 종목의 신호 데이터 조회 - 최적화된 캐싱 버전"""
         try:
             # 통계 업데이트
-            st.session_state.cache_stats['total_requests'] += 1
+            self._count('total_requests')
             
-            # 처리된 데이터 캐시에서 먼저 확인
+            # 처리된 데이터 캐시에서 먼저 확인 (데이터 파일이 바뀌었으면 다시 처리)
             cache_key = f"{symbol}_{period}"
-            if cache_key in st.session_state.processed_data_cache:
-                st.session_state.cache_stats['cache_hits'] += 1
+            version = self.get_data_version(symbol)
+            cached = self._processed_cache.get(cache_key)
+            if cached is not None and cached[0] == version:
+                self._count('cache_hits')
                 logger.info(f"✅ 처리된 데이터 캐시 히트: {symbol}")
-                return st.session_state.processed_data_cache[cache_key]
+                return cached[1]
             
-            # 원본 데이터 로드 (이미 최적화된 캐싱 적용)
-            symbol_data = self._load_symbol_data(symbol)
+            # 조회 기간의 컬럼 데이터 로드 (청크/스트리밍 파서 + 캐시)
+            columns = self.get_period_columns(symbol, period)
             
-            if not symbol_data:
+            if columns is None or len(columns['dates']) == 0:
                 return {
                     'symbol': symbol,
                     'dates': [],
@@ -120,30 +393,18 @@ class InvestSmartJSONClient:
                     'error': '데이터를 찾을 수 없습니다'
                 }
             
-            # 데이터 구조화 - 최적화된 버전 (한 번에 처리)
-            dates = []
-            stock_data = {'open': [], 'high': [], 'low': [], 'close': [], 'volume': []}
-            signals_data = {
-                'short_signal_v1': [], 'short_signal_v2': [], 'long_signal': [],
-                'combined_signal_v1': [], 'macd_signal': [], 'momentum_color_signal': []
-            }
-            indicators_data = {'Final_Composite_Value': []}
-            
-            # 한 번의 루프로 모든 데이터 처리 (성능 최적화)
-            for item in symbol_data:
-                dates.append(item['date'])
-                stock_data['open'].append(item.get('open', 0))
-                stock_data['high'].append(item.get('high', 0))
-                stock_data['low'].append(item.get('low', 0))
-                stock_data['close'].append(item.get('close', 0))
-                stock_data['volume'].append(item.get('volume', 0))
-                signals_data['short_signal_v1'].append(item.get('short_signal_v1', 0))
-                signals_data['short_signal_v2'].append(item.get('short_signal_v2', 0))
-                signals_data['long_signal'].append(item.get('long_signal', 0))
-                signals_data['combined_signal_v1'].append(item.get('combined_signal_v1', 0))
-                signals_data['macd_signal'].append(item.get('macd_signal', 0))
-                signals_data['momentum_color_signal'].append(item.get('momentum_color_signal', 0))
-                indicators_data['Final_Composite_Value'].append(item.get('fcv', 0))
+            # 컬럼 배열 → 리스트 (차트 모듈 입력 형식 유지)
+            dates = np.datetime_as_string(columns['dates'], unit='D').tolist()
+            stock_data = {name: columns[name].tolist() for name in PRICE_COLUMNS}
+            signals_data = {name: columns[name].tolist() for name in SIGNAL_COLUMNS}
+            indicators_data = {'Final_Composite_Value': columns['fcv'].tolist()}
+            # 저장된 전체 기간 이벤트가 있으면 구간에 맞추고, 없으면 조회 구간 컬럼에서 바로 계산
+            # (구간 데이터만으로 계산한 결과와 같으므로 전체 기간을 로드하지 않음)
+            events = self.get_events(symbol, compute=False)
+            if events is not None:
+                events = slice_events(events, columns['dates'])
+            else:
+                events = find_events({name: columns[name] for name in SIGNAL_COLUMNS}, columns['fcv'])
             
             # 결과 데이터 구성
             result = {
@@ -152,12 +413,14 @@ class InvestSmartJSONClient:
                 'data': stock_data,
                 'signals': signals_data,
                 'indicators': indicators_data,
-                'trendlines': [],  # 추세선 데이터 (나중에 추가 예정)
-                'last_updated': symbol_data[-1].get('last_updated', dates[-1]) if symbol_data else None
+                'trendlines': get_trendlines(symbol, period, 'daily', version, columns),
+                'events': events,
+                'last_updated': self._cached_meta(symbol).get('last_updated', dates[-1]),
+                'data_version': version
             }
             
             # 처리된 데이터를 캐시에 저장
-            st.session_state.processed_data_cache[cache_key] = result
+            self._processed_cache[cache_key] = (version, result)
             
             return result
             
@@ -172,43 +435,21 @@ class InvestSmartJSONClient:
             }
     
     def get_available_symbols(self) -> List[str]:
-        """사용 가능한 종목 목록 조회 - 최적화된 지연 로딩"""
+        """사용 가능한 종목 목록 조회 - data/manifest.json 기반 지연 로딩"""
         try:
             # 캐시에서 먼저 확인
-            if 'available_symbols' in st.session_state:
-                st.session_state.cache_stats['cache_hits'] += 1
+            if self._available_symbols is not None:
+                self._count('cache_hits')
                 logger.info("✅ 종목 목록 캐시 히트")
-                return st.session_state.available_symbols
+                return self._available_symbols
             
-            # 파일명만 읽어서 빠르게 처리
-            symbols = []
-            if os.path.exists(self.data_dir):
-                # 파일명 패턴 매핑 (성능 최적화)
-                symbol_mapping = {
-                    "KS11": "^KS11", "IXIC": "^IXIC", "GSPC": "^GSPC", "DJI": "^DJI",
-                    "FTSE": "^FTSE", "GDAXI": "^GDAXI", "FCHI": "^FCHI", "N225": "^N225",
-                    "HSI": "^HSI", "AXJO": "^AXJO", "GCF": "GC=F", "SIF": "SI=F",
-                    "CLF": "CL=F", "NGF": "NG=F", "ZCF": "ZC=F", "ZSF": "ZS=F",
-                    "USDKRWX": "USDKRW=X", "EURUSDX": "EURUSD=X", "GBPUSDX": "GBPUSD=X",
-                    "USDJPYX": "USDJPY=X", "005930KS": "005930.KS"
-                }
-                
-                # 파일명만 읽기 (JSON 파일 내용은 읽지 않음) - 압축 파일 지원
-                for filename in os.listdir(self.data_dir):
-                    if filename.startswith("signals_") and (filename.endswith(".json") or filename.endswith(".json.gz")):
-                        # 파일명에서 심볼 추출 (압축 파일과 일반 파일 모두 처리)
-                        if filename.endswith(".json.gz"):
-                            symbol = filename.replace("signals_", "").replace(".json.gz", "")
-                        else:
-                            symbol = filename.replace("signals_", "").replace(".json", "")
-                        # 매핑 테이블 사용 (성능 최적화)
-                        symbol = symbol_mapping.get(symbol, symbol)
-                        symbols.append(symbol)
+            # 데이터 manifest (각 파일 첫 행의 심볼, 바뀐 파일만 다시 읽음 - 압축/일반 파일 중복 제거)
+            symbols = list(load_data_manifest(self.data_dir)['symbols'])
             
             # 정렬 및 캐싱
             symbols = sorted(symbols)
-            st.session_state.available_symbols = symbols
-            st.session_state.cache_stats['cache_misses'] += 1
+            self._available_symbols = symbols
+            self._count('cache_misses')
             logger.info(f"📁 종목 목록 파일에서 로드: {len(symbols)}개")
             return symbols
             
@@ -220,10 +461,10 @@ class InvestSmartJSONClient:
         """데이터 정보 조회 - 최적화된 버전"""
         try:
             # 캐시에서 먼저 확인
-            if 'data_info' in st.session_state:
-                st.session_state.cache_stats['cache_hits'] += 1
+            if self._data_info is not None:
+                self._count('cache_hits')
                 logger.info("✅ 데이터 정보 캐시 히트")
-                return st.session_state.data_info
+                return self._data_info
             
             symbols = self.get_available_symbols()
             
@@ -233,9 +474,8 @@ class InvestSmartJSONClient:
             
             # 파일 크기로 대략적인 레코드 수 추정 (성능 최적화)
             for symbol in symbols:
-                filename = self._get_symbol_filename(symbol)
-                file_path = os.path.join(self.data_dir, filename)
-                if os.path.exists(file_path):
+                file_path = self._get_symbol_path(symbol)
+                if file_path is not None:
                     # 파일 크기로 대략적인 레코드 수 추정 (JSON 평균 크기 기준)
                     file_size = os.path.getsize(file_path)
                     estimated_records = max(1, file_size // 200)  # 평균 200바이트/레코드
@@ -251,8 +491,8 @@ class InvestSmartJSONClient:
             }
             
             # 캐시에 저장
-            st.session_state.data_info = result
-            st.session_state.cache_stats['cache_misses'] += 1
+            self._data_info = result
+            self._count('cache_misses')
             logger.info(f"📁 데이터 정보 파일에서 로드: {len(symbols)}개 종목")
             return result
             
@@ -263,7 +503,7 @@ class InvestSmartJSONClient:
     def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 조회"""
         try:
-            stats = st.session_state.cache_stats
+            stats = self.cache_stats
             total_requests = stats['total_requests']
             cache_hits = stats['cache_hits']
             cache_misses = stats['cache_misses']
@@ -275,8 +515,8 @@ class InvestSmartJSONClient:
                 'cache_hits': cache_hits,
                 'cache_misses': cache_misses,
                 'hit_rate': round(hit_rate, 2),
-                'cached_symbols': len(st.session_state.json_data_cache),
-                'processed_cache_size': len(st.session_state.processed_data_cache)
+                'cached_symbols': len(set(self._cache) | set(self._columns_cache)),
+                'processed_cache_size': len(self._processed_cache)
             }
         except Exception as e:
             logger.error(f"캐시 통계 조회 실패: {e}")
@@ -285,67 +525,48 @@ class InvestSmartJSONClient:
     def clear_cache(self):
         """캐시 초기화"""
         try:
-            st.session_state.json_data_cache.clear()
-            st.session_state.processed_data_cache.clear()
-            st.session_state.cache_stats = {
+            self.cache_stats = {
                 'cache_hits': 0,
                 'cache_misses': 0,
                 'total_requests': 0
             }
             self._cache.clear()
             self._processed_cache.clear()
+            self._columns_cache.clear()
+            self._events_cache.clear()
+            self._available_symbols = None
+            self._data_info = None
             logger.info("✅ 모든 캐시가 초기화되었습니다.")
         except Exception as e:
             logger.error(f"캐시 초기화 실패: {e}")
     
     def compress_json_files(self) -> Dict[str, Any]:
-        """JSON 파일들을 gzip으로 압축"""
+        """원본 JSON만 있는 종목 파일을 gzip으로 압축 (utils.data_pack 프로세스 풀, 스트리밍)"""
         try:
-            compressed_count = 0
-            total_savings = 0
-            
-            symbols = self.get_available_symbols()
-            
-            for symbol in symbols:
-                # 일반 JSON 파일 경로
-                normal_filename = self._get_symbol_filename(symbol, compressed=False)
-                normal_file_path = os.path.join(self.data_dir, normal_filename)
-                
-                # 압축 파일 경로
-                compressed_filename = self._get_symbol_filename(symbol, compressed=True)
-                compressed_file_path = os.path.join(self.data_dir, compressed_filename)
-                
-                # 일반 파일이 있고 압축 파일이 없으면 압축
-                if os.path.exists(normal_file_path) and not os.path.exists(compressed_file_path):
-                    try:
-                        # 원본 파일 크기
-                        original_size = os.path.getsize(normal_file_path)
-                        
-                        # 압축 파일 생성
-                        with open(normal_file_path, 'rb') as f_in:
-                            with gzip.open(compressed_file_path, 'wb') as f_out:
-                                f_out.write(f_in.read())
-                        
-                        # 압축 파일 크기
-                        compressed_size = os.path.getsize(compressed_file_path)
-                        savings = original_size - compressed_size
-                        savings_percent = (savings / original_size) * 100
-                        
-                        total_savings += savings
-                        compressed_count += 1
-                        
-                        logger.info(f"📦 압축 완료: {symbol} ({original_size:,} → {compressed_size:,} bytes, {savings_percent:.1f}% 절약)")
-                        
-                    except Exception as e:
-                        logger.error(f"압축 실패: {symbol}, {e}")
-            
+            summary = run_pack(self.data_dir, 'gzip', only_uncompressed=True)
+            total_savings = summary['original_bytes'] - summary['packed_bytes']
+            self._available_symbols = None  # 파일 구성이 바뀌었으므로 종목 목록 다시 조회
             return {
-                'compressed_files': compressed_count,
+                'compressed_files': summary['packed'],
                 'total_savings_bytes': total_savings,
                 'total_savings_mb': round(total_savings / (1024 * 1024), 2),
-                'average_savings_percent': round((total_savings / (total_savings + (total_savings * 0.3))) * 100, 1) if total_savings > 0 else 0
+                'average_savings_percent': summary['savings_percent']
             }
             
         except Exception as e:
             logger.error(f"JSON 파일 압축 실패: {e}")
-            return {'compressed_files': 0, 'total_savings_bytes': 0, 'total_savings_mb': 0, 'average_savings_percent': 0}
\ No newline at end of file
+            return {'compressed_files': 0, 'total_savings_bytes': 0, 'total_savings_mb': 0, 'average_savings_percent': 0}
+
+
+# 프로세스 공용 클라이언트 (배치 작업, 벤치마크, 워커 프로세스용)
+_shared_clients: Dict[str, InvestSmartJSONClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(data_dir: str) -> InvestSmartJSONClient:
+    """data_dir별로 프로세스 내 하나의 클라이언트 인스턴스 반환"""
+    key = os.path.abspath(data_dir)
+    with _shared_clients_lock:
+        if key not in _shared_clients:
+            _shared_clients[key] = InvestSmartJSONClient(key)
+        return _shared_clients[key]
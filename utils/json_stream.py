@@ -0,0 +1,237 @@
+"""
+스트리밍 JSON 파서 - 신호 파일을 압축 해제하면서 컬럼 배열에 바로 채움
+
+json.load는 파일 전체를 행(dict) 리스트로 만든 뒤에야 다음 처리가 가능하지만,
+이 파서는 압축 해제된 텍스트를 일정 크기씩 읽어 행 객체를 하나씩 디코딩하고
+미리 할당한 numpy 컬럼에 즉시 기록합니다. 중간 행 리스트가 없으므로 종목 하나를
+로드할 때의 최대 메모리는 최종 배열 크기 수준입니다.
+
+- 배열 크기는 압축 해제 후 전체 크기(gzip ISIZE / zstd 헤더)를 첫 행 길이로 나눠 추정
+- start: 이전 날짜의 행은 디코딩하지 않고 원문의 "date" 값만 비교해 건너뜀 (최근 구간만 필요한 경우)
+- end: 이후 날짜의 행이 나오면 읽기를 조기 종료 (날짜 오름차순 파일 기준)
+- read_last_date: 행을 디코딩하지 않고 파일 끝부분에서 마지막 날짜만 읽음 (조회 기간 계산용)
+"""
+import json
+import os
+import re
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from utils.columnar import PRICE_COLUMNS, SIGNAL_COLUMNS
+from utils.compression import codec_for_path, open_data_file, uncompressed_size
+
+# 압축 해제 텍스트를 읽는 단위 (문자 수)
+CHUNK_SIZE = 256 * 1024
+
+# 행 길이를 알기 전의 행당 평균 바이트 추정치 (들여쓰기 포함 JSON 기준)
+ROW_BYTES_ESTIMATE = 380
+
+# 압축 해제 크기를 알 수 없는 코덱(lzma 등)의 압축률 추정치 (배열 크기 추정용)
+COMPRESSION_RATIO_ESTIMATE = 10
+
+# 컬럼 배열에 한 번에 기록하는 행 수
+BLOCK_ROWS = 256
+
+# 마지막 날짜를 찾을 때 유지하는 파일 끝부분 크기 (행 여러 개 분량, 바이트)
+TAIL_BYTES = 8 * 1024
+
+_SKIP_SEPARATORS = re.compile(r'[\s,]*')
+_decoder = json.JSONDecoder()
+_DATE_FIELD = re.compile(rb'"date"\s*:\s*"([^"]+)"')
+_ROW_DATE = re.compile(r'"date"\s*:\s*"([^"]+)"')
+
+
+def _uncompressed_size(path: str) -> int:
+    """압축 해제 후 크기 (헤더/트레일러에 없으면 압축 파일 크기로 추정)"""
+    size = uncompressed_size(path)
+    if size is None:
+        return os.path.getsize(path) * COMPRESSION_RATIO_ESTIMATE
+    return size
+
+
+def _open_text(path: str):
+    """압축 코덱에 맞춰 텍스트 모드로 열기"""
+    return open_data_file(path, 'rt')
+
+
+def iter_rows(f, skip_before: Optional[str] = None) -> Iterator[Tuple[Optional[Dict[str, Any]], int]]:
+    """
+    최상위 배열의 행 객체를 하나씩 디코딩
+
+    Args:
+        skip_before: 'YYYY-MM-DD' - 원문의 "date" 값이 이보다 앞선 평면 행은 디코딩하지 않음
+            (날짜 오름차순 파일 기준 - 이 날짜 이후 행이 나오면 비교도 중단)
+
+    Yields:
+        (행 딕셔너리 - 건너뛴 행이면 None, 행 텍스트 길이)
+    """
+    buffer = f.read(CHUNK_SIZE)
+    pos = 0
+    # 배열 시작 '[' 찾기
+    while True:
+        pos = _SKIP_SEPARATORS.match(buffer, pos).end()
+        if pos < len(buffer):
+            break
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        buffer, pos = chunk, 0
+    if buffer[pos] != '[':
+        raise ValueError("신호 파일은 JSON 배열이어야 합니다")
+    pos += 1
+
+    eof = False
+    while True:
+        pos = _SKIP_SEPARATORS.match(buffer, pos).end()
+        if pos < len(buffer) and buffer[pos] == ']':
+            return
+        if skip_before is not None and pos < len(buffer):
+            # 행 끝('}')까지가 버퍼에 있고 중첩 객체가 없으면 날짜 문자열만 비교
+            end = buffer.find('}', pos)
+            if end != -1 and buffer.find('{', pos + 1, end) == -1:
+                match = _ROW_DATE.search(buffer, pos, end)
+                if match is not None and match.group(1) < skip_before:
+                    yield None, end + 1 - pos
+                    pos = end + 1
+                    continue
+                skip_before = None
+        try:
+            if pos >= len(buffer):
+                raise json.JSONDecodeError("버퍼 끝", buffer, pos)
+            row, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # 행이 청크 경계에 걸림 - 처리한 앞부분은 버리고 다음 청크를 이어 붙임
+            if eof:
+                raise
+            chunk = f.read(CHUNK_SIZE)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield row, end - pos
+        pos = end
+
+
+def _allocate(capacity: int) -> Dict[str, np.ndarray]:
+    """컬럼 배열 할당 (rows_to_columns와 같은 dtype)"""
+    columns = {'dates': np.empty(capacity, dtype='datetime64[D]')}
+    for name in PRICE_COLUMNS:
+        columns[name] = np.empty(capacity, dtype=np.float64)
+    for name in SIGNAL_COLUMNS:
+        columns[name] = np.empty(capacity, dtype=np.int8)
+    columns['fcv'] = np.empty(capacity, dtype=np.float64)
+    return columns
+
+
+def _grow(columns: Dict[str, np.ndarray], capacity: int) -> Dict[str, np.ndarray]:
+    """추정치를 넘으면 기존 값을 유지한 채 배열 확장"""
+    grown = _allocate(capacity)
+    for name, values in columns.items():
+        grown[name][:len(values)] = values
+    return grown
+
+
+def load_columns(path: str, start: Optional[str] = None,
+                 end: Optional[str] = None) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    신호 파일을 스트리밍으로 읽어 컬럼 배열 생성
+
+    Args:
+        path: signals_*.json(.gz/.xz/.zst) 경로
+        start: 'YYYY-MM-DD' - 이 날짜 이전 행은 디코딩 없이 건너뜀 (iter_rows skip_before)
+        end: 'YYYY-MM-DD' - 이 날짜 이후 행이 나오면 읽기 종료
+
+    Returns:
+        (utils.columnar.rows_to_columns 형식의 컬럼, {'symbol', 'last_updated', 'rows_read'})
+    """
+    total_size = _uncompressed_size(path)
+    capacity = max(16, total_size // ROW_BYTES_ESTIMATE)
+    columns = None
+    count = 0
+    rows_read = 0
+    skipped_size = 0
+    meta = {'symbol': None, 'last_updated': None, 'rows_read': 0}
+
+    # 숫자 컬럼은 작은 블록 단위로 모아 한 번에 기록 (요소별 numpy 대입보다 빠름)
+    value_names = PRICE_COLUMNS + SIGNAL_COLUMNS + ['fcv']
+    signal_indexes = {value_names.index(name) for name in SIGNAL_COLUMNS}
+    block_dates = []
+    block_values = []
+
+    def flush():
+        nonlocal columns, capacity, count
+        size = len(block_dates)
+        if not size:
+            return
+        if count + size > capacity:
+            capacity = max(capacity * 2, count + size)
+            columns = _grow({name: values[:count] for name, values in columns.items()}, capacity)
+        columns['dates'][count:count + size] = block_dates
+        values = np.array(block_values, dtype=np.float64)
+        for i, name in enumerate(value_names):
+            if i in signal_indexes:
+                # null 시그널은 NaN이 되므로 int8 변환 전에 0으로 (NaN → 정수 변환은 값이 정의되지 않음)
+                columns[name][count:count + size] = np.nan_to_num(values[:, i], nan=0.0)
+            else:
+                columns[name][count:count + size] = values[:, i]
+        count += size
+        block_dates.clear()
+        block_values.clear()
+
+    with _open_text(path) as f:
+        for row, row_size in iter_rows(f, skip_before=start):
+            rows_read += 1
+            if row is None:
+                skipped_size += row_size
+                continue
+            if columns is None:
+                # 첫 행 길이로 (건너뛴 앞부분을 뺀) 남은 행 수를 다시 추정
+                capacity = max(0, total_size - skipped_size) // max(row_size, 1) + 16
+                columns = _allocate(capacity)
+                meta['symbol'] = row.get('symbol')
+
+            date = row['date']
+            if end is not None and date > end:
+                break
+            if start is not None and date < start:
+                continue
+
+            block_dates.append(date)
+            block_values.append([row.get(name, 0) for name in value_names])
+            meta['last_updated'] = row.get('last_updated', date)
+            if len(block_dates) == BLOCK_ROWS:
+                flush()
+        flush()
+
+    meta['rows_read'] = rows_read
+    if columns is None:
+        columns = _allocate(0)
+    # 추정치보다 크게 적으면(구간 로드 등) 여유 공간을 돌려주고, 아니면 복사 없이 뷰 반환
+    if count < capacity * 0.9:
+        columns = {name: values[:count].copy() for name, values in columns.items()}
+    else:
+        columns = {name: values[:count] for name, values in columns.items()}
+    return columns, meta
+
+
+def read_last_date(path: str) -> Optional[str]:
+    """
+    마지막 행의 날짜 ('YYYY-MM-DD', 날짜 오름차순 파일 기준)
+
+    원본 파일은 끝부분만 읽고, 압축 파일은 JSON 디코딩 없이 압축 해제만 하며 끝부분을 유지합니다.
+
+    Returns:
+        날짜 문자열 또는 None (찾지 못한 경우)
+    """
+    if codec_for_path(path) is None:
+        with open(path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - TAIL_BYTES))
+            tail = f.read()
+    else:
+        tail = b''
+        with open_data_file(path, 'rb') as f:
+            for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+                tail = block[-TAIL_BYTES:] if len(block) >= TAIL_BYTES else (tail + block)[-TAIL_BYTES:]
+    matches = _DATE_FIELD.findall(tail)
+    return matches[-1].decode('utf-8')[:10] if matches else None
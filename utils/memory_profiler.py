@@ -0,0 +1,322 @@
+"""
+메모리 프로파일러 - 장시간 실행되는 Streamlit 프로세스의 메모리 증가 원인 추적
+
+컨테이너 메모리가 재시작 전까지 계속 늘어날 때 세션, 캐시, Plotly Figure 중
+무엇이 원인인지 구분하기 위한 계측입니다.
+
+- RSS와 tracemalloc 사용량, 클라이언트/모듈 캐시별 추정 크기, 세션 수와 상태 크기를
+  주기적으로 표본 기록하여 시작 시점 대비 증가량과 시간당 증가율을 계산
+- 요청 시 tracemalloc을 시작하고 기준 스냅샷 대비 증가한 할당 위치 상위 목록 제공
+- 살아 있는 Plotly Figure 수 (gc 순회 - 요청 시에만)
+- 전체 보고서를 JSON으로 저장 (개발자 모드 다운로드 / write_memory_report)
+
+Streamlit에 의존하지 않으며, 세션 정보는 앱이 record_session으로 전달합니다.
+"""
+import gc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from utils.shared_store import shared_store_stats
+
+logger = logging.getLogger(__name__)
+
+# 표본 기록 간격(초) / 보관 표본 수 (기본 2시간)
+SAMPLE_INTERVAL_S = 60
+MAX_SAMPLES = 120
+
+# 이 시간 동안 실행 기록이 없는 세션은 종료된 것으로 간주
+SESSION_TTL_S = 30 * 60
+
+# 리스트/딕셔너리 크기 추정 시 실제로 측정할 원소 수 (나머지는 평균으로 외삽)
+SIZE_SAMPLE_ITEMS = 64
+
+# 클라이언트 캐시 속성 (utils.json_client.InvestSmartJSONClient)
+CLIENT_CACHES = ('_cache', '_processed_cache', '_columns_cache', '_events_cache',
+                 '_version_cache')
+
+# 모듈 전역 캐시 (이미 import된 모듈만 측정 - 측정 때문에 무거운 모듈을 로드하지 않음)
+MODULE_CACHES = (
+    ('utils.chart_jobs', '_futures'),
+    ('utils.backtest', '_result_cache'),
+    ('utils.backtest', '_universe_cache'),
+    ('utils.signal_stats', '_symbol_cache'),
+    ('utils.signal_stats', '_universe_cache'),
+    ('utils.comparison', '_index_cache'),
+    ('utils.comparison', '_aligned_cache'),
+    ('utils.chunk_store', '_index_cache'),
+    ('utils.catalog', '_manifest_cache'),
+    ('utils.catalog', '_catalog_cache'),
+    ('utils.search_index', '_index_cache'),
+    ('utils.prerender', '_manifest_cache'),
+    ('utils.indicators', '_indicator_cache'),
+    ('utils.trendlines', '_trendline_cache'),
+    ('utils.snapshot_diff', '_columns_cache'),
+    ('utils.snapshot_diff', '_diff_cache'),
+)
+
+_samples: "deque[Dict[str, Any]]" = deque(maxlen=MAX_SAMPLES)
+_sessions: Dict[str, Dict[str, Any]] = {}
+_baseline_snapshot: Optional[tracemalloc.Snapshot] = None
+_lock = threading.Lock()
+_sampler_thread: Optional[threading.Thread] = None
+
+
+def estimate_bytes(obj: Any, _depth: int = 0) -> int:
+    """
+    객체의 대략적인 메모리 크기 (numpy는 nbytes, 큰 컨테이너는 표본 평균으로 외삽)
+    """
+    if isinstance(obj, np.memmap):
+        return sys.getsizeof(obj)  # 공유 저장소(utils.shared_store) mmap - 프로세스 간 공유 페이지
+    if isinstance(obj, np.ndarray):
+        # 데이터를 소유한 배열은 getsizeof에 버퍼가 포함됨 (뷰는 보이는 구간만 합산)
+        return sys.getsizeof(obj) if obj.base is None else sys.getsizeof(obj) + obj.nbytes
+    size = sys.getsizeof(obj)
+    if _depth > 6:
+        return size
+    if isinstance(obj, dict):
+        items = list(obj.items())
+        sample = items[:SIZE_SAMPLE_ITEMS]
+        if sample:
+            measured = sum(estimate_bytes(k, _depth + 1) + estimate_bytes(v, _depth + 1) for k, v in sample)
+            size += measured * len(items) // len(sample)
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        items = obj if isinstance(obj, (list, tuple)) else list(obj)
+        sample = items[:SIZE_SAMPLE_ITEMS]
+        if sample:
+            size += sum(estimate_bytes(item, _depth + 1) for item in sample) * len(items) // len(sample)
+    return size
+
+
+def process_rss_bytes() -> Optional[int]:
+    """현재 RSS (Linux /proc, 그 외에는 최대 RSS)"""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == 'darwin' else maxrss * 1024
+    except Exception:
+        return None
+
+
+def client_cache_sizes(client) -> Dict[str, Dict[str, int]]:
+    """클라이언트 캐시별 {'entries', 'bytes'}"""
+    sizes = {}
+    for name in CLIENT_CACHES:
+        cache = getattr(client, name, None)
+        if cache is None:
+            continue
+        # 다른 스레드가 갱신 중일 수 있으므로 복사본으로 측정
+        cache = dict(cache)
+        sizes[name.lstrip('_')] = {'entries': len(cache), 'bytes': estimate_bytes(cache)}
+    return sizes
+
+
+def module_cache_sizes() -> Dict[str, Dict[str, int]]:
+    """모듈 전역 캐시별 {'entries', 'bytes'} (차트 작업은 결과 Figure 제외 - 개수만)"""
+    sizes = {}
+    for module_name, attribute in MODULE_CACHES:
+        module = sys.modules.get(module_name)
+        cache = getattr(module, attribute, None) if module is not None else None
+        if cache is None:
+            continue
+        cache = dict(cache)
+        key = f"{module_name.split('.')[-1]}.{attribute.lstrip('_')}"
+        if module_name == 'utils.chart_jobs':
+            sizes[key] = {'entries': len(cache), 'bytes': estimate_bytes(list(cache))}
+        else:
+            sizes[key] = {'entries': len(cache), 'bytes': estimate_bytes(cache)}
+    return sizes
+
+
+def count_live_figures() -> int:
+    """살아 있는 Plotly Figure 객체 수 (plotly를 import한 경우에만, gc 전체 순회)"""
+    module = sys.modules.get('plotly.basedatatypes')
+    if module is None:
+        return 0
+    base = module.BaseFigure
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, base))
+
+
+def record_session(session_id: str, footprint: Dict[str, Any]):
+    """세션 실행 기록 (utils.session_budget.session_footprint 결과)"""
+    with _lock:
+        _sessions[session_id] = {'keys': footprint['keys'], 'bytes': footprint['bytes'], 'seen': time.time()}
+
+
+def session_summary() -> Dict[str, Any]:
+    """최근 SESSION_TTL_S 안에 실행된 세션 수와 상태 크기"""
+    now = time.time()
+    with _lock:
+        for session_id in [sid for sid, info in _sessions.items() if now - info['seen'] > SESSION_TTL_S]:
+            del _sessions[session_id]
+        sessions = list(_sessions.values())
+    total = sum(info['bytes'] for info in sessions)
+    return {
+        'live_sessions': len(sessions),
+        'state_bytes_total': total,
+        'state_bytes_max': max((info['bytes'] for info in sessions), default=0),
+        'state_bytes_avg': total // len(sessions) if sessions else 0
+    }
+
+
+def _filtered_snapshot() -> tracemalloc.Snapshot:
+    """tracemalloc 자체와 import 기계 할당을 제외한 스냅샷"""
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+
+
+def start_tracing(frames: int = 10) -> bool:
+    """tracemalloc 시작 및 기준 스냅샷 저장 (이미 실행 중이면 기준만 갱신)"""
+    global _baseline_snapshot
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+        logger.info(f"🧠 tracemalloc 시작 (frames={frames})")
+    with _lock:
+        _baseline_snapshot = _filtered_snapshot()
+    return True
+
+
+def stop_tracing():
+    """tracemalloc 중지 (추적 자체가 메모리와 CPU를 사용하므로 확인 후 중지)"""
+    global _baseline_snapshot
+    with _lock:
+        _baseline_snapshot = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+        logger.info("🧠 tracemalloc 중지")
+
+
+def top_allocations(limit: int = 15) -> List[Dict[str, Any]]:
+    """
+    기준 스냅샷 대비 증가한 할당 위치 상위 목록 (tracemalloc 실행 중에만)
+
+    Returns:
+        [{'location', 'size_diff_kb', 'size_kb', 'count_diff'}, ...]
+    """
+    if not tracemalloc.is_tracing():
+        return []
+    snapshot = _filtered_snapshot()
+    with _lock:
+        baseline = _baseline_snapshot
+    if baseline is None:
+        stats = [(stat.traceback, stat.size, stat.size, stat.count)
+                 for stat in snapshot.statistics('lineno')[:limit]]
+    else:
+        stats = [(stat.traceback, stat.size_diff, stat.size, stat.count_diff)
+                 for stat in snapshot.compare_to(baseline, 'lineno')[:limit]]
+    return [{
+        'location': f"{os.path.relpath(frame.filename) if not frame.filename.startswith('<') else frame.filename}:{frame.lineno}",
+        'size_diff_kb': round(size_diff / 1024, 1),
+        'size_kb': round(size / 1024, 1),
+        'count_diff': count_diff
+    } for traceback, size_diff, size, count_diff in stats for frame in traceback[:1]]
+
+
+def take_sample(client=None) -> Dict[str, Any]:
+    """현재 메모리 상태 표본 기록"""
+    caches = client_cache_sizes(client) if client is not None else {}
+    sample = {
+        'time': time.time(),
+        'rss_bytes': process_rss_bytes(),
+        'traced_bytes': tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+        'client_cache_bytes': sum(info['bytes'] for info in caches.values()),
+        'module_cache_bytes': sum(info['bytes'] for info in module_cache_sizes().values()),
+        'live_sessions': session_summary()['live_sessions'],
+        'gc_objects': len(gc.get_objects())
+    }
+    _samples.append(sample)
+    return sample
+
+
+def growth_report() -> Dict[str, Any]:
+    """첫 표본 대비 증가량과 시간당 증가율"""
+    samples = list(_samples)
+    if len(samples) < 2:
+        return {'samples': len(samples), 'elapsed_s': 0, 'deltas': {}, 'per_hour': {}}
+    first, last = samples[0], samples[-1]
+    elapsed = last['time'] - first['time']
+    deltas, per_hour = {}, {}
+    for key in ('rss_bytes', 'traced_bytes', 'client_cache_bytes', 'module_cache_bytes', 'live_sessions', 'gc_objects'):
+        if first.get(key) is None or last.get(key) is None:
+            continue
+        deltas[key] = last[key] - first[key]
+        per_hour[key] = round(deltas[key] * 3600 / elapsed) if elapsed > 0 else 0
+    return {'samples': len(samples), 'elapsed_s': round(elapsed), 'deltas': deltas, 'per_hour': per_hour}
+
+
+def _sample_loop(client, interval: float):
+    while True:
+        try:
+            take_sample(client)
+        except Exception as e:
+            logger.error(f"메모리 표본 기록 실패: {e}")
+        time.sleep(interval)
+
+
+def start_memory_sampler(client, interval: float = SAMPLE_INTERVAL_S) -> threading.Thread:
+    """백그라운드 메모리 표본 기록 시작 (프로세스당 한 번)"""
+    global _sampler_thread
+    with _lock:
+        if _sampler_thread is None:
+            _sampler_thread = threading.Thread(target=_sample_loop, args=(client, interval),
+                                               name="memory-sampler", daemon=True)
+            _sampler_thread.start()
+        return _sampler_thread
+
+
+def memory_report(client=None, include_figures: bool = False, allocation_limit: int = 15) -> Dict[str, Any]:
+    """
+    전체 메모리 보고서
+
+    Args:
+        client: 캐시 크기를 측정할 JSON 클라이언트
+        include_figures: 살아 있는 Plotly Figure 수 포함 (gc 전체 순회)
+        allocation_limit: tracemalloc 상위 할당 위치 수
+    """
+    report = {
+        'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'pid': os.getpid(),
+        'rss_bytes': process_rss_bytes(),
+        'tracemalloc': {
+            'tracing': tracemalloc.is_tracing(),
+            'traced_bytes': tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+            'peak_bytes': tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None,
+            'top_allocations': top_allocations(allocation_limit)
+        },
+        'client_caches': client_cache_sizes(client) if client is not None else {},
+        'module_caches': module_cache_sizes(),
+        'sessions': session_summary(),
+        'growth': growth_report(),
+        'shared_store': shared_store_stats()
+    }
+    if include_figures:
+        report['live_figures'] = count_live_figures()
+    return report
+
+
+def write_memory_report(path: str, client=None, include_figures: bool = True) -> str:
+    """메모리 보고서를 JSON 파일로 저장"""
+    report = memory_report(client, include_figures=include_figures)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    logger.info(f"🧠 메모리 보고서 저장: {path}")
+    return path
@@ -0,0 +1,231 @@
+"""
+차트 사전 렌더링 - 데이터 배포 후 모든 종목의 기본 차트를 미리 생성
+
+종목 × 시간축(daily/weekly/monthly)별 기본 화면을 프로세스 풀로 생성하여
+직렬화된 Figure JSON(및 kaleido 설치 시 PNG/SVG 이미지)으로 저장합니다.
+앱은 저장된 파일을 즉시 표시하고, 사용자가 상호작용을 시작할 때만
+인터랙티브 차트를 새로 생성합니다.
+
+사용법 (데이터 배포 직후 실행):
+    python -m utils.prerender                       # Figure JSON만 생성
+    python -m utils.prerender --formats json png    # 이미지도 함께 생성
+    python -m utils.prerender --symbols AAPL ^KS11 --workers 4
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.json_client import get_shared_client
+from utils.chart_core import DEFAULT_PERIOD, TIMEFRAME_GROUPS, build_chart, default_chart_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = os.path.join(parent_dir, "data")
+PRERENDER_DIRNAME = "prerendered"
+MANIFEST_FILENAME = "manifest.json"
+IMAGE_FORMATS = ("png", "svg")
+IMAGE_SIZE = {'width': 1200, 'height': 450}  # 차트 툴바 다운로드 크기와 동일한 비율
+
+
+def get_prerender_dir(data_dir: str) -> str:
+    """사전 렌더링 결과 폴더 경로"""
+    return os.path.join(data_dir, PRERENDER_DIRNAME)
+
+
+def _artifact_basename(symbol: str, timeframe: str) -> str:
+    """종목/시간축별 파일명 (확장자 제외)"""
+    safe_symbol = symbol.replace('^', '').replace('=', '').replace('/', '_')
+    return f"{safe_symbol}_{timeframe}"
+
+
+def _images_supported() -> bool:
+    """plotly 정적 이미지 내보내기(kaleido) 사용 가능 여부"""
+    try:
+        import kaleido  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def prerender_symbol(data_dir: str, symbol: str, formats: List[str]) -> Dict[str, Any]:
+    """
+    한 종목의 기본 차트(daily/weekly/monthly)를 생성하여 저장 - 프로세스 풀 작업 단위
+
+    Returns:
+        manifest에 기록할 종목 항목 {'source_version', 'timeframes': {...}}
+    """
+    client = get_shared_client(data_dir)
+    out_dir = get_prerender_dir(data_dir)
+    entry = {'source_version': client.get_data_version(symbol), 'timeframes': {}}
+
+    for timeframe in TIMEFRAME_GROUPS:
+        chart = build_chart(client, symbol, DEFAULT_PERIOD, default_chart_settings(timeframe))
+        if chart['error'] or chart['figure'] is None:
+            logger.warning(f"사전 렌더링 건너뜀: {symbol} {timeframe}, {chart['error']}")
+            continue
+
+        basename = _artifact_basename(symbol, timeframe)
+        artifacts = {}
+        if 'json' in formats:
+            artifacts['json'] = f"{basename}.json"
+            _write_atomic(os.path.join(out_dir, artifacts['json']), chart['figure'].to_json().encode('utf-8'))
+        for image_format in IMAGE_FORMATS:
+            if image_format in formats:
+                artifacts[image_format] = f"{basename}.{image_format}"
+                image_bytes = chart['figure'].to_image(format=image_format, **IMAGE_SIZE)
+                _write_atomic(os.path.join(out_dir, artifacts[image_format]), image_bytes)
+
+        entry['timeframes'][timeframe] = {
+            'files': artifacts,
+            'fcv_has_green': chart['fcv_has_green'],
+            'fcv_has_red': chart['fcv_has_red']
+        }
+    return entry
+
+
+def _write_atomic(path: str, payload: bytes):
+    """임시 파일에 쓴 뒤 교체하여 앱이 반쯤 쓰인 파일을 읽지 않도록 함"""
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def run_prerender(data_dir: str, symbols: Optional[List[str]] = None, workers: Optional[int] = None,
+                  formats: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    전체(또는 지정) 종목 사전 렌더링 실행
+
+    Args:
+        data_dir: 신호 데이터 폴더
+        symbols: 대상 종목 (기본: 전체)
+        workers: 프로세스 수 (기본: CPU 수)
+        formats: 'json', 'png', 'svg' 중 생성할 형식
+
+    Returns:
+        실행 요약 {'rendered', 'failed', 'elapsed_s'}
+    """
+    formats = list(formats or ['json'])
+    if any(f in IMAGE_FORMATS for f in formats) and not _images_supported():
+        logger.warning("kaleido가 설치되지 않아 이미지 형식은 건너뜁니다 (Figure JSON만 생성).")
+        formats = [f for f in formats if f not in IMAGE_FORMATS]
+    if not formats:
+        formats = ['json']
+
+    client = get_shared_client(data_dir)
+    symbols = symbols or sorted(set(client.get_available_symbols()))
+    out_dir = get_prerender_dir(data_dir)
+    os.makedirs(out_dir, exist_ok=True)
+
+    manifest = _read_manifest(out_dir)
+    failed = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(prerender_symbol, data_dir, symbol, formats): symbol for symbol in symbols}
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                manifest['symbols'][symbol] = future.result()
+                logger.info(f"🖼️ 사전 렌더링 완료: {symbol}")
+            except Exception as e:
+                failed[symbol] = str(e)
+                logger.error(f"사전 렌더링 실패: {symbol}, {e}")
+
+    manifest['period'] = DEFAULT_PERIOD
+    manifest['generated_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    _write_atomic(os.path.join(out_dir, MANIFEST_FILENAME),
+                  json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    return {
+        'rendered': len(symbols) - len(failed),
+        'failed': failed,
+        'elapsed_s': round(time.perf_counter() - start, 2)
+    }
+
+
+def _read_manifest(out_dir: str) -> Dict[str, Any]:
+    """기존 manifest 로드 (없거나 손상되었으면 빈 manifest)"""
+    manifest_path = os.path.join(out_dir, MANIFEST_FILENAME)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        manifest.setdefault('symbols', {})
+        return manifest
+    except (OSError, ValueError):
+        return {'symbols': {}}
+
+
+_manifest_cache: Dict[str, Any] = {}
+
+
+def get_prerendered_chart(client, symbol: str, timeframe: str, period: str) -> Optional[Dict[str, Any]]:
+    """
+    최신 데이터와 일치하는 사전 렌더링 결과 조회
+
+    Returns:
+        {'json': 경로, 'png': 경로, ..., 'fcv_has_green', 'fcv_has_red'} 또는 None
+    """
+    try:
+        out_dir = get_prerender_dir(client.data_dir)
+        manifest_path = os.path.join(out_dir, MANIFEST_FILENAME)
+        if not os.path.exists(manifest_path):
+            return None
+
+        # manifest는 파일 수정시각이 바뀔 때만 다시 읽음
+        mtime = os.path.getmtime(manifest_path)
+        cached = _manifest_cache.get(manifest_path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, _read_manifest(out_dir))
+            _manifest_cache[manifest_path] = cached
+        manifest = cached[1]
+
+        if manifest.get('period') != period:
+            return None
+        entry = manifest['symbols'].get(symbol)
+        if not entry or entry.get('source_version') != client.get_data_version(symbol):
+            return None  # 데이터가 다시 배포되어 사전 렌더링이 오래됨
+        timeframe_entry = entry['timeframes'].get(timeframe)
+        if not timeframe_entry:
+            return None
+
+        result = {
+            'fcv_has_green': timeframe_entry.get('fcv_has_green', False),
+            'fcv_has_red': timeframe_entry.get('fcv_has_red', False)
+        }
+        for kind, filename in timeframe_entry['files'].items():
+            path = os.path.join(out_dir, filename)
+            if os.path.exists(path):
+                result[kind] = path
+        return result if len(result) > 2 else None
+    except Exception as e:
+        logger.error(f"사전 렌더링 조회 실패: {symbol} {timeframe}, {e}")
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 기본 차트 사전 렌더링")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="신호 데이터 폴더")
+    parser.add_argument("--symbols", nargs="*", help="대상 종목 (기본: 전체)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--formats", nargs="+", default=["json"], choices=["json", "png", "svg"],
+                        help="생성할 형식")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    summary = run_prerender(os.path.abspath(args.data_dir), args.symbols, args.workers, args.formats)
+    print(f"사전 렌더링 완료: {summary['rendered']}개 종목, 실패 {len(summary['failed'])}개, {summary['elapsed_s']}s")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""
+프로세스 풀 생성 - 앱(Streamlit 스레드)에서 호출해도 안전한 spawn 방식
+
+Linux 기본값인 fork는 다른 스레드가 잡고 있던 락까지 자식 프로세스에 복제하므로,
+여러 스레드가 도는 Streamlit 프로세스에서 풀을 만들면 자식이 교착될 수 있습니다.
+앱에서도 호출되는 작업(전체 백테스트, 데이터 재압축)은 이 함수로 풀을 만듭니다.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+
+def spawn_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """spawn 방식으로 작업 프로세스를 시작하는 ProcessPoolExecutor"""
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
@@ -0,0 +1,217 @@
+"""
+종목 검색 인덱스 - 카탈로그 이름/티커/별칭을 한 번 색인하여 빠르게 검색
+
+검색어를 입력할 때마다 전체 카탈로그를 lower() 부분 문자열로 훑는 대신,
+프로세스당 한 번 다음 인덱스를 만들어 두고 조회합니다.
+
+- 토큰 접두사 인덱스: 'app' → Apple, 'ks' → ^KS11 ...
+- 2/3-gram 인덱스: 이름/티커 중간 부분 문자열 검색 ('vidi' → NVIDIA, 'ks' → 148070.KS)
+- 별칭: 'kospi', '코스피', 'samsung' 등 카탈로그 이름에 없는 검색어
+- 오타 허용: 결과가 없으면 첫 글자가 같은 토큰 어휘에서 비슷한 단어로 재검색 ('nvidai' → NVIDIA)
+
+결과는 일치 종류(티커 일치 > 별칭 > 단어 일치 > 접두사 > 부분 문자열 > 유사어)
+순으로 정렬되며, 데이터 파일이 있는 종목만 포함됩니다.
+"""
+import difflib
+import heapq
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 카탈로그 이름으로 찾기 어려운 검색어 → 티커
+SYMBOL_ALIASES = {
+    "kospi": "^KS11", "코스피": "^KS11",
+    "nasdaq": "^IXIC", "나스닥": "^IXIC",
+    "sp500": "^GSPC", "s&p": "^GSPC", "snp": "^GSPC",
+    "dow": "DIA", "다우": "DIA",
+    "nikkei": "^N225", "니케이": "^N225",
+    "samsung": "005930.KS", "삼성전자": "005930.KS", "삼성": "005930.KS",
+    "bitcoin": "BTC-USD", "btc": "BTC-USD", "비트코인": "BTC-USD",
+    "ethereum": "ETH-USD", "eth": "ETH-USD",
+    "gold": "GC=F", "금": "GC=F",
+    "oil": "CL=F", "wti": "CL=F", "원유": "CL=F",
+    "won": "USDKRW=X", "krw": "USDKRW=X", "환율": "USDKRW=X", "달러": "USDKRW=X",
+}
+
+# 일치 종류별 점수
+_SCORE_TICKER = 100
+_SCORE_ALIAS = 95
+_SCORE_WORD = 80
+_SCORE_TICKER_PREFIX = 70
+_SCORE_PREFIX = 60
+_SCORE_SUBSTRING = 40
+_SCORE_FUZZY = 20
+
+_MAX_PREFIX_LENGTH = 12
+_QUERY_CACHE_SIZE = 512
+_TOKEN_PATTERN = re.compile(r"[0-9a-z가-힣&]+(?:[.\-=^][0-9a-z]+)*")
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (소문자, 이모지/괄호 제거, 공백 하나로)"""
+    return " ".join(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def _ngrams(text: str, n: int) -> Set[str]:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class SymbolSearchIndex:
+    """종목 검색 인덱스 (생성 후 읽기 전용 - 여러 세션/스레드에서 공유)"""
+
+    def __init__(self, entries: Iterable[Tuple[str, str]], available_symbols: Iterable[str],
+                 aliases: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            entries: (표시 이름, 티커) 목록
+            available_symbols: 데이터 파일이 있는 티커
+            aliases: 별칭 → 티커
+        """
+        self.available = frozenset(available_symbols)
+        self.names: List[str] = []
+        self.tickers: List[str] = []
+        self._ticker_ids: Dict[str, int] = {}
+        self._texts: List[str] = []
+        self._tokens: Dict[str, Set[int]] = defaultdict(set)
+        self._prefixes: Dict[str, Set[int]] = defaultdict(set)
+        self._ticker_prefixes: Dict[str, Set[int]] = defaultdict(set)
+        self._ngram_index: Dict[str, Set[int]] = defaultdict(set)
+        self._aliases: Dict[str, int] = {}
+        self._query_cache: "OrderedDict[Tuple[str, int], List[Tuple[str, str]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        for name, ticker in entries:
+            if ticker in self.available and ticker not in self._ticker_ids:
+                self._add(name, ticker)
+        for alias, ticker in (aliases or {}).items():
+            if ticker not in self.available:
+                continue
+            if ticker not in self._ticker_ids:
+                self._add(ticker, ticker)
+            self._aliases[normalize(alias)] = self._ticker_ids[ticker]
+        # 오타 허용 검색 후보 (첫 글자별로 나눠 비교 대상을 줄임)
+        self._vocabulary: Dict[str, List[str]] = defaultdict(list)
+        for word in list(self._tokens) + list(self._aliases):
+            self._vocabulary[word[0]].append(word)
+
+    def _add(self, name: str, ticker: str):
+        entry_id = len(self.names)
+        self.names.append(name)
+        self.tickers.append(ticker)
+        self._ticker_ids[ticker] = entry_id
+
+        ticker_key = ticker.lower()
+        bare_ticker = ticker_key.lstrip('^').replace('=', '')
+        text = f"{normalize(name)} {ticker_key}"
+        self._texts.append(text)
+
+        for token in set(text.split()) | {ticker_key, bare_ticker}:
+            self._tokens[token].add(entry_id)
+            for length in range(1, min(len(token), _MAX_PREFIX_LENGTH) + 1):
+                self._prefixes[token[:length]].add(entry_id)
+        for key in (ticker_key, bare_ticker):
+            for length in range(1, min(len(key), _MAX_PREFIX_LENGTH) + 1):
+                self._ticker_prefixes[key[:length]].add(entry_id)
+        for gram in _ngrams(text, 2) | _ngrams(text, 3):
+            self._ngram_index[gram].add(entry_id)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(self, query: str, limit: int = 30) -> List[Tuple[str, str]]:
+        """
+        검색어로 종목 검색
+
+        Returns:
+            [(표시 이름, 티커), ...] 점수 높은 순
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        cache_key = (query, limit)
+        with self._cache_lock:
+            if cache_key in self._query_cache:
+                self._query_cache.move_to_end(cache_key)
+                return self._query_cache[cache_key]
+
+        scores = self._score(query)
+        ranked = heapq.nsmallest(limit, scores, key=lambda i: (-scores[i], len(self.names[i]), self.names[i]))
+        results = [(self.names[i], self.tickers[i]) for i in ranked]
+
+        with self._cache_lock:
+            self._query_cache[cache_key] = results
+            while len(self._query_cache) > _QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return results
+
+    def _score(self, query: str) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+
+        def bump(ids: Iterable[int], score: float):
+            for i in ids:
+                if scores.get(i, 0) < score:
+                    scores[i] = score
+
+        words = query.split()
+        ticker_id = self._ticker_ids.get(query.upper())
+        if ticker_id is not None:
+            bump([ticker_id], _SCORE_TICKER)
+        if query in self._aliases:
+            bump([self._aliases[query]], _SCORE_ALIAS)
+        for alias, alias_id in self._aliases.items():
+            if alias.startswith(query) and alias != query:
+                bump([alias_id], _SCORE_PREFIX)
+
+        # 여러 단어: 모든 단어가 (단어 또는 접두사로) 일치하는 종목
+        word_matches = [self._tokens.get(word, set()) for word in words]
+        prefix_matches = [self._prefixes.get(word[:_MAX_PREFIX_LENGTH], set()) for word in words]
+        if all(word_matches):
+            bump(set.intersection(*word_matches), _SCORE_WORD)
+        if all(prefix_matches):
+            candidates = set.intersection(*prefix_matches)
+            if any(len(word) > _MAX_PREFIX_LENGTH for word in words):
+                candidates = {i for i in candidates if all(word in self._texts[i] for word in words)}
+            bump(candidates, _SCORE_PREFIX)
+        bump(self._ticker_prefixes.get(query[:_MAX_PREFIX_LENGTH], set()) if len(words) == 1 else (), _SCORE_TICKER_PREFIX)
+
+        # 부분 문자열 (2글자는 2-gram 그대로, 그 이상은 3-gram 후보를 좁힌 뒤 실제 포함 여부 확인)
+        if len(query) == 2:
+            bump(self._ngram_index.get(query, set()), _SCORE_SUBSTRING)
+        elif len(query) >= 3:
+            grams = [self._ngram_index.get(gram, set()) for gram in _ngrams(query, 3)]
+            if all(grams):
+                bump((i for i in set.intersection(*grams) if query in self._texts[i]), _SCORE_SUBSTRING)
+
+        # 결과가 없으면 오타 허용 검색
+        if not scores and len(query) >= 3:
+            for word in words:
+                for match in difflib.get_close_matches(word, self._vocabulary.get(word[0], []), n=5, cutoff=0.75):
+                    ratio = difflib.SequenceMatcher(None, word, match).ratio()
+                    ids = self._tokens.get(match) or ({self._aliases[match]} if match in self._aliases else set())
+                    bump(ids, _SCORE_FUZZY * ratio)
+        return scores
+
+
+_index_cache: Dict[Tuple, SymbolSearchIndex] = {}
+_index_lock = threading.Lock()
+
+
+def get_search_index(categories: Dict[str, Dict[str, str]], available_symbols: Iterable[str]) -> SymbolSearchIndex:
+    """
+    카탈로그와 사용 가능 종목으로 만든 검색 인덱스 (프로세스 내 공유, 종목 목록이 바뀔 때만 재생성)
+
+    Args:
+        categories: {카테고리: {표시 이름: 티커}}
+        available_symbols: 데이터 파일이 있는 티커
+    """
+    available = frozenset(available_symbols)
+    key = (id(categories), hash(available))
+    with _index_lock:
+        index = _index_cache.get(key)
+        if index is None or index.available != available:
+            entries = [(name, ticker) for stocks in categories.values() for name, ticker in stocks.items()]
+            index = SymbolSearchIndex(entries, available, SYMBOL_ALIASES)
+            _index_cache.clear()
+            _index_cache[key] = index
+        return index
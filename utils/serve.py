@@ -0,0 +1,298 @@
+"""
+멀티 프로세스 실행 - 여러 Streamlit 워커 프로세스 + 로컬 로드밸런서
+
+Streamlit 프로세스 하나는 모든 사용자의 Python 작업을 하나의 GIL에서 실행하므로
+한 사용자의 차트 생성이 다른 사용자를 지연시킵니다. 이 모듈은 워커 프로세스를
+여러 개 내부 포트(127.0.0.1)에 띄우고, 공개 포트에서 TCP 연결을 워커로
+중계합니다. 워커들은 공유 폴더(utils.shared_store)를 통해 파싱된 데이터(mmap)와
+Figure를 함께 사용하므로 종목 데이터는 워커 수와 무관하게 한 벌만 메모리에 둡니다.
+
+- Streamlit 세션은 웹소켓 연결 하나에 묶이므로 연결 단위로 분배합니다.
+- 같은 클라이언트(X-Forwarded-For 또는 접속 IP)는 같은 워커로 보냅니다 (세션 재연결,
+  /media 이미지·다운로드 파일은 만든 워커에만 있음). 처음 보는 클라이언트는 연결 수가
+  가장 적은 워커에 배정합니다.
+- 종료된 워커는 다시 시작하고, 연결할 수 없는 워커는 건너뜁니다.
+- 워커 하나가 RSS 약 160MB를 쓰고 컨테이너 안의 os.cpu_count()는 호스트 CPU 수이므로
+  워커 수는 --workers 또는 INVESTSMART_WORKERS로 정하며, 기본값은 보수적으로 2개입니다.
+
+사용법:
+    python -m utils.serve                           # 워커 2개 (INVESTSMART_WORKERS), 포트 $PORT 또는 8501
+    python -m utils.serve --workers 4 --port 8501 --address 0.0.0.0
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.shared_store import SHARED_DIR_ENV, default_shared_dir, reset_shared_dir
+
+logger = logging.getLogger(__name__)
+
+APP_PATH = os.path.join(parent_dir, "app.py")
+DEFAULT_PORT = 8501
+
+# 워커 수 환경 변수 / 기본 워커 수 (CPU 수가 더 적으면 CPU 수)
+WORKERS_ENV = "INVESTSMART_WORKERS"
+DEFAULT_WORKERS = 2
+
+# 클라이언트 → 워커 고정 유지 시간 (마지막 연결 이후, 초)
+AFFINITY_TTL_S = 30 * 60
+# 요청 헤더 최대 크기 / 헤더 수신 대기 시간
+MAX_HEADER_BYTES = 64 * 1024
+HEADER_TIMEOUT_S = 10
+# 워커 재시작 확인 주기 (초)
+SUPERVISE_INTERVAL_S = 2
+
+
+def default_workers() -> int:
+    """기본 워커 수 - INVESTSMART_WORKERS, 없으면 min(DEFAULT_WORKERS, CPU 수)"""
+    value = os.environ.get(WORKERS_ENV)
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning(f"⚠️ {WORKERS_ENV} 값이 올바르지 않음: {value}")
+    return min(DEFAULT_WORKERS, os.cpu_count() or 1)
+
+
+class Worker:
+    """Streamlit 워커 프로세스 하나"""
+
+    def __init__(self, index: int, port: int, env: Dict[str, str], extra_args: List[str]):
+        self.index = index
+        self.port = port
+        self.env = env
+        self.extra_args = extra_args
+        self.process: Optional[subprocess.Popen] = None
+        self.active = 0  # 중계 중인 연결 수
+        self.restarts = 0
+
+    def start(self):
+        command = [
+            sys.executable, "-m", "streamlit", "run", APP_PATH,
+            "--server.port", str(self.port),
+            "--server.address", "127.0.0.1",
+            "--server.headless", "true",
+            *self.extra_args
+        ]
+        self.process = subprocess.Popen(command, env=self.env, cwd=parent_dir)
+        logger.info(f"🚀 워커 {self.index} 시작: 127.0.0.1:{self.port} (pid {self.process.pid})")
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def stop(self):
+        if self.alive:
+            self.process.terminate()
+
+    def wait(self, timeout: float):
+        if self.process is None:
+            return
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class Balancer:
+    """공개 포트의 TCP 연결을 워커로 중계 (클라이언트별 고정 + 최소 연결 배정)"""
+
+    def __init__(self, workers: List[Worker]):
+        self.workers = workers
+        self._affinity: Dict[str, Tuple[int, float]] = {}
+
+    def pick(self, client_key: str, exclude: Tuple[int, ...] = ()) -> Optional[Worker]:
+        """
+        클라이언트에 배정할 워커 (고정된 워커가 살아 있으면 그대로, 아니면 연결 수 최소)
+
+        동시에 들어온 새 클라이언트가 같은 워커로 몰리지 않도록 선택 즉시 연결 수를 올립니다.
+        """
+        now = time.monotonic()
+        candidates = [w for w in self.workers if w.alive and w.index not in exclude]
+        if not candidates:
+            return None
+
+        pinned = self._affinity.get(client_key)
+        if pinned is not None and now - pinned[1] < AFFINITY_TTL_S:
+            for worker in candidates:
+                if worker.index == pinned[0]:
+                    self._affinity[client_key] = (worker.index, now)
+                    worker.active += 1
+                    return worker
+
+        worker = min(candidates, key=lambda w: (w.active, w.index))
+        self._affinity[client_key] = (worker.index, now)
+        if len(self._affinity) > 10000:
+            self._affinity = {key: value for key, value in self._affinity.items()
+                              if now - value[1] < AFFINITY_TTL_S}
+        worker.active += 1
+        return worker
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """연결 하나 중계 - 첫 요청 헤더로 클라이언트를 식별한 뒤 양방향 복사"""
+        try:
+            head = await asyncio.wait_for(_read_head(reader), HEADER_TIMEOUT_S)
+        except (asyncio.TimeoutError, ConnectionError):
+            writer.close()
+            return
+        if not head:
+            writer.close()
+            return
+
+        client_key = _client_key(head, writer.get_extra_info('peername'))
+        tried: Tuple[int, ...] = ()
+        while True:
+            worker = self.pick(client_key, tried)
+            if worker is None:
+                writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                await _close(writer)
+                return
+            try:
+                upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", worker.port)
+                break
+            except OSError:
+                worker.active -= 1
+                tried += (worker.index,)  # 시작 중이거나 응답 없는 워커
+
+        try:
+            upstream_writer.write(head)
+            await asyncio.gather(_pipe(reader, upstream_writer), _pipe(upstream_reader, writer))
+        finally:
+            worker.active -= 1
+            await _close(upstream_writer)
+            await _close(writer)
+
+
+async def _read_head(reader: asyncio.StreamReader) -> bytes:
+    """요청 헤더 끝(빈 줄)까지 읽기 (헤더가 너무 길면 읽은 만큼만)"""
+    head = b""
+    while b"\r\n\r\n" not in head and len(head) < MAX_HEADER_BYTES:
+        chunk = await reader.read(4096)
+        if not chunk:
+            break
+        head += chunk
+    return head
+
+
+def _client_key(head: bytes, peername) -> str:
+    """클라이언트 식별자 (프록시 뒤라면 X-Forwarded-For 첫 주소)"""
+    for line in head.split(b"\r\n")[1:]:
+        if not line:
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"x-forwarded-for" and value.strip():
+            return value.split(b",")[0].strip().decode('latin-1')
+    return peername[0] if peername else "unknown"
+
+
+async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """한 방향 복사 (상대가 닫으면 쓰기 쪽도 종료)"""
+    try:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        if writer.can_write_eof():
+            try:
+                writer.write_eof()
+            except (OSError, RuntimeError):
+                pass
+
+
+async def _close(writer: asyncio.StreamWriter):
+    try:
+        writer.close()
+        await writer.wait_closed()
+    except (OSError, RuntimeError):
+        pass
+
+
+async def _supervise(workers: List[Worker], stop: asyncio.Event):
+    """종료된 워커 재시작"""
+    while not stop.is_set():
+        for worker in workers:
+            if not worker.alive:
+                code = worker.process.returncode if worker.process else None
+                logger.warning(f"⚠️ 워커 {worker.index} 종료됨 (코드 {code}), 다시 시작합니다.")
+                worker.restarts += 1
+                worker.start()
+        try:
+            await asyncio.wait_for(stop.wait(), SUPERVISE_INTERVAL_S)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_server(address: str, port: int, workers: int, shared_dir: str,
+                     extra_args: Optional[List[str]] = None) -> int:
+    """
+    워커 시작 → 로드밸런서 실행 (SIGINT/SIGTERM 시 워커 종료 후 반환)
+
+    Args:
+        address: 공개 주소
+        port: 공개 포트 (워커는 port+1 부터)
+        workers: 워커 프로세스 수
+        shared_dir: 워커 공유 폴더 (시작 시 초기화)
+        extra_args: streamlit run에 넘길 추가 인자
+    """
+    reset_shared_dir(shared_dir)
+    env = dict(os.environ, **{SHARED_DIR_ENV: shared_dir})
+    pool = [Worker(i, port + 1 + i, env, list(extra_args or [])) for i in range(workers)]
+    for worker in pool:
+        worker.start()
+
+    balancer = Balancer(pool)
+    server = await asyncio.start_server(balancer.handle, address, port)
+    logger.info(f"⚖️ 로드밸런서 시작: {address}:{port} → 워커 {workers}개 (공유 폴더 {shared_dir})")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    supervisor = asyncio.create_task(_supervise(pool, stop))
+    async with server:
+        await stop.wait()
+    await supervisor
+
+    logger.info("🛑 워커 종료 중...")
+    for worker in pool:
+        worker.stop()
+    for worker in pool:
+        worker.wait(timeout=10)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 멀티 프로세스 실행 (워커 + 로드밸런서)")
+    parser.add_argument("--address", default="0.0.0.0", help="공개 주소")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", DEFAULT_PORT)),
+                        help="공개 포트 (기본: $PORT 또는 8501)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"워커 프로세스 수 (기본: ${WORKERS_ENV}, 없으면 min({DEFAULT_WORKERS}, CPU 수))")
+    parser.add_argument("--shared-dir", default=None, help="워커 공유 폴더 (기본: /dev/shm/investsmart-<포트>)")
+    args, extra_args = parser.parse_known_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    shared_dir = os.path.abspath(args.shared_dir or default_shared_dir(args.port))
+    workers = args.workers if args.workers is not None else default_workers()
+    return asyncio.run(run_server(args.address, args.port, max(1, workers), shared_dir, extra_args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
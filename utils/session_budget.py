@@ -0,0 +1,110 @@
+"""
+세션 상태 예산 - 세션에는 작은 불변 값(종목, 그룹, 토글)만 저장
+
+데이터(행, 컬럼 배열, Figure)와 클라이언트 객체는 프로세스 공용 저장소
+(utils.json_client.get_shared_client, utils.chart_jobs)에서 조회하고 세션에는
+그 키만 둡니다. 세션당 메모리가 방문한 종목 수와 무관하게 일정하므로 같은 RAM에서
+사용자 수에 비례해서만 늘어납니다.
+
+enforce_session_budget은 매 실행 끝에 호출되어 다음 값을 세션에서 제거합니다.
+- 허용 타입(스칼라, 문자열, 날짜와 이들로 된 작은 컨테이너)이 아닌 값 (클라이언트, 배열 등)
+- 값 하나가 MAX_VALUE_BYTES를 넘는 키
+- 전체가 MAX_SESSION_BYTES를 넘으면 보호 키를 제외하고 큰 값부터
+"""
+import datetime
+import logging
+import sys
+from typing import Any, Dict, List, MutableMapping, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 세션 하나의 최대 크기 / 값 하나의 최대 크기 (bytes)
+MAX_SESSION_BYTES = 32 * 1024
+MAX_VALUE_BYTES = 4 * 1024
+
+# 예산 초과 시에도 지우지 않는 화면 흐름 키
+PROTECTED_KEYS = frozenset({
+    'step', 'selected_symbol', 'selected_indicator_group', 'selected_signals', 'disclaimer_agreed'
+})
+
+_SCALAR_TYPES = (type(None), bool, int, float, str, datetime.date, datetime.time, datetime.timedelta)
+_CONTAINER_TYPES = (tuple, list, frozenset, set, dict)
+
+
+def is_allowed_value(value: Any) -> bool:
+    """세션에 저장할 수 있는 값인지 (스칼라 또는 스칼라로만 된 컨테이너)"""
+    if isinstance(value, _SCALAR_TYPES):
+        return True
+    if isinstance(value, dict):
+        return all(is_allowed_value(k) and is_allowed_value(v) for k, v in value.items())
+    if isinstance(value, _CONTAINER_TYPES):
+        return all(is_allowed_value(item) for item in value)
+    return False
+
+
+def value_bytes(value: Any) -> int:
+    """값의 대략적인 메모리 크기 (컨테이너는 원소까지 합산)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(value_bytes(k) + value_bytes(v) for k, v in value.items())
+    elif isinstance(value, _CONTAINER_TYPES):
+        size += sum(value_bytes(item) for item in value)
+    return size
+
+
+def session_footprint(state: MutableMapping) -> Dict[str, Any]:
+    """
+    세션 상태 크기
+
+    Returns:
+        {'keys': 키 수, 'bytes': 전체 크기, 'largest': [(키, 크기), ...] 상위 5개}
+    """
+    sizes = []
+    for key in list(state.keys()):
+        try:
+            sizes.append((str(key), value_bytes(key) + value_bytes(state[key])))
+        except KeyError:
+            continue
+    sizes.sort(key=lambda item: item[1], reverse=True)
+    return {'keys': len(sizes), 'bytes': sum(size for _, size in sizes), 'largest': sizes[:5]}
+
+
+def enforce_session_budget(state: MutableMapping, max_bytes: int = MAX_SESSION_BYTES,
+                           max_value_bytes: int = MAX_VALUE_BYTES) -> List[Tuple[str, str]]:
+    """
+    예산을 벗어난 세션 값 제거
+
+    Returns:
+        제거한 [(키, 사유), ...]
+    """
+    removed = []
+    sizes = {}
+    for key in list(state.keys()):
+        try:
+            value = state[key]
+        except KeyError:
+            continue
+        if not is_allowed_value(value):
+            reason = f"type {type(value).__name__}"
+        else:
+            sizes[key] = value_bytes(key) + value_bytes(value)
+            if sizes[key] <= max_value_bytes:
+                continue
+            reason = f"{sizes.pop(key):,} bytes"
+        del state[key]
+        removed.append((str(key), reason))
+
+    # 전체 예산 초과: 보호 키를 제외하고 큰 값부터 제거
+    total = sum(sizes.values())
+    for key, size in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+        if total <= max_bytes:
+            break
+        if key in PROTECTED_KEYS:
+            continue
+        del state[key]
+        total -= size
+        removed.append((str(key), f"session over {max_bytes:,} bytes"))
+
+    if removed:
+        logger.warning(f"⚠️ 세션 상태 예산 초과 값 제거: {removed}")
+    return removed
@@ -0,0 +1,219 @@
+"""
+프로세스 공유 저장소 - 여러 앱 워커 프로세스가 파싱된 데이터와 Figure를 함께 사용
+
+멀티 프로세스 실행(utils.serve)에서는 워커마다 같은 종목을 다시 파싱해 각자 메모리에
+들고 있게 됩니다. 공유 폴더(기본: /dev/shm 아래)가 지정되면 한 워커가 파싱한 컬럼을
+컬럼별 .npy 파일로 게시하고, 모든 워커는 이를 읽기 전용 mmap으로 붙여 씁니다.
+페이지는 OS 페이지 캐시에 한 벌만 존재하므로 워커 수가 늘어도 종목 데이터 메모리는
+늘지 않습니다. 생성된 차트 Figure도 JSON으로 게시하여 다른 워커가 재사용합니다.
+
+    <공유 폴더>/columns/<종목>/<데이터 버전>/dates.npy, close.npy, ..., meta.json
+    <공유 폴더>/figures/<차트 작업 키 해시>.json
+
+공유 폴더는 환경 변수 INVESTSMART_SHARED_DIR로 지정하며, 없으면 (단일 프로세스 실행)
+모든 함수가 아무 일도 하지 않습니다.
+"""
+import contextlib
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SHARED_DIR_ENV = "INVESTSMART_SHARED_DIR"
+COLUMNS_DIRNAME = "columns"
+FIGURES_DIRNAME = "figures"
+META_FILENAME = "meta.json"
+
+# 공유 폴더에 보관할 최대 Figure 수 (초과 시 오래된 파일부터 삭제)
+MAX_SHARED_FIGURES = 512
+_PRUNE_EVERY = 32
+
+_attached: Dict[Tuple[str, str, str], Tuple[Dict[str, np.ndarray], Dict[str, Any]]] = {}
+_attached_lock = threading.Lock()
+_figure_writes = 0
+
+
+def get_shared_dir() -> Optional[str]:
+    """공유 폴더 경로 (멀티 프로세스 실행이 아니면 None)"""
+    shared_dir = os.environ.get(SHARED_DIR_ENV)
+    return os.path.abspath(shared_dir) if shared_dir else None
+
+
+def default_shared_dir(port: int) -> str:
+    """포트별 기본 공유 폴더 (/dev/shm이 있으면 메모리 파일시스템 사용)"""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, f"investsmart-{port}")
+
+
+def reset_shared_dir(shared_dir: str):
+    """공유 폴더 초기화 (서버 시작 시 이전 실행의 잔여물 제거)"""
+    shutil.rmtree(shared_dir, ignore_errors=True)
+    os.makedirs(os.path.join(shared_dir, COLUMNS_DIRNAME), exist_ok=True)
+    os.makedirs(os.path.join(shared_dir, FIGURES_DIRNAME), exist_ok=True)
+
+
+def _columns_dir(shared_dir: str, symbol: str, version: str) -> str:
+    safe_symbol = symbol.replace('^', '').replace('=', '').replace('/', '_')
+    return os.path.join(shared_dir, COLUMNS_DIRNAME, safe_symbol, version)
+
+
+@contextlib.contextmanager
+def build_lock(shared_dir: str, symbol: str, version: str) -> Iterator[None]:
+    """종목/버전별 프로세스 간 잠금 - 한 워커만 파싱하고 나머지는 게시를 기다림"""
+    entry_dir = _columns_dir(shared_dir, symbol, version)
+    os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+    with open(f"{entry_dir}.lock", 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def attach_columns(shared_dir: str, symbol: str,
+                   version: str) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]:
+    """
+    게시된 컬럼을 읽기 전용 mmap으로 연결
+
+    Returns:
+        (컬럼, 부가 정보) 또는 None (아직 게시되지 않음)
+    """
+    key = (shared_dir, symbol, version)
+    with _attached_lock:
+        if key in _attached:
+            return _attached[key]
+
+    entry_dir = _columns_dir(shared_dir, symbol, version)
+    meta_path = os.path.join(entry_dir, META_FILENAME)
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        columns = {name: np.load(os.path.join(entry_dir, f"{name}.npy"), mmap_mode='r')
+                   for name in meta.pop('columns')}
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"공유 컬럼 연결 실패: {symbol}, {e}")
+        return None
+
+    with _attached_lock:
+        _attached[key] = (columns, meta)
+    return columns, meta
+
+
+def publish_columns(shared_dir: str, symbol: str, version: str,
+                    columns: Dict[str, np.ndarray], meta: Dict[str, Any]) -> bool:
+    """
+    컬럼을 공유 폴더에 게시 (임시 폴더에 쓴 뒤 이름 변경 - 다른 워커는 완성본만 봄)
+
+    Returns:
+        게시 성공 여부 (이미 게시되어 있어도 True)
+    """
+    entry_dir = _columns_dir(shared_dir, symbol, version)
+    if os.path.exists(os.path.join(entry_dir, META_FILENAME)):
+        return True
+    tmp_dir = f"{entry_dir}.tmp{os.getpid()}"
+    try:
+        os.makedirs(tmp_dir, exist_ok=True)
+        for name, values in columns.items():
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), np.ascontiguousarray(values))
+        with open(os.path.join(tmp_dir, META_FILENAME), 'w', encoding='utf-8') as f:
+            json.dump(dict(meta, columns=list(columns)), f, ensure_ascii=False, default=str)
+        os.rename(tmp_dir, entry_dir)
+        logger.info(f"🔗 공유 컬럼 게시: {symbol} ({len(columns['dates'])}행)")
+        return True
+    except OSError as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if os.path.exists(os.path.join(entry_dir, META_FILENAME)):
+            return True
+        logger.error(f"공유 컬럼 게시 실패: {symbol}, {e}")
+        return False
+
+
+def figure_key(job_key: Tuple) -> str:
+    """차트 작업 키 → 공유 Figure 파일 이름"""
+    return hashlib.sha1(repr(job_key).encode('utf-8')).hexdigest()[:20]
+
+
+def load_figure(shared_dir: str, job_key: Tuple) -> Optional[Dict[str, Any]]:
+    """
+    다른 워커가 게시한 Figure 조회
+
+    Returns:
+        {'figure_json', 'fcv_has_green', 'fcv_has_red'} 또는 None
+    """
+    path = os.path.join(shared_dir, FIGURES_DIRNAME, f"{figure_key(job_key)}.json")
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.error(f"공유 Figure 로드 실패: {path}, {e}")
+        return None
+
+
+def store_figure(shared_dir: str, job_key: Tuple, figure_json: str, fcv_has_green: bool, fcv_has_red: bool):
+    """생성한 Figure를 공유 폴더에 게시 (원자적 쓰기, MAX_SHARED_FIGURES 초과분은 정리)"""
+    global _figure_writes
+    figures_dir = os.path.join(shared_dir, FIGURES_DIRNAME)
+    path = os.path.join(figures_dir, f"{figure_key(job_key)}.json")
+    payload = {'figure_json': figure_json, 'fcv_has_green': fcv_has_green, 'fcv_has_red': fcv_has_red}
+    try:
+        os.makedirs(figures_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.error(f"공유 Figure 게시 실패: {path}, {e}")
+        return
+
+    _figure_writes += 1
+    if _figure_writes % _PRUNE_EVERY == 0:
+        _prune_figures(figures_dir)
+
+
+def _prune_figures(figures_dir: str, max_figures: int = MAX_SHARED_FIGURES):
+    """오래된 Figure부터 삭제하여 개수 제한 유지"""
+    entries = []
+    for entry in os.scandir(figures_dir):
+        if entry.name.endswith('.json'):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                continue
+    entries.sort()
+    for _, path in entries[:max(0, len(entries) - max_figures)]:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+def shared_store_stats(shared_dir: Optional[str] = None) -> Dict[str, Any]:
+    """공유 폴더 사용량 {'dir', 'symbols', 'columns_bytes', 'figures', 'figures_bytes', 'attached'}"""
+    shared_dir = shared_dir or get_shared_dir()
+    if not shared_dir:
+        return {}
+    stats = {'dir': shared_dir, 'symbols': 0, 'columns_bytes': 0, 'figures': 0, 'figures_bytes': 0,
+             'attached': len(_attached)}
+    for root, _, files in os.walk(os.path.join(shared_dir, COLUMNS_DIRNAME)):
+        if META_FILENAME in files:
+            stats['symbols'] += 1
+        stats['columns_bytes'] += sum(os.path.getsize(os.path.join(root, name)) for name in files
+                                      if name.endswith('.npy'))
+    figures_dir = os.path.join(shared_dir, FIGURES_DIRNAME)
+    if os.path.isdir(figures_dir):
+        for entry in os.scandir(figures_dir):
+            if entry.name.endswith('.json'):
+                stats['figures'] += 1
+                stats['figures_bytes'] += entry.stat().st_size
+    return stats
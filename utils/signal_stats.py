@@ -0,0 +1,201 @@
+"""
+시그널 성과 통계 - 시그널 발생 후 N봉 수익률 통계 (벡터 연산)
+
+각 시그널 컬럼(값 1 = 매수 시그널)이 발생한 봉을 진입 시점으로 보고
+horizon 봉 뒤의 종가 수익률과 그 사이 최대 역행폭(MAE)을 배열 이동 연산으로
+한 번에 계산합니다. 결과는 데이터 버전별로 캐시되어 화면 요청마다 다시
+계산하지 않습니다.
+
+사용법:
+    python -m utils.signal_stats                 # 전체 종목 통합 통계 출력
+    python -m utils.signal_stats --output stats.json
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.columnar import SIGNAL_COLUMNS
+from utils.json_client import InvestSmartJSONClient
+
+logger = logging.getLogger(__name__)
+
+# 통계 기간 (일봉 기준 봉 수)
+DEFAULT_HORIZONS = (5, 20, 60)
+
+_symbol_cache: Dict[Tuple, Dict[str, Any]] = {}
+_universe_cache: Dict[Tuple, Dict[str, Any]] = {}
+_cache_lock = threading.Lock()
+
+
+def _forward_outcomes(columns: Dict[str, np.ndarray], signal_names: List[str],
+                      horizons: Tuple[int, ...]) -> Dict[str, Dict[int, Tuple[np.ndarray, np.ndarray]]]:
+    """
+    시그널별/기간별 (수익률 배열, MAE 배열) 계산
+
+    수익률 = close[i + h] / close[i] - 1
+    MAE    = min(low[i+1 : i+h+1]) / close[i] - 1 (0 이상이면 0)
+    """
+    close = columns['close']
+    low = columns['low']
+    n = len(close)
+    outcomes = {name: {} for name in signal_names}
+
+    for horizon in horizons:
+        if n <= horizon:
+            for name in signal_names:
+                outcomes[name][horizon] = (np.empty(0), np.empty(0))
+            continue
+        # window_min[i] = min(low[i+1 : i+1+h]) - 모든 시그널이 공유
+        window_min = sliding_window_view(low[1:], horizon).min(axis=1)
+
+        for name in signal_names:
+            entries = np.flatnonzero(columns[name] == 1)
+            entries = entries[entries + horizon < n]
+            entry_price = close[entries]
+            valid = entry_price > 0
+            entries, entry_price = entries[valid], entry_price[valid]
+            returns = close[entries + horizon] / entry_price - 1
+            mae = np.minimum(window_min[entries] / entry_price - 1, 0)
+            outcomes[name][horizon] = (returns, mae)
+    return outcomes
+
+
+def _summarize(returns: np.ndarray, mae: np.ndarray) -> Dict[str, Any]:
+    """수익률/MAE 배열 요약"""
+    if len(returns) == 0:
+        return {'count': 0, 'hit_rate': None, 'mean_return': None, 'median_return': None,
+                'mae_mean': None, 'mae_worst': None}
+    return {
+        'count': int(len(returns)),
+        'hit_rate': float(np.mean(returns > 0)),
+        'mean_return': float(np.mean(returns)),
+        'median_return': float(np.median(returns)),
+        'mae_mean': float(np.mean(mae)),
+        'mae_worst': float(np.min(mae))
+    }
+
+
+def compute_signal_stats(columns: Dict[str, np.ndarray], signal_names: Optional[List[str]] = None,
+                         horizons: Tuple[int, ...] = DEFAULT_HORIZONS) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    """
+    한 종목의 시그널별 성과 통계
+
+    Returns:
+        {시그널: {horizon: {'count', 'hit_rate', 'mean_return', 'median_return', 'mae_mean', 'mae_worst'}}}
+    """
+    signal_names = [name for name in (signal_names or SIGNAL_COLUMNS) if name in columns]
+    outcomes = _forward_outcomes(columns, signal_names, tuple(horizons))
+    return {
+        name: {horizon: _summarize(*outcomes[name][horizon]) for horizon in horizons}
+        for name in signal_names
+    }
+
+
+def get_symbol_stats(client, symbol: str, horizons: Tuple[int, ...] = DEFAULT_HORIZONS) -> Optional[Dict[str, Any]]:
+    """종목 시그널 통계 (데이터 버전별 캐시)"""
+    try:
+        key = (os.path.abspath(client.data_dir), symbol, client.get_data_version(symbol), tuple(horizons))
+        with _cache_lock:
+            if key in _symbol_cache:
+                return _symbol_cache[key]
+
+        columns = client.get_columns(symbol)
+        if columns is None:
+            return None
+        stats = compute_signal_stats(columns, horizons=horizons)
+        with _cache_lock:
+            _symbol_cache[key] = stats
+        return stats
+    except Exception as e:
+        logger.error(f"시그널 통계 계산 실패: {symbol}, {e}")
+        return None
+
+
+def get_universe_stats(data_dir: str, horizons: Tuple[int, ...] = DEFAULT_HORIZONS) -> Dict[str, Any]:
+    """
+    전체 종목 통합 시그널 통계 (모든 종목의 결과를 합쳐서 요약, 데이터 버전별 캐시)
+
+    세션 캐시를 키우지 않도록 임시 클라이언트로 종목을 하나씩 읽고 버립니다.
+
+    Returns:
+        {'version', 'symbol_count', 'stats': {시그널: {horizon: 요약}}}
+    """
+    client = InvestSmartJSONClient(os.path.abspath(data_dir))
+    symbols = sorted(set(client.get_available_symbols()))
+    versions = tuple((symbol, client.get_data_version(symbol)) for symbol in symbols)
+    version = hashlib.sha1(repr(versions).encode('utf-8')).hexdigest()[:16]
+    key = (client.data_dir, version, tuple(horizons))
+    with _cache_lock:
+        if key in _universe_cache:
+            return _universe_cache[key]
+
+    pooled = {name: {horizon: ([], []) for horizon in horizons} for name in SIGNAL_COLUMNS}
+    symbol_count = 0
+    for symbol in symbols:
+        columns = client.get_columns(symbol)
+        client.clear_cache()
+        if columns is None:
+            continue
+        symbol_count += 1
+        outcomes = _forward_outcomes(columns, SIGNAL_COLUMNS, tuple(horizons))
+        for name in SIGNAL_COLUMNS:
+            for horizon in horizons:
+                returns, mae = outcomes[name][horizon]
+                pooled[name][horizon][0].append(returns)
+                pooled[name][horizon][1].append(mae)
+
+    stats = {
+        name: {
+            horizon: _summarize(np.concatenate(returns) if returns else np.empty(0),
+                                np.concatenate(mae) if mae else np.empty(0))
+            for horizon, (returns, mae) in by_horizon.items()
+        }
+        for name, by_horizon in pooled.items()
+    }
+    result = {'version': version, 'symbol_count': symbol_count, 'stats': stats}
+    with _cache_lock:
+        _universe_cache[key] = result
+    logger.info(f"📊 전체 시그널 통계 계산 완료: {symbol_count}개 종목")
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 시그널 성과 통계")
+    parser.add_argument("--data-dir", default=os.path.join(parent_dir, "data"), help="신호 데이터 폴더")
+    parser.add_argument("--horizons", nargs="+", type=int, default=list(DEFAULT_HORIZONS), help="통계 기간 (봉 수)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본: 표 출력)")
+    args = parser.parse_args(argv)
+
+    result = get_universe_stats(args.data_dir, tuple(args.horizons))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+        return 0
+
+    print(f"전체 {result['symbol_count']}개 종목 (데이터 버전 {result['version']})")
+    print(f"{'signal':<24} {'h':>4} {'count':>7} {'hit':>7} {'mean':>8} {'median':>8} {'mae':>8}")
+    for name, by_horizon in result['stats'].items():
+        for horizon, row in by_horizon.items():
+            if not row['count']:
+                continue
+            print(f"{name:<24} {horizon:>4} {row['count']:>7} {row['hit_rate']:>7.1%} "
+                  f"{row['mean_return']:>8.2%} {row['median_return']:>8.2%} {row['mae_mean']:>8.2%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Single-flight 요청 병합 - 같은 키의 작업은 한 번만 실행하고 나머지는 결과를 기다림
+
+인기 종목에 세션이 몰려 캐시가 빈 상태에서 동시에 요청하면 각 세션이 같은 파일을
+각자 압축 해제/파싱하게 됩니다. SingleFlight는 키별로 진행 중인 호출을 하나만
+두고, 같은 키로 들어온 다른 호출은 그 결과(또는 예외)를 그대로 돌려받습니다.
+결과를 저장하지는 않으므로 캐시와 함께 사용합니다.
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """진행 중인 호출 하나 (결과/예외와 완료 이벤트)"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """키별 동시 호출 병합기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.stats = {'executed': 0, 'shared': 0}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn을 실행
+
+        Returns:
+            fn(*args, **kwargs)의 결과 (같은 키로 동시에 호출한 모든 호출자가 공유)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.stats['executed'] += 1
+            else:
+                self.stats['shared'] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def in_flight(self) -> int:
+        """현재 진행 중인 키 수"""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,333 @@
+"""
+스냅샷 비교 - 두 데이터 폴더(예: data/250912 ↔ data)의 종목별 변경 사항
+
+데이터를 다시 배포할 때마다 어떤 시그널이 새로 생기거나 사라졌는지, FCV가 얼마나
+수정되었는지, 봉이 몇 개 추가되었는지를 컬럼 배열 비교(벡터 연산)로 한 번에 계산합니다.
+
+- 두 스냅샷의 파일은 파일명(signals_<종목>)으로 짝을 짓고, 봉은 날짜 교집합으로 맞춥니다.
+- 시그널 변경 (매수 시그널 = 1 기준):
+    new      새 스냅샷에만 있는 봉의 시그널
+    added    공통 봉에서 새로 생긴 시그널
+    removed  공통 봉에서 사라진 시그널
+    dropped  이전 스냅샷에만 있는 봉의 시그널
+- FCV: 값이 수정된 봉 수, 최대 변화량, 배경 구간(녹색/빨간색)이 바뀐 날짜
+- 파싱된 컬럼은 파일 내용 해시를 키로 디스크 캐시(utils.disk_cache)에 저장하므로
+  두 번째 실행부터는 파일을 다시 파싱하지 않습니다.
+
+사용법:
+    python -m utils.snapshot_diff data/250912 data/250914
+    python -m utils.snapshot_diff data/250914 data --symbols AAPL ^KS11 --output diff.json
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.columnar import SIGNAL_COLUMNS
+from utils.compression import DATA_EXTENSIONS, data_extension
+from utils.disk_cache import get_disk_cache
+from utils.events import FCV_ZONES
+from utils.json_stream import load_columns
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = os.path.join(parent_dir, "data")
+
+# 수정으로 보지 않을 FCV 변화량 (부동소수점 오차)
+FCV_TOLERANCE = 1e-9
+
+# 가격 수정 판정 컬럼 (상대 오차 PRICE_RTOL 초과 시 수정)
+PRICE_DIFF_COLUMNS = ['open', 'high', 'low', 'close']
+PRICE_RTOL = 1e-9
+
+SIGNAL_CHANGE_KINDS = ('new', 'added', 'removed', 'dropped')
+
+_CACHE_SIZE = 64
+
+# (경로, 수정시각, 크기) → 컬럼/비교 결과
+_columns_cache: "OrderedDict[Tuple, Tuple[Dict[str, np.ndarray], Optional[str]]]" = OrderedDict()
+_diff_cache: "OrderedDict[Tuple, Optional[Dict[str, Any]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def list_snapshots(data_dir: str) -> List[str]:
+    """데이터 폴더 아래 스냅샷 폴더 이름 (신호 파일이 있는 하위 폴더, 이름순)"""
+    snapshots = []
+    if not os.path.isdir(data_dir):
+        return snapshots
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.is_dir() and _snapshot_files(entry.path):
+                snapshots.append(entry.name)
+    return sorted(snapshots)
+
+
+def _snapshot_files(snapshot_dir: str) -> Dict[str, str]:
+    """{파일 키(signals_<종목>): 경로} - 같은 키의 파일이 여러 형식이면 DATA_EXTENSIONS 순서 우선"""
+    found: Dict[str, Dict[str, str]] = {}
+    with os.scandir(snapshot_dir) as entries:
+        for entry in entries:
+            extension = data_extension(entry.name)
+            if entry.is_file() and entry.name.startswith("signals_") and extension is not None:
+                found.setdefault(entry.name[:-len(extension)], {})[extension] = entry.path
+    return {
+        stem: next(paths[extension] for extension in DATA_EXTENSIONS if extension in paths)
+        for stem, paths in found.items()
+    }
+
+
+def _symbol_stem(symbol: str) -> str:
+    """종목 심볼 → 파일 키 (InvestSmartJSONClient 파일명 규칙)"""
+    return "signals_" + symbol.replace('^', '').replace('=', '').replace('/', '_')
+
+
+def _file_key(path: str) -> Tuple:
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def load_snapshot_columns(path: str) -> Tuple[Dict[str, np.ndarray], Optional[str]]:
+    """
+    스냅샷 파일의 전체 컬럼 (프로세스 캐시 → 디스크 캐시 → 파싱)
+
+    Returns:
+        (utils.columnar 형식 컬럼, 심볼)
+    """
+    key = _file_key(path)
+    with _cache_lock:
+        if key in _columns_cache:
+            _columns_cache.move_to_end(key)
+            return _columns_cache[key]
+
+    cache = get_disk_cache()
+    arrays = None
+    if cache is not None:
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        cache_key = ('snapshot', digest.hexdigest()[:16])
+        arrays = cache.get_arrays('columns', cache_key)
+    if arrays is not None:
+        meta = json.loads(str(arrays.pop('_meta')))
+        columns = arrays
+    else:
+        columns, meta = load_columns(path)
+        if cache is not None:
+            cache.put_arrays('columns', cache_key, dict(columns, _meta=np.array(json.dumps(meta, default=str))))
+
+    loaded = (columns, meta.get('symbol'))
+    with _cache_lock:
+        _columns_cache[key] = loaded
+        while len(_columns_cache) > _CACHE_SIZE:
+            _columns_cache.popitem(last=False)
+    return loaded
+
+
+def _date_strings(dates: np.ndarray) -> List[str]:
+    return np.datetime_as_string(dates, unit='D').tolist()
+
+
+def _fcv_zone(values: np.ndarray) -> np.ndarray:
+    """FCV 배경 구간 코드 (1: 녹색, -1: 빨간색, 0: 중립)"""
+    return np.where(values >= FCV_ZONES['green'], 1, np.where(values <= FCV_ZONES['red'], -1, 0))
+
+
+def diff_columns(old: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """
+    두 스냅샷의 한 종목 컬럼 비교
+
+    Returns:
+        {'bars': {'old', 'new', 'common', 'new_bars', 'dropped_bars', 'first_new', 'last_new'},
+         'signals': {시그널: {'new'|'added'|'removed'|'dropped': [날짜, ...]}} (변경 있는 시그널만),
+         'fcv': {'revised', 'max_change', 'zone_changes': [날짜, ...]},
+         'price_revisions', 'changed'}
+    """
+    old_dates, new_dates = old['dates'], new['dates']
+    common, old_index, new_index = np.intersect1d(old_dates, new_dates, assume_unique=True, return_indices=True)
+    new_only = np.ones(len(new_dates), dtype=bool)
+    new_only[new_index] = False
+    old_only = np.ones(len(old_dates), dtype=bool)
+    old_only[old_index] = False
+
+    signals = {}
+    for name in SIGNAL_COLUMNS:
+        if name not in old or name not in new:
+            continue
+        old_buy, new_buy = old[name] == 1, new[name] == 1
+        common_old, common_new = old_buy[old_index], new_buy[new_index]
+        changes = {
+            'new': _date_strings(new_dates[new_only & new_buy]),
+            'added': _date_strings(common[common_new & ~common_old]),
+            'removed': _date_strings(common[common_old & ~common_new]),
+            'dropped': _date_strings(old_dates[old_only & old_buy])
+        }
+        if any(changes.values()):
+            signals[name] = changes
+
+    old_fcv, new_fcv = old['fcv'][old_index], new['fcv'][new_index]
+    fcv_change = np.abs(new_fcv - old_fcv)
+    revised = fcv_change > FCV_TOLERANCE
+    zone_changed = _fcv_zone(old_fcv) != _fcv_zone(new_fcv)
+
+    price_revised = np.zeros(len(common), dtype=bool)
+    for name in PRICE_DIFF_COLUMNS:
+        price_revised |= ~np.isclose(old[name][old_index], new[name][new_index], rtol=PRICE_RTOL, atol=0)
+
+    new_bars = new_dates[new_only]
+    result = {
+        'bars': {
+            'old': int(len(old_dates)),
+            'new': int(len(new_dates)),
+            'common': int(len(common)),
+            'new_bars': int(len(new_bars)),
+            'dropped_bars': int(old_only.sum()),
+            'first_new': str(new_bars[0]) if len(new_bars) else None,
+            'last_new': str(new_bars[-1]) if len(new_bars) else None
+        },
+        'signals': signals,
+        'fcv': {
+            'revised': int(revised.sum()),
+            'max_change': round(float(fcv_change.max()), 6) if len(fcv_change) else 0.0,
+            'zone_changes': _date_strings(common[zone_changed])
+        },
+        'price_revisions': int(price_revised.sum())
+    }
+    result['changed'] = bool(
+        signals or result['bars']['new_bars'] or result['bars']['dropped_bars']
+        or result['fcv']['revised'] or result['price_revisions']
+    )
+    return result
+
+
+def get_symbol_diff(old_dir: str, new_dir: str, symbol: str) -> Optional[Dict[str, Any]]:
+    """
+    한 종목의 스냅샷 비교 결과 (캐시) - 어느 한쪽에 파일이 없으면 None
+
+    차트에 변경 사항을 표시할 때 사용합니다.
+    """
+    try:
+        paths = []
+        for snapshot_dir in (old_dir, new_dir):
+            path = _snapshot_files(snapshot_dir).get(_symbol_stem(symbol)) if os.path.isdir(snapshot_dir) else None
+            if path is None:
+                return None
+            paths.append(path)
+        key = (_file_key(paths[0]), _file_key(paths[1]))
+        with _cache_lock:
+            if key in _diff_cache:
+                _diff_cache.move_to_end(key)
+                return _diff_cache[key]
+
+        diff = diff_columns(load_snapshot_columns(paths[0])[0], load_snapshot_columns(paths[1])[0])
+        with _cache_lock:
+            _diff_cache[key] = diff
+            while len(_diff_cache) > _CACHE_SIZE:
+                _diff_cache.popitem(last=False)
+        return diff
+    except Exception as e:
+        logger.error(f"스냅샷 비교 실패: {symbol}, {e}")
+        return None
+
+
+def run_diff(old_dir: str, new_dir: str, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    두 스냅샷의 전체(또는 지정) 종목 비교
+
+    Returns:
+        {'old', 'new', 'symbols': {심볼: diff_columns 결과}, 'only_old': [...], 'only_new': [...],
+         'failed': {파일 키: 오류}, 'totals': {...}, 'elapsed_s'}
+    """
+    start = time.perf_counter()
+    old_files, new_files = _snapshot_files(old_dir), _snapshot_files(new_dir)
+    if symbols:
+        wanted = {_symbol_stem(symbol) for symbol in symbols}
+        old_files = {stem: path for stem, path in old_files.items() if stem in wanted}
+        new_files = {stem: path for stem, path in new_files.items() if stem in wanted}
+
+    results, failed = {}, {}
+    for stem in sorted(set(old_files) & set(new_files)):
+        try:
+            old_columns, _ = load_snapshot_columns(old_files[stem])
+            new_columns, symbol = load_snapshot_columns(new_files[stem])
+            results[symbol or stem[len("signals_"):]] = diff_columns(old_columns, new_columns)
+        except Exception as e:
+            failed[stem] = str(e)
+            logger.error(f"스냅샷 비교 실패: {stem}, {e}")
+
+    totals = {kind: 0 for kind in SIGNAL_CHANGE_KINDS}
+    for diff in results.values():
+        for changes in diff['signals'].values():
+            for kind in SIGNAL_CHANGE_KINDS:
+                totals[kind] += len(changes[kind])
+    totals.update(
+        changed_symbols=sum(diff['changed'] for diff in results.values()),
+        new_bars=sum(diff['bars']['new_bars'] for diff in results.values()),
+        fcv_revised=sum(diff['fcv']['revised'] for diff in results.values())
+    )
+    return {
+        'old': os.path.abspath(old_dir),
+        'new': os.path.abspath(new_dir),
+        'symbols': results,
+        'only_old': sorted(stem[len("signals_"):] for stem in set(old_files) - set(new_files)),
+        'only_new': sorted(stem[len("signals_"):] for stem in set(new_files) - set(old_files)),
+        'failed': failed,
+        'totals': totals,
+        'elapsed_s': round(time.perf_counter() - start, 3)
+    }
+
+
+def _format_symbol_line(symbol: str, diff: Dict[str, Any]) -> str:
+    counts = {kind: sum(len(changes[kind]) for changes in diff['signals'].values()) for kind in SIGNAL_CHANGE_KINDS}
+    bars = diff['bars']
+    return (f"{symbol:<12} 봉 +{bars['new_bars']}/-{bars['dropped_bars']}  "
+            f"시그널 new {counts['new']} added {counts['added']} removed {counts['removed']} "
+            f"dropped {counts['dropped']}  FCV 수정 {diff['fcv']['revised']} "
+            f"(최대 {diff['fcv']['max_change']:.3f}, 구간 변경 {len(diff['fcv']['zone_changes'])})  "
+            f"가격 수정 {diff['price_revisions']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 데이터 스냅샷 비교")
+    parser.add_argument("old", help="이전 스냅샷 폴더 (예: data/250912)")
+    parser.add_argument("new", nargs="?", default=DEFAULT_DATA_DIR, help="새 스냅샷 폴더 (기본: 현재 데이터)")
+    parser.add_argument("--symbols", nargs="*", help="대상 종목 (기본: 양쪽에 있는 전체 종목)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--all", action="store_true", help="변경 없는 종목도 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    report = run_diff(args.old, args.new, args.symbols)
+    for symbol, diff in report['symbols'].items():
+        if diff['changed'] or args.all:
+            print(_format_symbol_line(symbol, diff))
+    if report['only_old'] or report['only_new']:
+        print(f"한쪽에만 있는 종목 - 이전: {report['only_old']}, 새: {report['only_new']}")
+    totals = report['totals']
+    print(f"비교 완료: {len(report['symbols'])}개 종목 (변경 {totals['changed_symbols']}개), "
+          f"새 봉 {totals['new_bars']}, 시그널 new {totals['new']} added {totals['added']} "
+          f"removed {totals['removed']} dropped {totals['dropped']}, FCV 수정 {totals['fcv_revised']}, "
+          f"{report['elapsed_s']}s")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+    return 1 if report['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
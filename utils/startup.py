@@ -0,0 +1,138 @@
+"""
+시작 시간 최적화 - 무거운 차트/데이터 라이브러리 지연 로드와 import 시간 측정
+
+1·2단계(종목/그룹 선택)는 차트를 그리지 않으므로 app.py는 pandas/plotly를 쓰는
+모듈을 단계별 함수 안에서 import합니다. 대신 첫 화면을 그린 직후 백그라운드
+스레드에서 해당 모듈을 미리 import해 두어 3단계 진입 시 대기 시간을 없앱니다.
+모듈별 import 시간은 기록하여 개발자 모드와 로그로 확인할 수 있습니다.
+
+사용법 (모듈별 콜드 import 시간 측정 - 모듈마다 새 프로세스):
+    python -m utils.startup
+"""
+import argparse
+import importlib
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+logger = logging.getLogger(__name__)
+
+# 3단계/비교/백테스트 화면에서만 필요한 무거운 모듈 (백그라운드 미리 로드 순서)
+DEFERRED_MODULES = (
+    "pandas",
+    "plotly.graph_objects",
+    "plotly.io",
+    "utils.chart_core",
+    "utils.signal_stats",
+    "components.chart",
+    "components.backtest_panel",
+    "components.comparison",
+)
+
+# 측정 대상 (앱 시작 시 즉시 필요한 모듈 + 지연 모듈)
+MEASURED_MODULES = ("streamlit", "numpy", "utils.json_client", "components.stock_selector") + DEFERRED_MODULES
+
+_timings: Dict[str, float] = {}
+_timings_lock = threading.Lock()
+_warm_up_thread: Optional[threading.Thread] = None
+_warm_up_done = threading.Event()
+
+
+def record_timing(name: str, elapsed_ms: float):
+    """시작 단계 소요 시간 기록 (ms)"""
+    with _timings_lock:
+        _timings[name] = round(elapsed_ms, 1)
+
+
+def _warm_up(modules: tuple):
+    """지연 모듈을 순서대로 import하고 첫 Figure 생성 비용까지 미리 지불"""
+    start = time.perf_counter()
+    for name in modules:
+        module_start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logger.warning(f"모듈 미리 로드 실패: {name}, {e}")
+            continue
+        record_timing(f"import {name}", (time.perf_counter() - module_start) * 1000)
+
+    # plotly는 trace 클래스/검증기를 처음 사용할 때 로드하므로 빈 Figure를 한 번 생성
+    try:
+        figure_start = time.perf_counter()
+        import plotly.graph_objects as go
+        go.Figure(data=[go.Candlestick(), go.Scatter(), go.Scattergl()])
+        record_timing("first figure", (time.perf_counter() - figure_start) * 1000)
+    except Exception as e:
+        logger.warning(f"Figure 미리 생성 실패: {e}")
+
+    record_timing("warm-up total", (time.perf_counter() - start) * 1000)
+    _warm_up_done.set()
+    logger.info(f"🚀 지연 모듈 미리 로드 완료: {_timings['warm-up total']}ms")
+
+
+def start_warm_up(modules: tuple = DEFERRED_MODULES) -> threading.Thread:
+    """백그라운드 미리 로드 시작 (프로세스당 한 번)"""
+    global _warm_up_thread
+    with _timings_lock:
+        if _warm_up_thread is None:
+            _warm_up_thread = threading.Thread(target=_warm_up, args=(modules,), name="import-warm-up", daemon=True)
+            _warm_up_thread.start()
+        return _warm_up_thread
+
+
+def get_startup_report() -> Dict[str, object]:
+    """기록된 시작 단계 소요 시간 {'timings': {...}, 'warm_up_done': bool}"""
+    with _timings_lock:
+        timings = dict(_timings)
+    return {'timings': timings, 'warm_up_done': _warm_up_done.is_set()}
+
+
+def measure_cold_imports(modules: List[str]) -> Dict[str, float]:
+    """
+    모듈별 콜드 import 시간 측정 (모듈마다 새 인터프리터)
+
+    Returns:
+        {모듈: ms} - 측정 실패 시 값은 -1
+    """
+    results = {}
+    code = (
+        "import sys, time; sys.path.insert(0, {root!r}); "
+        "t = time.perf_counter(); import {name}; print((time.perf_counter() - t) * 1000)"
+    )
+    for name in modules:
+        try:
+            output = subprocess.run(
+                [sys.executable, "-c", code.format(root=parent_dir, name=name)],
+                capture_output=True, text=True, check=True, cwd=parent_dir
+            ).stdout.strip().splitlines()
+            results[name] = round(float(output[-1]), 1)
+        except Exception as e:
+            logger.error(f"import 시간 측정 실패: {name}, {e}")
+            results[name] = -1
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 모듈별 콜드 import 시간 측정")
+    parser.add_argument("--modules", nargs="+", default=list(MEASURED_MODULES), help="측정할 모듈")
+    args = parser.parse_args(argv)
+
+    results = measure_cold_imports(args.modules)
+    print(f"{'module':<28} {'cold import ms':>15}")
+    for name, elapsed_ms in results.items():
+        marker = "  (deferred)" if name in DEFERRED_MODULES else ""
+        print(f"{name:<28} {elapsed_ms:>15.1f}{marker}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""
+추세선 검출 - 피벗 고점/저점에서 지지선·저항선을 찾아 차트 trendlines 형식으로 반환
+
+1. 피벗: 앞뒤 pivot_window봉 중 가장 높은(낮은) 봉 (sliding_window_view argmax/argmin, O(n·w))
+2. 후보 선: 피벗 저점의 아래쪽 볼록 껍질(지지), 피벗 고점의 위쪽 볼록 껍질(저항) 변
+   - 볼록 껍질의 변은 모든 피벗이 한쪽에 있는 선이므로 모든 점 쌍을 비교할 필요가 없음
+   - 전체/최근 1/2/최근 1/4 구간에서 각각 껍질을 구해 장기·단기 추세선을 함께 후보로 둠
+3. 선택: 선 근처(허용 오차: 봉 범위 중앙값의 절반)에 닿은 피벗 수가 많고 최근일수록 우선,
+   선 이후 종가가 허용 오차 넘게 이탈한(깨진) 선과 연장한 끝점이 차트 가격 범위 밖인 선은 제외
+
+결과는 (종목, 기간, 시간축, 데이터 버전)별로 프로세스 캐시와 영구 디스크 캐시(utils.disk_cache)에
+저장되며, 데이터 배포 후 미리 계산해 두면 요청 경로에서는 조회만 합니다.
+
+사용법 (데이터 배포 직후 실행):
+    python -m utils.trendlines                      # 전체 종목 기본 기간(3y) × 일/주/월봉
+    python -m utils.trendlines --symbols AAPL ^KS11
+"""
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# 프로젝트 루트를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.disk_cache import get_disk_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = os.path.join(parent_dir, "data")
+
+# 알고리즘이 바뀌면 올려서 캐시된 결과를 무효화
+TRENDLINE_VERSION = 1
+
+# 시간축별 피벗 판정 폭 (앞뒤 봉 수)
+PIVOT_WINDOWS = {'daily': 5, 'weekly': 3, 'monthly': 2}
+
+# 후보 선을 구할 구간 (전체 길이 대비 최근 비율)
+LOOKBACK_FRACTIONS = (1.0, 0.5, 0.25)
+
+# 종류별 표시할 최대 선 수
+MAX_LINES_PER_SIDE = 1
+
+TRENDLINE_STYLES = {
+    'support': {'name': 'Support', 'color': '#2E8B57'},
+    'resistance': {'name': 'Resistance', 'color': '#B22222'},
+}
+
+_CACHE_SIZE = 512
+
+_trendline_cache: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def find_pivots(values: np.ndarray, window: int, kind: str) -> np.ndarray:
+    """
+    피벗 인덱스 - 앞뒤 window봉 안에서 처음 나타나는 최고값(high)/최저값(low)
+
+    Args:
+        values: 고가(kind='high') 또는 저가(kind='low') 배열
+        window: 앞뒤 봉 수
+    """
+    if len(values) < 2 * window + 1:
+        return np.empty(0, dtype=np.int64)
+    windows = sliding_window_view(values, 2 * window + 1)
+    centre = windows.argmax(axis=1) if kind == 'high' else windows.argmin(axis=1)
+    return np.flatnonzero(centre == window) + window
+
+
+def _cross(o: Tuple[float, float], a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def hull_edges(x: np.ndarray, y: np.ndarray, side: str) -> List[Tuple[int, int]]:
+    """
+    x로 정렬된 점들의 아래쪽(side='lower')/위쪽('upper') 볼록 껍질 변 - 단조 체인, O(k)
+
+    Returns:
+        [(점 i, 점 j), ...] (점 배열 위치, i < j)
+    """
+    hull: List[int] = []
+    sign = 1 if side == 'lower' else -1
+    for index in range(len(x)):
+        point = (x[index], y[index])
+        while len(hull) >= 2 and sign * _cross((x[hull[-2]], y[hull[-2]]), (x[hull[-1]], y[hull[-1]]), point) <= 0:
+            hull.pop()
+        hull.append(index)
+    return list(zip(hull[:-1], hull[1:]))
+
+
+def _best_lines(pivots: np.ndarray, prices: np.ndarray, close: np.ndarray, tolerance: float,
+                side: str, price_range: Tuple[float, float]) -> List[Dict[str, Any]]:
+    """볼록 껍질 변 중 깨지지 않고 끝점이 가격 범위 안인 선을 닿은 피벗 수/최근 순으로 정렬"""
+    n = len(close)
+    pivot_prices = prices[pivots]
+    candidates = {}
+    for fraction in LOOKBACK_FRACTIONS:
+        start = n - int(n * fraction)
+        mask = pivots >= start
+        if mask.sum() < 2:
+            continue
+        offset = int(np.argmax(mask))
+        hull_side = 'lower' if side == 'support' else 'upper'
+        for i, j in hull_edges(pivots[mask].astype(np.float64), pivot_prices[mask], hull_side):
+            candidates[(offset + i, offset + j)] = True
+
+    lines = []
+    bars = np.arange(n)
+    for i, j in candidates:
+        x0, x1 = pivots[i], pivots[j]
+        slope = (pivot_prices[j] - pivot_prices[i]) / (x1 - x0)
+        intercept = pivot_prices[i] - slope * x0
+
+        # 선 이후 종가가 허용 오차 넘게 반대편으로 넘어갔으면 깨진 선
+        after = bars[x1 + 1:]
+        line_after = slope * after + intercept
+        breach = (close[x1 + 1:] < line_after - tolerance) if side == 'support' \
+            else (close[x1 + 1:] > line_after + tolerance)
+        if breach.any():
+            continue
+        # 마지막 봉까지 연장한 끝점이 차트 가격 범위를 벗어나면 y축이 늘어나므로 제외
+        end_price = slope * (n - 1) + intercept
+        if not price_range[0] <= end_price <= price_range[1]:
+            continue
+
+        touches = int(np.sum(np.abs(pivot_prices[i:] - (slope * pivots[i:] + intercept)) <= tolerance))
+        lines.append({'start': int(x0), 'end': int(x1), 'slope': float(slope), 'intercept': float(intercept),
+                      'touches': touches})
+
+    lines.sort(key=lambda line: (line['touches'], line['end'], line['end'] - line['start']), reverse=True)
+    return lines
+
+
+def detect_trendlines(dates: Sequence, high: Sequence[float], low: Sequence[float], close: Sequence[float],
+                      pivot_window: int = 5, max_lines: int = MAX_LINES_PER_SIDE) -> List[Dict[str, Any]]:
+    """
+    지지선/저항선 검출
+
+    Args:
+        dates: 봉 날짜 ('YYYY-MM-DD' 문자열 또는 datetime64)
+        high, low, close: 가격 배열
+        pivot_window: 피벗 판정 폭 (앞뒤 봉 수)
+        max_lines: 종류별 최대 선 수
+
+    Returns:
+        차트 trendlines 형식 [{'name', 'color', 'kind', 'touches', 'points': [{'date', 'price'}, ...]}, ...]
+        (선은 첫 피벗에서 시작해 마지막 봉까지 연장)
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+    if n < 2 * pivot_window + 2:
+        return []
+    date_strings = np.datetime_as_string(np.asarray(dates, dtype='datetime64[D]'), unit='D')
+    tolerance = 0.5 * float(np.median(high - low))
+    price_range = (float(low.min()), float(high.max()))
+
+    trendlines = []
+    for side, prices, kind in (('support', low, 'low'), ('resistance', high, 'high')):
+        pivots = find_pivots(prices, pivot_window, kind)
+        if len(pivots) < 2:
+            continue
+        for line in _best_lines(pivots, prices, close, tolerance, side, price_range)[:max_lines]:
+            end_price = line['slope'] * (n - 1) + line['intercept']
+            trendlines.append(dict(
+                TRENDLINE_STYLES[side],
+                kind=side,
+                touches=line['touches'],
+                points=[
+                    {'date': str(date_strings[line['start']]), 'price': round(float(prices[line['start']]), 4)},
+                    {'date': str(date_strings[n - 1]), 'price': round(float(end_price), 4)}
+                ]
+            ))
+    return trendlines
+
+
+def get_trendlines(symbol: str, period: str, timeframe: str, version: Optional[str],
+                   inputs: Dict[str, Sequence]) -> List[Dict[str, Any]]:
+    """
+    캐시된 추세선 조회 (프로세스 캐시 → 디스크 캐시 → 계산)
+
+    Args:
+        inputs: {'dates', 'high', 'low', 'close'} - 차트에 표시하는 구간의 봉
+    """
+    try:
+        key = (symbol, period, timeframe, version, TRENDLINE_VERSION)
+        with _cache_lock:
+            if key in _trendline_cache:
+                _trendline_cache.move_to_end(key)
+                return _trendline_cache[key]
+
+        cache = get_disk_cache() if version is not None else None
+        trendlines = cache.get_json('trendlines', key) if cache is not None else None
+        if trendlines is None:
+            trendlines = detect_trendlines(inputs['dates'], inputs['high'], inputs['low'], inputs['close'],
+                                           PIVOT_WINDOWS.get(timeframe, 5))
+            if cache is not None:
+                cache.put_json('trendlines', key, trendlines)
+
+        with _cache_lock:
+            _trendline_cache[key] = trendlines
+            while len(_trendline_cache) > _CACHE_SIZE:
+                _trendline_cache.popitem(last=False)
+        return trendlines
+    except Exception as e:
+        logger.error(f"추세선 계산 실패: {symbol} {timeframe}, {e}")
+        return []
+
+
+def run_precompute(data_dir: str, symbols: Optional[List[str]] = None, period: Optional[str] = None) -> Dict[str, Any]:
+    """
+    전체(또는 지정) 종목의 기본 기간 추세선을 미리 계산하여 디스크 캐시에 저장
+
+    Returns:
+        실행 요약 {'symbols', 'lines', 'failed', 'elapsed_s'}
+    """
+    from utils.chart_core import DEFAULT_PERIOD, build_chart_view
+    from utils.json_client import get_shared_client
+
+    client = get_shared_client(data_dir)
+    symbols = symbols or sorted(set(client.get_available_symbols()))
+    period = period or DEFAULT_PERIOD
+    lines, failed = 0, {}
+    start = time.perf_counter()
+    for symbol in symbols:
+        for timeframe in PIVOT_WINDOWS:
+            view = build_chart_view(client, symbol, period, timeframe)
+            if view.get('error'):
+                failed[symbol] = view['error']
+                break
+            lines += len(view.get('trendlines') or [])
+    return {'symbols': len(symbols) - len(failed), 'lines': lines, 'failed': failed,
+            'elapsed_s': round(time.perf_counter() - start, 2)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="InvestSmart 추세선 사전 계산")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="신호 데이터 폴더")
+    parser.add_argument("--symbols", nargs="*", help="대상 종목 (기본: 전체)")
+    parser.add_argument("--period", default=None, help="조회 기간 (기본: 앱 기본 기간)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    summary = run_precompute(os.path.abspath(args.data_dir), args.symbols, args.period)
+    print(f"추세선 계산 완료: {summary['symbols']}개 종목, {summary['lines']}개 선, "
+          f"실패 {len(summary['failed'])}개, {summary['elapsed_s']}s")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())